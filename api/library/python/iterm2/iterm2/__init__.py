@@ -3,14 +3,22 @@ The iTerm2 module provides a Python interface for controlling iTerm2.
 """
 from iterm2.app import async_get_app, CreateWindowException, App
 
+from iterm2.archive import ScrollbackArchiver, SessionArchive, ArchiveBlock
+
 from iterm2.arrangement import SavedArrangementException, Arrangement
 
 from iterm2.broadcast import BroadcastDomain, async_set_broadcast_domains
 
+from iterm2.broker import NotificationBroker, BrokerConnection
+
 from iterm2.color import Color
 
 from iterm2.colorpresets import ColorPreset, ListPresetsException, GetPresetException
 
+from iterm2.dynamicprofiles import DynamicProfileGenerator, DynamicProfilesWriteResult, InvalidDynamicProfileException
+
+from iterm2.eventlog import NotificationLogger, EventLogWriter, EventLogReader, LoggedEvent
+
 from iterm2.focus import FocusMonitor,  FocusUpdateApplicationActive, FocusUpdateWindowChanged, FocusUpdateSelectedTabChanged, FocusUpdateActiveSessionChanged, FocusUpdate, FocusMonitor
 
 from iterm2.mainmenu import MenuItemState, MainMenu, MenuItemException
@@ -23,9 +31,23 @@ from iterm2.preferences import PreferenceKeys, async_get_preference
 
 from iterm2.profile import Profile, PartialProfile, BadGUIDException, LocalWriteOnlyProfile
 
+from iterm2.profilecache import ProfileCache, async_get_profile_cache
+
+from iterm2.profilediff import ProfileApplyResult, diff_profile, async_apply_profile
+
+from iterm2.profileindex import ProfileIndex
+
+from iterm2.promptindex import PromptIndex, CommandRecord, async_get_prompt_index
+
+from iterm2.rate import OutputRateMonitor, SlidingWindowCounter
+
+from iterm2.recorder import SessionRecorder, SessionRecording, RecordedFrame
+
 from iterm2.registration import Registration
 
-from iterm2.screen import ScreenStreamer, LineContents, ScreenContents
+from iterm2.screen import ScreenStreamer, LineContents, ScreenContents, CellStyles
+
+from iterm2.screendiff import ScreenDiffer, ScreenDiff, LineEdit, diff_screen_contents
 
 from iterm2.selection import SelectionMode, SubSelection, Selection
 
@@ -35,8 +57,14 @@ from iterm2.statusbar import StatusBarComponent, CheckboxKnob, StringKnob, Posit
 
 from iterm2.transaction import Transaction
 
+from iterm2.trigger import TriggerEngine, Trigger, TriggerMatch, PatternSet
+
 from iterm2.tab import Tab
 
+from iterm2.textindex import ScrollbackIndex
+
+from iterm2.timer import TimerWheel, QuietMonitor, get_timer_wheel
+
 from iterm2.tmux import TmuxException, TmuxConnection, async_get_tmux_connections, async_get_tmux_connection_by_connection_id
 
 from iterm2.tool import async_register_web_view_tool
@@ -0,0 +1,434 @@
+"""Archives the scrollback history of every session to compressed files.
+
+Each session gets a directory, named after its session ID, holding:
+
+* `segment-N.z`: blocks of text, each compressed separately with zlib. A
+  block holds whole lines, soft-wrapped rows joined, each followed by a
+  newline. A new segment is started when the current one exceeds its size
+  limit.
+* `index`: one record per block, all little-endian: int64 absolute line
+  number of the block's first row, uint32 number of rows, uint32 segment
+  number, uint64 offset of the block in the segment, and uint32 compressed
+  length.
+
+Only lines that have scrolled off the screen into history are archived,
+because lines on the screen may still change. Each run fetches only lines
+after the last archived one, so running it periodically appends just the
+new output. The index is the record of what has been archived: a block is
+added to it only after its data is on disk, and data left behind by an
+interrupted run is discarded when the archive is reopened.
+
+To archive all sessions every minute, run:
+
+  .. code-block:: bash
+
+      python3 -m iterm2.archive run ~/iterm2-archive --interval 60
+
+To print a session's archived text, run:
+
+  .. code-block:: bash
+
+      python3 -m iterm2.archive cat ~/iterm2-archive 1234ABCD-5678-90EF-1234-567890ABCDEF
+"""
+import argparse
+import asyncio
+import os
+import re
+import struct
+import sys
+import zlib
+
+import iterm2.app
+
+_RECORD = struct.Struct("<qIIQI")
+_SEGMENT_PATTERN = re.compile(r"^segment-(\d+)\.z$")
+
+class ArchiveBlock:
+    """Describes a block of archived lines."""
+    def __init__(self, first_line, number_of_rows, segment, offset, length):
+        self.__first_line = first_line
+        self.__number_of_rows = number_of_rows
+        self.__segment = segment
+        self.__offset = offset
+        self.__length = length
+
+    def __repr__(self):
+        return "<ArchiveBlock lines [{}, {}) in segment {}>".format(
+            self.__first_line, self.end_line, self.__segment)
+
+    @property
+    def first_line(self):
+        """:returns: The absolute line number of the block's first row."""
+        return self.__first_line
+
+    @property
+    def number_of_rows(self):
+        """:returns: The number of screen rows the block covers, including rows lost to overflow within it."""
+        return self.__number_of_rows
+
+    @property
+    def end_line(self):
+        """:returns: The line number after the block's last row."""
+        return self.__first_line + self.__number_of_rows
+
+    @property
+    def segment(self):
+        """:returns: The number of the segment file holding the block."""
+        return self.__segment
+
+    @property
+    def offset(self):
+        """:returns: The offset of the compressed block in its segment file."""
+        return self.__offset
+
+    @property
+    def length(self):
+        """:returns: The length of the compressed block."""
+        return self.__length
+
+class SessionArchive:
+    """The archive of one session.
+
+    Opening an archive for writing discards anything left incomplete by an
+    interrupted write. Opening it read-only changes nothing on disk, so it is
+    safe while another process is writing. Only blocks in the index when it
+    was opened are read.
+
+    :param path: The session's directory. It is created if needed, unless read-only.
+    :param segment_bytes: Start a new segment file once the current one is at least this large.
+    :param read_only: If True, the archive can only be read.
+
+    :throws: FileNotFoundError if read-only and there is no archive at `path`.
+    """
+    def __init__(self, path, segment_bytes=16 * 1024 * 1024, read_only=False):
+        self.__path = path
+        self.__segment_bytes = segment_bytes
+        self.__read_only = read_only
+        self.__index = None
+        self.__data = None
+        self.__blocks = []
+        index_path = os.path.join(path, "index")
+        if read_only:
+            if not os.path.isdir(path):
+                raise FileNotFoundError("No archive at {}".format(path))
+        else:
+            os.makedirs(path, exist_ok=True)
+        if os.path.exists(index_path):
+            with open(index_path, "rb") as f:
+                data = f.read()
+            # A record still being written is ignored.
+            for i in range(len(data) // _RECORD.size):
+                self.__blocks.append(ArchiveBlock(*_RECORD.unpack_from(data, i * _RECORD.size)))
+        if read_only:
+            return
+
+        with open(index_path, "ab") as f:
+            f.truncate(len(self.__blocks) * _RECORD.size)
+
+        # Drop data written after the last indexed block.
+        if self.__blocks:
+            last = self.__blocks[-1]
+            self.__segment = last.segment
+            self.__segment_size = last.offset + last.length
+        else:
+            self.__segment = 0
+            self.__segment_size = 0
+        for name in os.listdir(path):
+            match = _SEGMENT_PATTERN.match(name)
+            if match and int(match.group(1)) > self.__segment:
+                os.remove(os.path.join(path, name))
+        with open(self._segment_path(self.__segment), "ab") as f:
+            f.truncate(self.__segment_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, _tb):
+        self.close()
+
+    def _segment_path(self, segment):
+        return os.path.join(self.__path, "segment-{}.z".format(segment))
+
+    @property
+    def blocks(self):
+        """:returns: A list of :class:`ArchiveBlock`, oldest first."""
+        return list(self.__blocks)
+
+    @property
+    def next_line(self):
+        """:returns: The line number after the last archived row, or None if nothing has been archived."""
+        if not self.__blocks:
+            return None
+        return self.__blocks[-1].end_line
+
+    def append(self, first_line, number_of_rows, lines):
+        """Compresses lines into a new block and adds it to the archive.
+
+        :param first_line: The absolute line number of the first row.
+        :param number_of_rows: The number of rows the lines occupy.
+        :param lines: A list of strings, one per line, without newlines.
+
+        :throws: ValueError if the archive was opened read-only.
+        """
+        if self.__read_only:
+            raise ValueError("Archive {} is open read-only".format(self.__path))
+        if self.__segment_size >= self.__segment_bytes:
+            if self.__data is not None:
+                self.__data.close()
+                self.__data = None
+            self.__segment += 1
+            self.__segment_size = 0
+        if self.__data is None:
+            self.__data = open(self._segment_path(self.__segment), "ab")
+        if self.__index is None:
+            self.__index = open(os.path.join(self.__path, "index"), "ab")
+
+        compressed = zlib.compress("".join(line + "\n" for line in lines).encode("utf-8"))
+        block = ArchiveBlock(first_line, number_of_rows, self.__segment, self.__segment_size, len(compressed))
+        # The data must be durable before the index refers to it.
+        self.__data.write(compressed)
+        self.__data.flush()
+        os.fsync(self.__data.fileno())
+        self.__index.write(_RECORD.pack(
+            block.first_line, block.number_of_rows, block.segment, block.offset, block.length))
+        self.__index.flush()
+        os.fsync(self.__index.fileno())
+        self.__segment_size += len(compressed)
+        self.__blocks.append(block)
+
+    def read_block(self, block):
+        """:returns: The lines of a block as a list of strings without newlines."""
+        with open(self._segment_path(block.segment), "rb") as f:
+            f.seek(block.offset)
+            text = zlib.decompress(f.read(block.length)).decode("utf-8")
+        return text.split("\n")[:-1]
+
+    def lines(self, start=None):
+        """Reads archived lines.
+
+        :param start: Begin with the block containing this line number, or None to begin with the oldest block.
+
+        :returns: An iterator of strings, one per line, without newlines.
+        """
+        for block in self.__blocks:
+            if start is not None and block.end_line <= start:
+                continue
+            for line in self.read_block(block):
+                yield line
+
+    def close(self):
+        """Closes open files."""
+        for f in (self.__data, self.__index):
+            if f is not None:
+                f.close()
+        self.__data = None
+        self.__index = None
+
+class ScrollbackArchiver:
+    """Archives the history of all sessions, including buried ones.
+
+    Each call to :meth:`async_archive` appends the lines each session has
+    added to its history since the last call, or since the last run of a
+    previous process using the same directory.
+
+    :param connection: The :class:`iterm2.Connection` to use.
+    :param path: The directory holding the archive. It is created if needed.
+    :param concurrency: The maximum number of sessions to archive at once.
+    :param chunk_lines: The maximum number of lines to fetch in one request. Each chunk is stored as one block.
+    :param segment_bytes: Start a new segment file for a session once its current one is at least this large.
+
+    Example:
+
+      .. code-block:: python
+
+          archiver = iterm2.ScrollbackArchiver(connection, os.path.expanduser("~/iterm2-archive"))
+          while True:
+              await archiver.async_archive()
+              await asyncio.sleep(60)
+    """
+    def __init__(self, connection, path, concurrency=4, chunk_lines=1000, segment_bytes=16 * 1024 * 1024):
+        self.__connection = connection
+        self.__path = path
+        self.__concurrency = concurrency
+        self.__chunk_lines = chunk_lines
+        self.__segment_bytes = segment_bytes
+        self.__archives = {}
+        os.makedirs(path, exist_ok=True)
+
+    def get_session_archive(self, session_id):
+        """:returns: The :class:`SessionArchive` for a session, which may be empty."""
+        archive = self.__archives.get(session_id)
+        if archive is None:
+            archive = SessionArchive(os.path.join(self.__path, session_id), self.__segment_bytes)
+            self.__archives[session_id] = archive
+        return archive
+
+    async def async_archive(self, app=None):
+        """Archives new history in every session.
+
+        :param app: The :class:`iterm2.App` whose sessions to archive, or None to fetch the current list of sessions.
+
+        :returns: A dict from session ID to the number of lines archived, or
+          to the exception raised while archiving that session. A failure in
+          one session does not stop the others.
+        """
+        if app is None:
+            app = await iterm2.app.async_get_app(self.__connection)
+        sessions = []
+        for window in app.terminal_windows:
+            for tab in window.tabs:
+                sessions.extend(tab.sessions)
+        sessions.extend(app.buried_sessions)
+
+        # Forget sessions that have ended. Their archives stay on disk.
+        session_ids = {session.session_id for session in sessions}
+        for session_id in list(self.__archives.keys()):
+            if session_id not in session_ids:
+                self.__archives.pop(session_id).close()
+
+        semaphore = asyncio.Semaphore(self.__concurrency)
+
+        async def async_archive_one(session):
+            async with semaphore:
+                return await self.async_archive_session(session)
+
+        results = await asyncio.gather(
+            *[async_archive_one(session) for session in sessions],
+            return_exceptions=True)
+        return {session.session_id: result for session, result in zip(sessions, results)}
+
+    async def async_archive_session(self, session):
+        """Archives new history in one session.
+
+        :param session: The :class:`iterm2.Session` to archive.
+
+        :returns: The number of lines archived.
+
+        :throws: :class:`iterm2.rpc.RPCException` if something goes wrong.
+        """
+        archive = self.get_session_archive(session.session_id)
+        try:
+            return await self._async_archive_session(session, archive)
+        finally:
+            # Don't hold two descriptors per session between runs.
+            archive.close()
+
+    async def _async_archive_session(self, session, archive):
+        loop = asyncio.get_event_loop()
+
+        async def async_append(first_line, number_of_rows, lines):
+            # Compressing and fsyncing would block the event loop.
+            await loop.run_in_executor(None, archive.append, first_line, number_of_rows, lines)
+
+        grid, history, overflow, _first_visible = await session.async_get_line_info()
+        end = overflow + history
+        start = archive.next_line
+        if start is None or start > end + grid:
+            # Nothing archived yet, or the session's contents were cleared.
+            start = overflow
+
+        count = 0
+        block_first = None
+        block_rows = 0
+        block_lines = []
+        rows = []
+        expected = None
+        async for y, line in session.async_iter_lines(start, end, self.__chunk_lines):
+            if expected is not None and y != expected:
+                # Lines were lost from the head of history while reading.
+                if rows:
+                    block_lines.append("".join(rows))
+                    block_rows = expected - block_first
+                    rows = []
+                if block_lines:
+                    await async_append(block_first, block_rows, block_lines)
+                    count += len(block_lines)
+                block_first = None
+                block_rows = 0
+                block_lines = []
+            if block_first is None:
+                block_first = y
+            expected = y + 1
+            rows.append(line.string)
+            if not line.hard_eol:
+                continue
+            block_lines.append("".join(rows))
+            block_rows = y + 1 - block_first
+            rows = []
+            if block_rows >= self.__chunk_lines:
+                await async_append(block_first, block_rows, block_lines)
+                count += len(block_lines)
+                block_first = None
+                block_rows = 0
+                block_lines = []
+        # A wrapped line that continues onto the screen is archived next time.
+        if block_lines:
+            await async_append(block_first, block_rows, block_lines)
+            count += len(block_lines)
+        return count
+
+    async def async_run_forever(self, interval=60):
+        """Archives all sessions every `interval` seconds until cancelled.
+
+        :param interval: Seconds between runs.
+        """
+        while True:
+            await self.async_archive()
+            await asyncio.sleep(interval)
+
+    def close(self):
+        """Closes open files."""
+        for archive in self.__archives.values():
+            archive.close()
+        self.__archives = {}
+
+def _run(args):
+    import iterm2.connection
+
+    async def async_main(connection):
+        archiver = ScrollbackArchiver(connection, args.path, concurrency=args.concurrency)
+        try:
+            if args.interval is None:
+                await archiver.async_archive()
+            else:
+                await archiver.async_run_forever(args.interval)
+        finally:
+            archiver.close()
+
+    iterm2.connection.run_until_complete(async_main)
+
+def _cat(args):
+    try:
+        archive = SessionArchive(os.path.join(args.path, args.session), read_only=True)
+    except FileNotFoundError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+    with archive:
+        for line in archive.lines(args.start):
+            print(line)
+
+def main():
+    """Command-line interface to archive sessions and read archives."""
+    parser = argparse.ArgumentParser(description="Archives the scrollback history of iTerm2 sessions.")
+    subparsers = parser.add_subparsers(dest="command")
+
+    run_parser = subparsers.add_parser("run", help="Archive new history in all sessions")
+    run_parser.add_argument("path", help="Archive directory")
+    run_parser.add_argument("--interval", type=float, help="Keep running, archiving every this many seconds")
+    run_parser.add_argument("--concurrency", type=int, default=4, help="Sessions to archive at once")
+    run_parser.set_defaults(func=_run)
+
+    cat_parser = subparsers.add_parser("cat", help="Print a session's archived lines")
+    cat_parser.add_argument("path", help="Archive directory")
+    cat_parser.add_argument("session", help="Session ID")
+    cat_parser.add_argument("--start", type=int, help="Begin with the block containing this line number")
+    cat_parser.set_defaults(func=_cat)
+
+    args = parser.parse_args()
+    if not hasattr(args, "func"):
+        parser.print_help()
+        sys.exit(1)
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,454 @@
+"""Shares one set of notification subscriptions among many local scripts.
+
+Every script that subscribes to a notification causes iTerm2 to post it once
+per subscriber. When many scripts (for example, several AutoLaunch scripts)
+watch the same focus, layout, and new-session notifications, the cost is
+multiplied by the number of scripts.
+
+A :class:`NotificationBroker` runs in one process and holds a single upstream
+subscription per notification type. It listens on a Unix domain socket and
+republishes notifications to any number of local clients, each of which has
+its own filters and a bounded buffer.
+
+Clients use a :class:`BrokerConnection` in place of a
+:class:`iterm2.Connection`. Messages on the socket are the same protocol
+buffers iTerm2 sends over its websocket, so the existing subscribe functions
+in :mod:`iterm2.notifications` work unchanged. Requests other than
+notification subscriptions are forwarded to iTerm2.
+
+Run the broker with:
+
+  .. code-block:: bash
+
+      python3 -m iterm2.broker
+
+Clients look like ordinary scripts:
+
+  .. code-block:: python
+
+      async def main(connection):
+          async def on_focus(connection, notification):
+              print(notification)
+          await iterm2.notifications.async_subscribe_to_focus_change_notification(connection, on_focus)
+
+      iterm2.broker.run_forever(main)
+"""
+import argparse
+import asyncio
+import collections
+import os
+import struct
+import sys
+import traceback
+
+import iterm2.api_pb2
+import iterm2.connection
+import iterm2.notifications
+import iterm2.rpc
+
+# Maps notification types the broker can share to the name of the field in
+# iterm2.api_pb2.Notification that carries them.
+_NOTIFICATION_FIELDS = {
+    iterm2.api_pb2.NOTIFY_ON_KEYSTROKE: "keystroke_notification",
+    iterm2.api_pb2.NOTIFY_ON_SCREEN_UPDATE: "screen_update_notification",
+    iterm2.api_pb2.NOTIFY_ON_PROMPT: "prompt_notification",
+    iterm2.api_pb2.NOTIFY_ON_LOCATION_CHANGE: "location_change_notification",
+    iterm2.api_pb2.NOTIFY_ON_CUSTOM_ESCAPE_SEQUENCE: "custom_escape_sequence_notification",
+    iterm2.api_pb2.NOTIFY_ON_NEW_SESSION: "new_session_notification",
+    iterm2.api_pb2.NOTIFY_ON_TERMINATE_SESSION: "terminate_session_notification",
+    iterm2.api_pb2.NOTIFY_ON_LAYOUT_CHANGE: "layout_changed_notification",
+    iterm2.api_pb2.NOTIFY_ON_FOCUS_CHANGE: "focus_changed_notification",
+    iterm2.api_pb2.NOTIFY_ON_BROADCAST_CHANGE: "broadcast_domains_changed" }
+
+# Notification types whose notifications carry a session ID that clients may filter on.
+_SESSION_NOTIFICATIONS = {
+    iterm2.api_pb2.NOTIFY_ON_KEYSTROKE,
+    iterm2.api_pb2.NOTIFY_ON_SCREEN_UPDATE,
+    iterm2.api_pb2.NOTIFY_ON_PROMPT,
+    iterm2.api_pb2.NOTIFY_ON_LOCATION_CHANGE,
+    iterm2.api_pb2.NOTIFY_ON_CUSTOM_ESCAPE_SEQUENCE }
+
+_HEADER = struct.Struct("!I")
+
+def default_socket_path():
+    """Returns the path of the broker's socket.
+
+    This is the value of the `ITERM2_BROKER_SOCKET` environment variable if it
+    is set, or a per-user path in the temporary directory otherwise."""
+    path = iterm2.connection._getenv("ITERM2_BROKER_SOCKET")
+    if path is not None:
+        return path
+    return "/tmp/iterm2-notification-broker-{}.socket".format(os.getuid())
+
+class _FramedStream:
+    """Sends and receives length-prefixed messages over a stream.
+
+    Provides the `send` and `recv` methods that :class:`iterm2.Connection`
+    expects of its websocket. Many requests may be sent at once, but only
+    one task writes to the stream: before Python 3.10, concurrent calls to
+    `StreamWriter.drain` fail when the stream is backed up."""
+    def __init__(self, reader, writer):
+        self.__reader = reader
+        self.__writer = writer
+        # (framed message, future) for messages not yet written.
+        self.__outgoing = collections.deque()
+        self.__write_task = None
+
+    async def send(self, data):
+        future = asyncio.get_event_loop().create_future()
+        self.__outgoing.append((_HEADER.pack(len(data)) + data, future))
+        if self.__write_task is None:
+            self.__write_task = asyncio.ensure_future(self._async_write_outgoing())
+        await future
+
+    async def _async_write_outgoing(self):
+        """Writes queued messages until none are left.
+
+        This is the only coroutine that writes to the stream."""
+        try:
+            while self.__outgoing:
+                data, future = self.__outgoing.popleft()
+                try:
+                    self.__writer.write(data)
+                    await self.__writer.drain()
+                except Exception as e:
+                    self._fail_outgoing(future, e)
+                    return
+                if not future.done():
+                    future.set_result(None)
+        finally:
+            self.__write_task = None
+
+    def _fail_outgoing(self, future, exception):
+        """Fails a message being written and all those waiting behind it."""
+        futures = [future] + [pending for _data, pending in self.__outgoing]
+        self.__outgoing.clear()
+        for pending in futures:
+            if not pending.done():
+                pending.set_exception(exception)
+
+    async def recv(self):
+        header = await self.__reader.readexactly(_HEADER.size)
+        length, = _HEADER.unpack(header)
+        return await self.__reader.readexactly(length)
+
+    def close(self):
+        if self.__write_task is not None:
+            self.__write_task.cancel()
+            self.__write_task = None
+        for _data, future in self.__outgoing:
+            if not future.done():
+                future.set_exception(ConnectionResetError("Stream closed"))
+        self.__outgoing.clear()
+        self.__writer.close()
+
+class _BrokerClient:
+    """The broker's view of one connected client."""
+    def __init__(self, stream, max_queue_size):
+        self.stream = stream
+        # notification type -> set of session IDs. None in the set means all sessions.
+        self.filters = {}
+        self.queue = collections.deque(maxlen=max_queue_size)
+        # Responses to the client's requests. These are never dropped.
+        self.responses = collections.deque()
+        self.dropped = 0
+        self.wakeup = asyncio.Event()
+
+    def wants(self, notification_type, session):
+        """Returns whether the client's filters accept a notification."""
+        sessions = self.filters.get(notification_type)
+        if not sessions:
+            return False
+        return None in sessions or session in sessions
+
+    def enqueue(self, data):
+        """Queues a serialized notification, dropping the oldest if the buffer is full."""
+        if len(self.queue) == self.queue.maxlen:
+            self.dropped += 1
+        self.queue.append(data)
+        self.wakeup.set()
+
+    def respond(self, response):
+        """Queues a response to one of the client's requests."""
+        self.responses.append(response.SerializeToString())
+        self.wakeup.set()
+
+    async def async_write_forever(self):
+        """Sends queued responses and notifications to the client until cancelled.
+
+        This is the only coroutine that writes to the client's stream."""
+        while True:
+            await self.wakeup.wait()
+            self.wakeup.clear()
+            while self.responses or self.queue:
+                if self.responses:
+                    await self.stream.send(self.responses.popleft())
+                else:
+                    await self.stream.send(self.queue.popleft())
+
+class NotificationBroker:
+    """Republishes iTerm2 notifications to clients connected over a Unix domain socket.
+
+    :param connection: A connected :class:`iterm2.Connection` to iTerm2.
+    :param path: The path of the socket to listen on, or None to use :func:`default_socket_path`.
+    :param max_queue_size: The number of notifications to buffer per client. When a client falls
+      further behind than this, its oldest undelivered notifications are dropped.
+    """
+    def __init__(self, connection, path=None, max_queue_size=1024):
+        self.__connection = connection
+        self.__path = path if path is not None else default_socket_path()
+        self.__max_queue_size = max_queue_size
+        self.__server = None
+        self.__clients = []
+        # notification type -> token returned by the upstream subscription.
+        self.__upstream = {}
+        self.__lock = asyncio.Lock()
+
+    @property
+    def path(self):
+        """:returns: The path of the socket the broker listens on."""
+        return self.__path
+
+    @property
+    def number_of_clients(self):
+        """:returns: The number of connected clients."""
+        return len(self.__clients)
+
+    @property
+    def upstream_notification_types(self):
+        """:returns: A list of the notification types currently subscribed to upstream."""
+        return list(self.__upstream.keys())
+
+    async def async_start(self):
+        """Begins accepting clients.
+
+        A stale socket file left by a previous broker is removed first."""
+        if os.path.exists(self.__path):
+            os.unlink(self.__path)
+        self.__server = await asyncio.start_unix_server(self._async_handle_client, path=self.__path)
+
+    async def async_stop(self):
+        """Disconnects all clients, stops listening, and cancels upstream subscriptions."""
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+            self.__server = None
+        for client in list(self.__clients):
+            client.stream.close()
+        async with self.__lock:
+            for notification_type in list(self.__upstream.keys()):
+                await self._async_unsubscribe_upstream(notification_type)
+        if os.path.exists(self.__path):
+            os.unlink(self.__path)
+
+    async def _async_handle_client(self, reader, writer):
+        client = _BrokerClient(_FramedStream(reader, writer), self.__max_queue_size)
+        self.__clients.append(client)
+        write_task = asyncio.ensure_future(client.async_write_forever())
+        try:
+            while True:
+                data = await client.stream.recv()
+                request = iterm2.api_pb2.ClientOriginatedMessage()
+                request.ParseFromString(data)
+                if request.HasField("notification_request"):
+                    response = await self._async_handle_notification_request(client, request)
+                    client.respond(response)
+                else:
+                    # Replies to forwarded requests may arrive out of order, so
+                    # don't hold up this client's other requests.
+                    asyncio.ensure_future(self._async_forward(client, request))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            write_task.cancel()
+            self.__clients.remove(client)
+            client.stream.close()
+            async with self.__lock:
+                for notification_type in list(client.filters.keys()):
+                    del client.filters[notification_type]
+                    await self._async_release_upstream(notification_type)
+
+    async def _async_forward(self, client, request):
+        """Sends a non-notification request to iTerm2 and relays the response.
+
+        If forwarding fails, the client gets an error response so it isn't
+        left waiting."""
+        try:
+            upstream_request = iterm2.api_pb2.ClientOriginatedMessage()
+            upstream_request.CopyFrom(request)
+            upstream_request.id = iterm2.rpc._alloc_id()
+            await self.__connection.async_send_message(upstream_request)
+            response = await self.__connection.async_dispatch_until_id(upstream_request.id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            traceback.print_exc()
+            response = iterm2.api_pb2.ServerOriginatedMessage()
+            response.error = "Broker failed to forward request: {}".format(e)
+        response.id = request.id
+        client.respond(response)
+
+    async def _async_handle_notification_request(self, client, request):
+        Status = iterm2.api_pb2.NotificationResponse.Status
+        notification_request = request.notification_request
+        notification_type = notification_request.notification_type
+
+        response = iterm2.api_pb2.ServerOriginatedMessage()
+        response.id = request.id
+        response.notification_response.SetInParent()
+
+        if (notification_type not in _NOTIFICATION_FIELDS or
+                notification_request.WhichOneof("arguments") is not None):
+            # RPCs, variable monitors, keystroke filters, and profile monitors
+            # need per-client state in iTerm2 and can't be shared.
+            response.notification_response.status = Status.Value("REQUEST_MALFORMED")
+            return response
+
+        session = None
+        if notification_type in _SESSION_NOTIFICATIONS:
+            session = notification_request.session or "all"
+            if session == "active":
+                response.notification_response.status = Status.Value("SESSION_NOT_FOUND")
+                return response
+            if session == "all":
+                session = None
+
+        async with self.__lock:
+            sessions = client.filters.get(notification_type, set())
+            if notification_request.subscribe:
+                if session in sessions:
+                    response.notification_response.status = Status.Value("ALREADY_SUBSCRIBED")
+                    return response
+                try:
+                    await self._async_retain_upstream(notification_type)
+                except iterm2.notifications.SubscriptionException as e:
+                    response.notification_response.status = Status.Value(str(e))
+                    return response
+                sessions.add(session)
+                client.filters[notification_type] = sessions
+            else:
+                if session not in sessions:
+                    response.notification_response.status = Status.Value("NOT_SUBSCRIBED")
+                    return response
+                sessions.remove(session)
+                if not sessions:
+                    del client.filters[notification_type]
+                    await self._async_release_upstream(notification_type)
+
+        response.notification_response.status = Status.Value("OK")
+        return response
+
+    async def _async_retain_upstream(self, notification_type):
+        """Subscribes upstream to notification_type if no client was subscribed to it yet.
+
+        Must be called with the lock held."""
+        if notification_type in self.__upstream:
+            return
+
+        async def async_callback(_connection, sub_notification):
+            self._publish(notification_type, sub_notification)
+
+        self.__upstream[notification_type] = await iterm2.notifications._async_subscribe(
+            self.__connection,
+            True,
+            notification_type,
+            async_callback,
+            session=None)
+
+    async def _async_release_upstream(self, notification_type):
+        """Unsubscribes upstream from notification_type if no client remains subscribed to it.
+
+        Must be called with the lock held."""
+        for client in self.__clients:
+            if notification_type in client.filters:
+                return
+        if notification_type in self.__upstream:
+            await self._async_unsubscribe_upstream(notification_type)
+
+    async def _async_unsubscribe_upstream(self, notification_type):
+        token = self.__upstream.pop(notification_type)
+        await iterm2.notifications.async_unsubscribe(self.__connection, token)
+
+    def _publish(self, notification_type, sub_notification):
+        """Queues a notification received from iTerm2 for each interested client."""
+        message = iterm2.api_pb2.ServerOriginatedMessage()
+        if isinstance(sub_notification, iterm2.api_pb2.Notification):
+            message.notification.CopyFrom(sub_notification)
+        else:
+            getattr(message.notification, _NOTIFICATION_FIELDS[notification_type]).CopyFrom(sub_notification)
+
+        if notification_type in _SESSION_NOTIFICATIONS:
+            session = sub_notification.session
+        else:
+            session = None
+
+        data = None
+        for client in self.__clients:
+            if client.wants(notification_type, session):
+                if data is None:
+                    data = message.SerializeToString()
+                client.enqueue(data)
+
+class BrokerConnection(iterm2.connection.Connection):
+    """A connection to a :class:`NotificationBroker` instead of directly to iTerm2.
+
+    It can be used anywhere a :class:`iterm2.Connection` is accepted.
+
+    :param path: The path of the broker's socket, or None to use :func:`default_socket_path`.
+    """
+    @staticmethod
+    async def async_create(path=None):
+        """Creates a new connection to the broker.
+
+        This is intended for use in an apython REPL. It constructs a new
+        connection and returns it without creating an asyncio event loop.
+        """
+        connection = BrokerConnection(path)
+        reader, writer = await asyncio.open_unix_connection(connection.path)
+        connection.websocket = _FramedStream(reader, writer)
+        connection.__dispatch_forever_future = asyncio.ensure_future(connection._async_dispatch_forever(connection, asyncio.get_event_loop()))
+        return connection
+
+    def __init__(self, path=None):
+        super().__init__()
+        self.path = path if path is not None else default_socket_path()
+
+    async def async_connect(self, coro):
+        """
+        Connects to the broker and then awaits execution of coro.
+
+        coro: A coroutine to run once connected.
+        """
+        reader, writer = await asyncio.open_unix_connection(self.path)
+        self.websocket = _FramedStream(reader, writer)
+        try:
+            await coro(self)
+        except Exception:
+            traceback.print_exc()
+            sys.exit(1)
+        finally:
+            self.websocket.close()
+
+def run_until_complete(coro, path=None):
+    """Like :func:`iterm2.run_until_complete` but connects to a :class:`NotificationBroker`."""
+    BrokerConnection(path).run_until_complete(coro)
+
+def run_forever(coro, path=None):
+    """Like :func:`iterm2.run_forever` but connects to a :class:`NotificationBroker`."""
+    BrokerConnection(path).run_forever(coro)
+
+def main():
+    """Runs a broker until interrupted."""
+    parser = argparse.ArgumentParser(description="Shares iTerm2 notification subscriptions among local scripts.")
+    parser.add_argument("--socket", default=None, help="Path of the Unix domain socket to listen on")
+    parser.add_argument("--max-queue-size", type=int, default=1024, help="Notifications to buffer per client")
+    args = parser.parse_args()
+
+    async def async_main(connection):
+        broker = NotificationBroker(connection, args.socket, args.max_queue_size)
+        await broker.async_start()
+
+    iterm2.connection.run_forever(async_main)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""Generates Dynamic Profiles files for large numbers of profiles.
+
+iTerm2 loads every file in its DynamicProfiles folder, and reloads them when
+any of them changes. A :class:`DynamicProfileGenerator` spreads profiles
+across a fixed number of files, called shards. It picks each profile's shard
+from a hash of its GUID, so a profile stays in the same file from one run to
+the next. When writing, a shard whose content is the same as the file
+already on disk is left alone, so regenerating an inventory in which a few
+hosts changed touches only the files holding those hosts, and regenerating
+one in which none changed touches nothing.
+
+Each file is written to a temporary file whose name begins with a dot, which
+iTerm2 ignores, and then renamed over the old one. iTerm2 never sees a
+partially written file.
+
+Profile keys are checked against the keys :mod:`iterm2.profile` knows how to
+get and set, so typos are caught before iTerm2 silently ignores them.
+"""
+import hashlib
+import inspect
+import json
+import os
+import re
+
+import iterm2.profile
+
+DEFAULT_DIRECTORY = os.path.expanduser("~/Library/Application Support/iTerm2/DynamicProfiles")
+
+# Keys iTerm2 assigns itself. Dynamic profiles may not set them.
+_RESERVED_KEYS = {"Dynamic Profile Filename", "Original Guid"}
+
+class InvalidDynamicProfileException(Exception):
+    """Raised when a profile can't be written as a dynamic profile."""
+    pass
+
+class _KeyRecordingLocalProfile(iterm2.profile.LocalWriteOnlyProfile):
+    def __init__(self, keys):
+        super().__init__()
+        self.keys = keys
+
+    def _simple_set(self, key, value):
+        self.keys.add(key)
+
+    def _color_set(self, key, value):
+        self.keys.add(key)
+
+class _KeyRecordingProfile(iterm2.profile.Profile):
+    def __init__(self, keys):
+        self.keys = keys
+
+    def _get(self, key):
+        self.keys.add(key)
+        raise KeyError(key)
+
+    def _simple_get(self, key):
+        self.keys.add(key)
+        return None
+
+def _known_keys():
+    """:returns: The set of profile keys that :mod:`iterm2.profile` reads or writes.
+
+    They are found by calling every setter of
+    :class:`iterm2.LocalWriteOnlyProfile` and every property of
+    :class:`iterm2.Profile` on objects that record the keys used."""
+    if not hasattr(_known_keys, 'keys'):
+        keys = set()
+        setter = _KeyRecordingLocalProfile(keys)
+        for name, method in inspect.getmembers(iterm2.profile.LocalWriteOnlyProfile, inspect.isfunction):
+            if name.startswith("set_"):
+                try:
+                    method(setter, None)
+                except Exception:
+                    pass
+        getter = _KeyRecordingProfile(keys)
+        for name, _prop in inspect.getmembers(iterm2.profile.Profile, lambda m: isinstance(m, property)):
+            try:
+                getattr(getter, name)
+            except Exception:
+                pass
+        _known_keys.keys = frozenset(keys)
+    return _known_keys.keys
+
+def _shard_of(guid, shard_count):
+    """:returns: The shard number of a GUID. It depends only on the GUID and the number of shards."""
+    digest = hashlib.sha256(guid.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % shard_count
+
+class DynamicProfilesWriteResult:
+    """Describes what :meth:`DynamicProfileGenerator.write` did to each file."""
+    def __init__(self, written, unchanged, removed):
+        self.__written = written
+        self.__unchanged = unchanged
+        self.__removed = removed
+
+    def __repr__(self):
+        return "<DynamicProfilesWriteResult written={} unchanged={} removed={}>".format(
+            len(self.__written), len(self.__unchanged), len(self.__removed))
+
+    @property
+    def written(self):
+        """:returns: A list of paths of files that were created or replaced."""
+        return self.__written
+
+    @property
+    def unchanged(self):
+        """:returns: A list of paths of files that already had the right content."""
+        return self.__unchanged
+
+    @property
+    def removed(self):
+        """:returns: A list of paths of files that were deleted because they no longer hold any profiles."""
+        return self.__removed
+
+class DynamicProfileGenerator:
+    """Collects profiles and writes them as sharded Dynamic Profiles files.
+
+    :param directory: The folder to write to. Defaults to iTerm2's DynamicProfiles folder.
+    :param prefix: The start of each file's name. Files are named `prefix-N.json`. Files with this prefix that aren't part of the output are deleted when writing, so don't share a prefix between generators.
+    :param shard_count: The number of files to spread profiles across. Changing it moves most profiles to other files.
+    :param extra_keys: Keys to allow besides those :mod:`iterm2.profile` knows, for settings it doesn't model.
+
+    Example:
+
+      .. code-block:: python
+
+          generator = iterm2.DynamicProfileGenerator(prefix="inventory", shard_count=32)
+          for host in hosts:
+              settings = iterm2.LocalWriteOnlyProfile()
+              settings.set_badge_text(host.name)
+              settings.set_use_custom_command(iterm2.Profile.USE_CUSTOM_COMMAND_ENABLED)
+              settings.set_command("ssh " + host.address)
+              generator.add(host.guid, host.name, settings, parent_name="Servers", tags=["hosts/" + host.site])
+          result = generator.write()
+    """
+    def __init__(self, directory=None, prefix="generated", shard_count=16, extra_keys=None):
+        if shard_count < 1:
+            raise ValueError("shard_count must be at least 1")
+        if not re.match(r"^[A-Za-z0-9_][A-Za-z0-9_.-]*$", prefix):
+            raise ValueError("Invalid prefix {!r}".format(prefix))
+        self.__directory = directory or DEFAULT_DIRECTORY
+        self.__prefix = prefix
+        self.__shard_count = shard_count
+        self.__allowed_keys = (_known_keys() | set(extra_keys or [])) - _RESERVED_KEYS
+        # Shard number -> {GUID -> profile dict}
+        self.__shards = [{} for _ in range(shard_count)]
+        self.__count = 0
+
+    def __len__(self):
+        return self.__count
+
+    @property
+    def directory(self):
+        """:returns: The folder files are written to."""
+        return self.__directory
+
+    def path_for_shard(self, shard):
+        """:returns: The path of the file holding a shard."""
+        return os.path.join(self.__directory, "{}-{}.json".format(self.__prefix, shard))
+
+    def add(self, guid, name, settings=None, parent_name=None, tags=None):
+        """Adds a profile.
+
+        :param guid: A string uniquely identifying the profile. Keep it the same from run to run so iTerm2 updates the profile rather than replacing it.
+        :param name: The profile's name.
+        :param settings: A :class:`iterm2.LocalWriteOnlyProfile` or a dict from key to value, holding the profile's other properties, or None.
+        :param parent_name: The name of the profile to take unspecified settings from, or None for the default profile.
+        :param tags: A list of strings, or None.
+
+        :throws: :class:`InvalidDynamicProfileException` if the profile isn't valid or its GUID was already added.
+        """
+        if not isinstance(guid, str) or not guid:
+            raise InvalidDynamicProfileException("GUID must be a non-empty string, not {!r}".format(guid))
+        if not isinstance(name, str):
+            raise InvalidDynamicProfileException("Name of {} must be a string, not {!r}".format(guid, name))
+        if isinstance(settings, iterm2.profile.LocalWriteOnlyProfile):
+            values = {key: json.loads(value) for key, value in settings.values.items() if key is not None}
+        else:
+            values = dict(settings or {})
+        for key in values:
+            if key not in self.__allowed_keys:
+                raise InvalidDynamicProfileException("Unknown or reserved key {!r} in profile {}".format(key, guid))
+        values["Guid"] = guid
+        values["Name"] = name
+        if parent_name is not None:
+            values["Dynamic Profile Parent Name"] = parent_name
+        if tags is not None:
+            values["Tags"] = tags
+        tags = values.get("Tags", [])
+        if not isinstance(tags, (list, tuple)) or not all(isinstance(tag, str) for tag in tags):
+            raise InvalidDynamicProfileException("Tags of {} must be a list of strings".format(guid))
+        if "Tags" in values:
+            values["Tags"] = list(tags)
+        try:
+            json.dumps(values)
+        except (TypeError, ValueError) as e:
+            raise InvalidDynamicProfileException("Profile {} can't be encoded as JSON: {}".format(guid, e))
+
+        shard = self.__shards[_shard_of(guid, self.__shard_count)]
+        if guid in shard:
+            raise InvalidDynamicProfileException("Duplicate GUID {}".format(guid))
+        shard[guid] = values
+        self.__count += 1
+
+    def _encode_shard(self, shard):
+        """:returns: The bytes of a shard's file. The same profiles always give the same bytes."""
+        profiles = [self.__shards[shard][guid] for guid in sorted(self.__shards[shard])]
+        return json.dumps({"Profiles": profiles}, indent=2, sort_keys=True).encode("utf-8")
+
+    def _write_atomically(self, path, data):
+        directory, name = os.path.split(path)
+        temp = os.path.join(directory, ".{}.{}.tmp".format(name, os.getpid()))
+        try:
+            with open(temp, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp, path)
+        except Exception:
+            if os.path.exists(temp):
+                os.remove(temp)
+            raise
+
+    def write(self):
+        """Writes the shards whose content changed and deletes files that are no longer needed.
+
+        A shard is compared with the file on disk by a hash of its content.
+        Files that are no longer needed are deleted before any shard is
+        written, so a profile that moves to another shard is not loaded twice
+        from an old file. Each file is replaced atomically, but the files are
+        not updated together: iTerm2 may reload while some shards are new and
+        others are old, and if writing fails partway the remaining files keep
+        their old contents. Calling this again finishes the job.
+
+        :returns: A :class:`DynamicProfilesWriteResult`.
+        """
+        os.makedirs(self.__directory, exist_ok=True)
+        wanted = set(os.path.basename(self.path_for_shard(shard))
+                     for shard in range(self.__shard_count)
+                     if self.__shards[shard])
+
+        removed = []
+        pattern = re.compile(r"^" + re.escape(self.__prefix) + r"-[0-9]+\.json$")
+        for name in sorted(os.listdir(self.__directory)):
+            if pattern.match(name) and name not in wanted:
+                path = os.path.join(self.__directory, name)
+                os.remove(path)
+                removed.append(path)
+
+        written = []
+        unchanged = []
+        for shard in range(self.__shard_count):
+            if not self.__shards[shard]:
+                continue
+            path = self.path_for_shard(shard)
+            data = self._encode_shard(shard)
+            try:
+                with open(path, "rb") as f:
+                    existing = hashlib.sha256(f.read()).digest()
+            except FileNotFoundError:
+                existing = None
+            if existing == hashlib.sha256(data).digest():
+                unchanged.append(path)
+                continue
+            self._write_atomically(path, data)
+            written.append(path)
+        return DynamicProfilesWriteResult(written, unchanged, removed)
@@ -0,0 +1,620 @@
+"""Records notifications to a compact on-disk log and queries it.
+
+The log is a directory of column files, one fixed-width value per event in
+each column, all little-endian:
+
+* `timestamp.col`: float64 seconds since the epoch
+* `type.col`: uint8 notification type (an iterm2.api_pb2.NotificationType value)
+* `session.col`: uint32 index into the string table of the session ID, or of
+  the tab/window identifier for variable changes
+* `name.col`: uint32 index into the string table of the variable name
+* `value.col`: uint64 offset into `values.dat` of the serialized notification
+
+`strings.dat` holds the interned strings and `values.dat` holds
+length-prefixed serialized notifications. A missing string is stored as
+0xffffffff.
+
+Columns are memory-mapped for reading. Timestamps never decrease from one
+row to the next, so a query binary-searches the timestamp column for its
+time range and then reads only the type and session columns
+for the rows in that range. Notification bodies are read only for events
+that match.
+
+To record, run:
+
+  .. code-block:: bash
+
+      python3 -m iterm2.eventlog record ~/iterm2-events --variable session:jobName
+
+To query, run:
+
+  .. code-block:: bash
+
+      python3 -m iterm2.eventlog query ~/iterm2-events --session w0t0p0:1234 --type prompt --since "2019-01-31 09:00"
+"""
+import argparse
+import asyncio
+import bisect
+import datetime
+import mmap
+import os
+import struct
+import sys
+import time
+
+import iterm2.api_pb2
+import iterm2.notifications
+import iterm2.variables
+
+_FORMAT = "iterm2-eventlog 1\n"
+_NO_STRING = 0xffffffff
+_LENGTH = struct.Struct("<I")
+
+# (file name, struct format) for each column.
+_TIMESTAMP = ("timestamp.col", "<d")
+_TYPE = ("type.col", "<B")
+_SESSION = ("session.col", "<I")
+_NAME = ("name.col", "<I")
+_VALUE = ("value.col", "<Q")
+_COLUMNS = [_TIMESTAMP, _TYPE, _SESSION, _NAME, _VALUE]
+
+# Fields of iterm2.api_pb2.Notification are numbered with the
+# iterm2.api_pb2.NotificationType of the notification they carry.
+_TYPE_NAMES = {
+    iterm2.api_pb2.NOTIFY_ON_KEYSTROKE: "keystroke",
+    iterm2.api_pb2.NOTIFY_ON_SCREEN_UPDATE: "screen_update",
+    iterm2.api_pb2.NOTIFY_ON_PROMPT: "prompt",
+    iterm2.api_pb2.NOTIFY_ON_LOCATION_CHANGE: "location_change",
+    iterm2.api_pb2.NOTIFY_ON_CUSTOM_ESCAPE_SEQUENCE: "custom_escape_sequence",
+    iterm2.api_pb2.NOTIFY_ON_NEW_SESSION: "new_session",
+    iterm2.api_pb2.NOTIFY_ON_TERMINATE_SESSION: "terminate_session",
+    iterm2.api_pb2.NOTIFY_ON_LAYOUT_CHANGE: "layout_change",
+    iterm2.api_pb2.NOTIFY_ON_FOCUS_CHANGE: "focus_change",
+    iterm2.api_pb2.NOTIFY_ON_SERVER_ORIGINATED_RPC: "server_originated_rpc",
+    iterm2.api_pb2.NOTIFY_ON_BROADCAST_CHANGE: "broadcast_change",
+    iterm2.api_pb2.NOTIFY_ON_VARIABLE_CHANGE: "variable_change",
+    iterm2.api_pb2.NOTIFY_ON_PROFILE_CHANGE: "profile_change" }
+_TYPES_BY_NAME = {v: k for k, v in _TYPE_NAMES.items()}
+
+def _identifiers(notification_type, sub_notification):
+    """Returns the (session, name) strings to index a notification by. Either may be None."""
+    if notification_type in (iterm2.api_pb2.NOTIFY_ON_KEYSTROKE,
+                             iterm2.api_pb2.NOTIFY_ON_SCREEN_UPDATE,
+                             iterm2.api_pb2.NOTIFY_ON_PROMPT,
+                             iterm2.api_pb2.NOTIFY_ON_LOCATION_CHANGE,
+                             iterm2.api_pb2.NOTIFY_ON_CUSTOM_ESCAPE_SEQUENCE):
+        return sub_notification.session, None
+    if notification_type in (iterm2.api_pb2.NOTIFY_ON_NEW_SESSION,
+                             iterm2.api_pb2.NOTIFY_ON_TERMINATE_SESSION):
+        return sub_notification.uniqueIdentifier, None
+    if notification_type == iterm2.api_pb2.NOTIFY_ON_FOCUS_CHANGE:
+        if sub_notification.WhichOneof("event") == "session":
+            return sub_notification.session, None
+        return None, None
+    if notification_type == iterm2.api_pb2.NOTIFY_ON_VARIABLE_CHANGE:
+        return sub_notification.identifier or None, sub_notification.name
+    if notification_type == iterm2.api_pb2.NOTIFY_ON_PROFILE_CHANGE:
+        return None, sub_notification.guid
+    return None, None
+
+class EventLogWriter:
+    """Appends notifications to an event log.
+
+    Reopening an existing log continues appending to it. Rows left incomplete
+    by a crash are discarded.
+
+    Timestamps are kept in order: an event whose timestamp is earlier than
+    the one before it, for example because the clock was set back, is
+    logged with the earlier event's timestamp.
+
+    :param path: The directory holding the log. It is created if needed.
+    """
+    def __init__(self, path):
+        self.__path = path
+        os.makedirs(path, exist_ok=True)
+        format_path = os.path.join(path, "format")
+        if not os.path.exists(format_path):
+            with open(format_path, "w") as f:
+                f.write(_FORMAT)
+
+        self.__strings = _read_strings(os.path.join(path, "strings.dat"), truncate=True)
+        self.__string_ids = {s: i for i, s in enumerate(self.__strings)}
+        rows = _count_complete_rows(path, len(self.__strings))
+        self.__files = {}
+        for name, fmt in _COLUMNS:
+            column_path = os.path.join(path, name)
+            with open(column_path, "ab") as f:
+                f.truncate(rows * struct.calcsize(fmt))
+            self.__files[name] = (open(column_path, "ab"), struct.Struct(fmt))
+        values_path = os.path.join(path, "values.dat")
+        self.__last_timestamp = None
+        if rows:
+            with open(os.path.join(path, _TIMESTAMP[0]), "rb") as f:
+                f.seek((rows - 1) * struct.calcsize(_TIMESTAMP[1]))
+                self.__last_timestamp, = struct.unpack(_TIMESTAMP[1], f.read(struct.calcsize(_TIMESTAMP[1])))
+            # Drop values written after the last complete row.
+            with open(os.path.join(path, _VALUE[0]), "rb") as f:
+                f.seek((rows - 1) * struct.calcsize(_VALUE[1]))
+                last_offset, = struct.unpack(_VALUE[1], f.read(struct.calcsize(_VALUE[1])))
+            with open(values_path, "rb") as f:
+                f.seek(last_offset)
+                length, = _LENGTH.unpack(f.read(_LENGTH.size))
+            end = last_offset + _LENGTH.size + length
+        else:
+            end = 0
+        with open(values_path, "ab") as f:
+            f.truncate(end)
+        self.__values = open(values_path, "ab")
+        self.__values_size = end
+        self.__strings_file = open(os.path.join(path, "strings.dat"), "ab")
+
+    def _intern(self, string):
+        if string is None:
+            return _NO_STRING
+        index = self.__string_ids.get(string)
+        if index is None:
+            index = len(self.__strings)
+            self.__strings.append(string)
+            self.__string_ids[string] = index
+            data = string.encode("utf-8")
+            self.__strings_file.write(_LENGTH.pack(len(data)) + data)
+        return index
+
+    def _append(self, column, value):
+        f, packer = self.__files[column[0]]
+        f.write(packer.pack(value))
+
+    def append(self, notification, timestamp=None):
+        """Appends a notification to the log.
+
+        :param notification: An iterm2.api_pb2.Notification.
+        :param timestamp: Seconds since the epoch, or None for now. It is raised to the previous event's timestamp if earlier.
+        """
+        fields = notification.ListFields()
+        if not fields:
+            return
+        descriptor, sub_notification = fields[0]
+        notification_type = descriptor.number
+        session, name = _identifiers(notification_type, sub_notification)
+        data = sub_notification.SerializeToString()
+
+        # The string table must be written before the rows that refer to it.
+        session_id = self._intern(session)
+        name_id = self._intern(name)
+        offset = self.__values_size
+        self.__values.write(_LENGTH.pack(len(data)) + data)
+        self.__values_size += _LENGTH.size + len(data)
+
+        if timestamp is None:
+            timestamp = time.time()
+        if self.__last_timestamp is not None and timestamp < self.__last_timestamp:
+            timestamp = self.__last_timestamp
+        self.__last_timestamp = timestamp
+        self._append(_TIMESTAMP, timestamp)
+        self._append(_TYPE, notification_type)
+        self._append(_SESSION, session_id)
+        self._append(_NAME, name_id)
+        self._append(_VALUE, offset)
+
+    def flush(self):
+        """Writes buffered events to disk."""
+        self.__strings_file.flush()
+        self.__values.flush()
+        for f, _packer in self.__files.values():
+            f.flush()
+
+    def close(self):
+        """Flushes and closes the log."""
+        self.flush()
+        self.__strings_file.close()
+        self.__values.close()
+        for f, _packer in self.__files.values():
+            f.close()
+        self.__files = {}
+
+class LoggedEvent:
+    """An event read from an event log."""
+    def __init__(self, timestamp, notification_type, session, name, reader, offset):
+        self.__timestamp = timestamp
+        self.__notification_type = notification_type
+        self.__session = session
+        self.__name = name
+        self.__reader = reader
+        self.__offset = offset
+
+    def __repr__(self):
+        return "<LoggedEvent {} {} session={} name={}>".format(
+            self.timestamp, _TYPE_NAMES.get(self.notification_type, self.notification_type), self.session, self.name)
+
+    @property
+    def timestamp(self):
+        """:returns: Seconds since the epoch when the notification was received."""
+        return self.__timestamp
+
+    @property
+    def notification_type(self):
+        """:returns: An iterm2.api_pb2.NotificationType value."""
+        return self.__notification_type
+
+    @property
+    def session(self):
+        """:returns: The session ID (or tab/window ID for variable changes) or None."""
+        return self.__session
+
+    @property
+    def name(self):
+        """:returns: The variable name for variable changes, the GUID for profile changes, or None."""
+        return self.__name
+
+    @property
+    def notification(self):
+        """Decodes the notification. This reads its body from disk.
+
+        :returns: An iterm2.api_pb2.Notification
+        """
+        notification = iterm2.api_pb2.Notification()
+        field = notification.DESCRIPTOR.fields_by_number[self.__notification_type]
+        getattr(notification, field.name).ParseFromString(self.__reader._value_at(self.__offset))
+        return notification
+
+class EventLogReader:
+    """Queries an event log without loading it into memory.
+
+    Can be used as a context manager, which closes it on exit.
+
+    :param path: The directory holding the log.
+    """
+    def __init__(self, path):
+        self.__path = path
+        self.__strings = _read_strings(os.path.join(path, "strings.dat"), truncate=False)
+        self.__string_ids = {s: i for i, s in enumerate(self.__strings)}
+        self.__rows = _count_complete_rows(path, len(self.__strings))
+        self.__maps = []
+        self.__columns = {}
+        for name, fmt in _COLUMNS:
+            self.__columns[name] = _Column(self._map(os.path.join(path, name)), fmt, self.__rows)
+        self.__values = self._map(os.path.join(path, "values.dat"))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, _tb):
+        self.close()
+
+    def __len__(self):
+        return self.__rows
+
+    def _map(self, path):
+        """Maps a file for reading. Empty files can't be mapped and give empty bytes."""
+        if not self.__rows:
+            return b""
+        with open(path, "rb") as f:
+            m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.__maps.append(m)
+        return m
+
+    def _value_at(self, offset):
+        length, = _LENGTH.unpack_from(self.__values, offset)
+        start = offset + _LENGTH.size
+        return bytes(self.__values[start:start + length])
+
+    def close(self):
+        """Releases the memory maps. Queries and events from this reader can't read the log after this."""
+        for m in self.__maps:
+            m.close()
+        self.__maps = []
+
+    @property
+    def sessions(self):
+        """:returns: The set of session (and other object) IDs that appear in the log."""
+        return {self._string(i) for i in set(self.__columns[_SESSION[0]])} - {None}
+
+    def query(self, session=None, notification_types=None, start=None, end=None):
+        """Finds events matching all the given conditions.
+
+        :param session: A session ID to match, or None for any.
+        :param notification_types: A collection of iterm2.api_pb2.NotificationType values, or None for any.
+        :param start: Earliest timestamp (inclusive) in seconds since the epoch, or None.
+        :param end: Latest timestamp (exclusive) in seconds since the epoch, or None.
+
+        :returns: An iterator of :class:`LoggedEvent` in the order they were logged.
+        """
+        timestamps = self.__columns[_TIMESTAMP[0]]
+        types = self.__columns[_TYPE[0]]
+        sessions = self.__columns[_SESSION[0]]
+        names = self.__columns[_NAME[0]]
+        values = self.__columns[_VALUE[0]]
+
+        # Timestamps never decrease, so the time range is a contiguous run of rows.
+        lo = 0 if start is None else bisect.bisect_left(timestamps, start)
+        hi = self.__rows if end is None else bisect.bisect_left(timestamps, end, lo)
+
+        if session is not None:
+            session_id = self.__string_ids.get(session)
+            if session_id is None:
+                return
+        else:
+            session_id = None
+        if notification_types is not None:
+            notification_types = set(notification_types)
+
+        for row in range(lo, hi):
+            if notification_types is not None and types[row] not in notification_types:
+                continue
+            if session_id is not None and sessions[row] != session_id:
+                continue
+            yield LoggedEvent(
+                timestamps[row],
+                types[row],
+                self._string(sessions[row]),
+                self._string(names[row]),
+                self,
+                values[row])
+
+    def _string(self, index):
+        if index == _NO_STRING:
+            return None
+        return self.__strings[index]
+
+class _Column:
+    """A read-only sequence of the values in a mapped column file.
+
+    Values are unpacked as they are read, so no buffer stays exported from
+    the map and it can be closed at any time."""
+    def __init__(self, buffer, fmt, rows):
+        self.__buffer = buffer
+        self.__struct = struct.Struct(fmt)
+        self.__rows = rows
+
+    def __len__(self):
+        return self.__rows
+
+    def __getitem__(self, row):
+        if not 0 <= row < self.__rows:
+            raise IndexError(row)
+        return self.__struct.unpack_from(self.__buffer, row * self.__struct.size)[0]
+
+class NotificationLogger:
+    """Records notifications received by this script to an event log.
+
+    Every notification that reaches this script is logged, including those
+    from subscriptions made elsewhere. The logger also subscribes to
+    `notification_types` for all sessions and to the given variables so they
+    are received.
+
+    :param connection: A connected :class:`iterm2.Connection`.
+    :param path: The directory holding the log.
+    :param notification_types: iterm2.api_pb2.NotificationType values to subscribe to.
+    :param variables: A list of (:class:`iterm2.VariableScopes`, name, identifier) tuples to subscribe to, or None.
+    :param flush_interval: How often in seconds to write buffered events to disk.
+    """
+    DEFAULT_NOTIFICATION_TYPES = [
+        iterm2.api_pb2.NOTIFY_ON_KEYSTROKE,
+        iterm2.api_pb2.NOTIFY_ON_PROMPT,
+        iterm2.api_pb2.NOTIFY_ON_LOCATION_CHANGE,
+        iterm2.api_pb2.NOTIFY_ON_CUSTOM_ESCAPE_SEQUENCE,
+        iterm2.api_pb2.NOTIFY_ON_NEW_SESSION,
+        iterm2.api_pb2.NOTIFY_ON_TERMINATE_SESSION,
+        iterm2.api_pb2.NOTIFY_ON_FOCUS_CHANGE ]
+
+    def __init__(self, connection, path, notification_types=None, variables=None, flush_interval=1):
+        self.__connection = connection
+        self.__path = path
+        if notification_types is None:
+            notification_types = NotificationLogger.DEFAULT_NOTIFICATION_TYPES
+        self.__notification_types = notification_types
+        self.__variables = variables or []
+        self.__flush_interval = flush_interval
+        self.__writer = None
+        self.__tokens = []
+        self.__flush_handle = None
+
+    async def async_start(self):
+        """Opens the log and begins recording."""
+        self.__writer = EventLogWriter(self.__path)
+        iterm2.notifications._get_dispatch_observers().append(self._observe)
+
+        async def async_ignore(_connection, _notification):
+            pass
+
+        for notification_type in self.__notification_types:
+            self.__tokens.append(await iterm2.notifications._async_subscribe(
+                self.__connection,
+                True,
+                notification_type,
+                async_ignore))
+        for scope, name, identifier in self.__variables:
+            self.__tokens.append(await iterm2.notifications.async_subscribe_to_variable_change_notification(
+                self.__connection,
+                async_ignore,
+                scope.value,
+                name,
+                identifier))
+        self._schedule_flush()
+
+    async def async_stop(self):
+        """Stops recording and closes the log."""
+        for token in self.__tokens:
+            await iterm2.notifications.async_unsubscribe(self.__connection, token)
+        self.__tokens = []
+        iterm2.notifications._get_dispatch_observers().remove(self._observe)
+        if self.__flush_handle is not None:
+            self.__flush_handle.cancel()
+            self.__flush_handle = None
+        self.__writer.close()
+        self.__writer = None
+
+    def _observe(self, message):
+        if message.HasField("notification"):
+            self.__writer.append(message.notification)
+
+    def _schedule_flush(self):
+        def flush():
+            self.__writer.flush()
+            self._schedule_flush()
+        self.__flush_handle = asyncio.get_event_loop().call_later(self.__flush_interval, flush)
+
+def _count_rows(path):
+    """Returns the number of complete rows, which is the length of the shortest column."""
+    rows = None
+    for name, fmt in _COLUMNS:
+        column_path = os.path.join(path, name)
+        size = os.path.getsize(column_path) if os.path.exists(column_path) else 0
+        n = size // struct.calcsize(fmt)
+        rows = n if rows is None else min(rows, n)
+    return rows
+
+def _count_complete_rows(path, number_of_strings):
+    """Returns the number of rows whose values and strings are all on disk.
+
+    Each file is flushed separately, so after a crash the columns may refer
+    to values or strings that were never written. Rows only refer to
+    strings and values written before them, so the complete rows are a
+    prefix of the log."""
+    rows = _count_rows(path)
+    values_path = os.path.join(path, "values.dat")
+    values_size = os.path.getsize(values_path) if os.path.exists(values_path) else 0
+    if not rows or not values_size:
+        return 0
+
+    def read(f, column, row):
+        size = struct.calcsize(column[1])
+        f.seek(row * size)
+        value, = struct.unpack(column[1], f.read(size))
+        return value
+
+    with open(os.path.join(path, _SESSION[0]), "rb") as sessions, \
+         open(os.path.join(path, _NAME[0]), "rb") as names, \
+         open(os.path.join(path, _VALUE[0]), "rb") as offsets, \
+         open(values_path, "rb") as values:
+        while rows > 0:
+            row = rows - 1
+            session = read(sessions, _SESSION, row)
+            name = read(names, _NAME, row)
+            offset = read(offsets, _VALUE, row)
+            if ((session == _NO_STRING or session < number_of_strings) and
+                    (name == _NO_STRING or name < number_of_strings) and
+                    offset + _LENGTH.size <= values_size):
+                values.seek(offset)
+                length, = _LENGTH.unpack(values.read(_LENGTH.size))
+                if offset + _LENGTH.size + length <= values_size:
+                    break
+            rows -= 1
+    return rows
+
+def _read_strings(path, truncate):
+    """Reads the string table, optionally cutting off a partially written last entry."""
+    strings = []
+    if not os.path.exists(path):
+        return strings
+    with open(path, "rb") as f:
+        data = f.read()
+    offset = 0
+    while offset + _LENGTH.size <= len(data):
+        length, = _LENGTH.unpack_from(data, offset)
+        if offset + _LENGTH.size + length > len(data):
+            break
+        start = offset + _LENGTH.size
+        strings.append(data[start:start + length].decode("utf-8"))
+        offset = start + length
+    if truncate and offset != len(data):
+        with open(path, "ab") as f:
+            f.truncate(offset)
+    return strings
+
+def _parse_time(value):
+    """Parses seconds since the epoch or a local date and time such as "2019-01-31 09:00"."""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"):
+        try:
+            return time.mktime(datetime.datetime.strptime(value, fmt).timetuple())
+        except ValueError:
+            pass
+    raise argparse.ArgumentTypeError("Can't parse time {}".format(value))
+
+def _parse_type(value):
+    if value not in _TYPES_BY_NAME:
+        raise argparse.ArgumentTypeError("Unknown type {}. Valid types are: {}".format(
+            value, ", ".join(sorted(_TYPES_BY_NAME.keys()))))
+    return _TYPES_BY_NAME[value]
+
+def _parse_variable(value):
+    """Parses scope:name[:identifier] into a (VariableScopes, name, identifier) tuple.
+
+    Session variables default to all sessions and app variables need no
+    identifier."""
+    parts = value.split(":", 2)
+    if len(parts) < 2 or not parts[1]:
+        raise argparse.ArgumentTypeError("Expected scope:name[:identifier], not {}".format(value))
+    try:
+        scope = iterm2.variables.VariableScopes[parts[0].upper()]
+    except KeyError:
+        raise argparse.ArgumentTypeError("Unknown scope {}. Valid scopes are: {}".format(
+            parts[0], ", ".join(s.name.lower() for s in iterm2.variables.VariableScopes)))
+    if len(parts) == 3:
+        identifier = parts[2]
+    elif scope == iterm2.variables.VariableScopes.SESSION:
+        identifier = "all"
+    elif scope == iterm2.variables.VariableScopes.APP:
+        identifier = None
+    else:
+        raise argparse.ArgumentTypeError("A {} variable needs an identifier".format(parts[0]))
+    return (scope, parts[1], identifier)
+
+def _query(args):
+    with EventLogReader(args.path) as reader:
+        types = args.type if args.type else None
+        for event in reader.query(args.session, types, args.since, args.until):
+            when = datetime.datetime.fromtimestamp(event.timestamp).strftime("%Y-%m-%d %H:%M:%S.%f")
+            fields = event.notification.ListFields()
+            body = str(fields[0][1]).replace("\n", " ").strip() if fields else ""
+            print("{} {} {} {}{}".format(
+                when,
+                _TYPE_NAMES.get(event.notification_type, event.notification_type),
+                event.session or "-",
+                (event.name + " ") if event.name else "",
+                body))
+
+def _record(args):
+    import iterm2.connection
+
+    async def async_main(connection):
+        logger = NotificationLogger(
+            connection,
+            args.path,
+            args.type if args.type else None,
+            args.variable)
+        await logger.async_start()
+
+    iterm2.connection.run_forever(async_main)
+
+def main():
+    """Command-line interface to record and query event logs."""
+    parser = argparse.ArgumentParser(description="Records and queries logs of iTerm2 notifications.")
+    subparsers = parser.add_subparsers(dest="command")
+
+    record_parser = subparsers.add_parser("record", help="Record notifications until interrupted")
+    record_parser.add_argument("path", help="Log directory")
+    record_parser.add_argument("--type", type=_parse_type, action="append", help="Notification type to subscribe to. May be repeated.")
+    record_parser.add_argument("--variable", type=_parse_variable, action="append", help="Variable to record changes of, as scope:name[:identifier]. Session variables are watched in all sessions unless an identifier is given. May be repeated.")
+    record_parser.set_defaults(func=_record)
+
+    query_parser = subparsers.add_parser("query", help="Print matching events")
+    query_parser.add_argument("path", help="Log directory")
+    query_parser.add_argument("--session", help="Only events for this session ID")
+    query_parser.add_argument("--type", type=_parse_type, action="append", help="Only events of this type. May be repeated.")
+    query_parser.add_argument("--since", type=_parse_time, help="Only events at or after this time")
+    query_parser.add_argument("--until", type=_parse_time, help="Only events before this time")
+    query_parser.set_defaults(func=_query)
+
+    args = parser.parse_args()
+    if not hasattr(args, "func"):
+        parser.print_help()
+        sys.exit(1)
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -24,6 +24,15 @@ def _get_handlers():
         _get_handlers.handlers = {}
     return _get_handlers.handlers
 
+def _get_dispatch_observers():
+    """Returns functions that see every notification before it is dispatched.
+
+    :returns: [function taking an iterm2.api_pb2.ServerOriginatedMessage, ...]
+    """
+    if not hasattr(_get_dispatch_observers, 'observers'):
+        _get_dispatch_observers.observers = []
+    return _get_dispatch_observers.observers
+
 ## APIs -----------------------------------------------------------------------
 
 class SubscriptionException(Exception):
@@ -46,6 +55,12 @@ async def async_unsubscribe(connection, token):
         del _get_handlers()[key]
         if len(key) == 2:
             session, notification_type = key
+            if (notification_type == iterm2.api_pb2.NOTIFY_ON_PROFILE_CHANGE and
+                    any(len(other) == 2 and other[1] == iterm2.api_pb2.NOTIFY_ON_PROFILE_CHANGE
+                        for other in _get_handlers())):
+                # iTerm2 keeps one profile change subscription per
+                # connection, whatever the GUID, and it is still in use.
+                return
             await _async_subscribe(
                 connection,
                 False,
@@ -328,9 +343,8 @@ async def async_subscribe_to_variable_change_notification(connection, callback,
     :param callback: A coroutine taking two arguments: an :class:`Connection` and iterm2.api_pb2.VariableChangedNotification.
     :param scope: A :class:`VariableScopes` enumerated value.
     :param name: The name of the variable, a string.
-    :param identifier: The identifier of the object (window, tab, or session) being monitored, or None for app.
+    :param identifier: The identifier of the object (window, tab, or session) being monitored, or None for app. For session scope, "all" monitors every session, including sessions created later. The notification's `identifier` tells which session changed.
     """
-    # TODO: Support identifiers of "all"
     request = iterm2.api_pb2.VariableMonitorRequest()
     request.name = name
     request.scope = scope
@@ -354,15 +368,15 @@ async def async_subscribe_to_profile_change_notification(connection, callback, g
 
     :param connection: A connected :class:`Connection`.
     :param callback: A coroutine taking two arguments: a :class:`Connection` and iterm2.api_pb2.ProfileChangedNotification.
-    :parm guid: The guid to monitor. A string.
+    :param guid: The guid to monitor. A string.
     """
     request = iterm2.api_pb2.ProfileChangeRequest()
     request.guid = guid
-    key = (guid, iterm2.api_PB2.NOTIFY_ON_PROFILE_CHANGE)
+    key = (guid, iterm2.api_pb2.NOTIFY_ON_PROFILE_CHANGE)
     return await _async_subscribe(
         connection,
         True,
-        iterm2.api_PB2.NOTIFY_ON_PROFILE_CHANGE,
+        iterm2.api_pb2.NOTIFY_ON_PROFILE_CHANGE,
         callback,
         session=None,
         profile_change_request=request,
@@ -445,6 +459,9 @@ def _register_helper_if_needed():
         iterm2.connection.Connection.register_helper(_async_dispatch_helper)
 
 async def _async_dispatch_helper(connection, message):
+    for observer in _get_dispatch_observers():
+        observer(message)
+
     handlers, sub_notification = _get_notification_handlers(message)
     for handler in handlers:
         assert handler is not None
@@ -512,6 +529,9 @@ def _get_notification_handlers(message):
     if key is None:
         return ([], None)
 
+    if key[-1] == iterm2.api_pb2.NOTIFY_ON_VARIABLE_CHANGE:
+        return _get_variable_change_handlers(key, sub_notification)
+
     fallback = (None, key[1])
 
     if key in _get_handlers():
@@ -520,6 +540,37 @@ def _get_notification_handlers(message):
         return (_get_handlers()[fallback], sub_notification)
     return ([], None)
 
+def _get_variable_change_handlers(key, notification):
+    """Finds the handlers for a variable change, both for its object and for "all".
+
+    When a script subscribes to a session's variable and also to that
+    variable in all sessions, iTerm2 holds a reference for each and sends
+    every change twice. The second copy is dropped so each handler sees
+    each change once.
+
+    :returns: ([coroutine, ...], notification)
+    """
+    specific = _get_handlers().get(key, [])
+    wildcard = _get_handlers().get((key[0], "all", key[2], key[3]), [])
+    duplicates = _get_pending_variable_duplicates()
+    if specific and wildcard:
+        if duplicates.pop(key, None) == notification.json_new_value:
+            return ([], None)
+        duplicates[key] = notification.json_new_value
+    else:
+        duplicates.pop(key, None)
+    handlers = []
+    for handler in specific + wildcard:
+        if handler not in handlers:
+            handlers.append(handler)
+    return (handlers, notification)
+
+def _get_pending_variable_duplicates():
+    """:returns: (scope, identifier, name, type) -> JSON value of the change whose second copy hasn't arrived yet."""
+    if not hasattr(_get_pending_variable_duplicates, 'values'):
+        _get_pending_variable_duplicates.values = {}
+    return _get_pending_variable_duplicates.values
+
 def _register_notification_handler(session, rpc_registration_request, notification_type, coro):
     assert coro is not None
 
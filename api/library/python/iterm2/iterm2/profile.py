@@ -1,5 +1,5 @@
 """Provides classes for representing, querying, and modifying iTerm2 profiles."""
-import asyncio
+import iterm2.api_pb2
 import iterm2.color
 import enum
 import iterm2.rpc
@@ -734,6 +734,25 @@ class LocalWriteOnlyProfile:
         """
         return self._simple_set("Working Directory", value)
 
+class _ProfileBatch:
+    """The async context manager returned by :meth:`WriteOnlyProfile.batch`."""
+    def __init__(self, profile):
+        self.__profile = profile
+        self.__changes = LocalWriteOnlyProfile()
+
+    async def __aenter__(self):
+        return self.__changes
+
+    async def __aexit__(self, exc_type, exc, _tb):
+        if exc_type is None:
+            await self.__profile.async_set_properties(self.__changes)
+
+def _get_batching_connections():
+    """Returns the connections on which setting several profile properties in one request has worked."""
+    if not hasattr(_get_batching_connections, 'connections'):
+        _get_batching_connections.connections = set()
+    return _get_batching_connections.connections
+
 class WriteOnlyProfile:
     """A profile that can be modified but not read. Useful for changing many
     sessions' profiles at once without knowing what they are."""
@@ -774,23 +793,91 @@ class WriteOnlyProfile:
         else:
             return self.session_id
 
+    def batch(self):
+        """Collects changes and sends them in one request.
+
+        Use it as an async context manager. It gives a
+        :class:`LocalWriteOnlyProfile` to make changes to. When the block
+        ends without raising an exception, all the changes are sent with
+        :meth:`async_set_properties`.
+
+        Example:
+
+          .. code-block:: python
+
+              async with profile.batch() as changes:
+                  changes.set_foreground_color(foreground)
+                  changes.set_background_color(background)
+                  changes.set_name("Night")
+        """
+        return _ProfileBatch(self)
+
+    async def async_set_properties(self, local_profile):
+        """Sets every property set in a :class:`LocalWriteOnlyProfile` in one request.
+
+        For a single session or profile, the changes are applied together:
+        if any value is rejected, none are applied. When this profile
+        stands for all sessions, they are changed one session at a time, so
+        a rejection partway leaves the earlier sessions changed.
+
+        Older versions of iTerm2 can't set several properties in one request
+        and reject it as malformed. Until a batch has succeeded on this
+        connection, that rejection is taken to come from such a version: the
+        properties are then set one at a time, and a rejection partway
+        leaves the earlier properties set.
+
+        :param local_profile: A :class:`LocalWriteOnlyProfile` holding the changes.
+
+        :throws: :class:`iterm2.rpc.RPCException` if something goes wrong.
+        """
+        if not local_profile.values:
+            return
+        response = await iterm2.rpc.async_set_profile_properties(
+                self.connection,
+                self.session_id,
+                local_profile.values,
+                self._guids_for_set())
+        status = response.set_profile_property_response.status
+        batching_connections = _get_batching_connections()
+        if (status == iterm2.api_pb2.SetProfilePropertyResponse.Status.Value("REQUEST_MALFORMED") and
+                self.connection not in batching_connections):
+            await self._async_set_properties_one_at_a_time(local_profile)
+            return
+        if status != iterm2.api_pb2.SetProfilePropertyResponse.Status.Value("OK"):
+            raise iterm2.rpc.RPCException(iterm2.api_pb2.SetProfilePropertyResponse.Status.Name(status))
+        batching_connections.add(self.connection)
+
+    async def _async_set_properties_one_at_a_time(self, local_profile):
+        """Sets properties with one request each, for servers that can't batch them."""
+        for key, value in local_profile.values.items():
+            response = await iterm2.rpc.async_set_profile_property(
+                    self.connection,
+                    self.session_id,
+                    key,
+                    json.loads(value),
+                    self._guids_for_set())
+            status = response.set_profile_property_response.status
+            if status != iterm2.api_pb2.SetProfilePropertyResponse.Status.Value("OK"):
+                raise iterm2.rpc.RPCException(iterm2.api_pb2.SetProfilePropertyResponse.Status.Name(status))
+
     async def async_set_color_preset(self, preset):
         """Sets the color preset.
 
+        All the colors are set in one request, as with
+        :meth:`async_set_properties`.
+
         :param preset: A :class:`iterm2.ColorPreset`.
         """
-        coros = []
-        for value in preset.values:
-            coro = self._async_color_set(
-                    value.key,
-                    iterm2.color.Color(
-                        value.red,
-                        value.green,
-                        value.blue,
-                        value.alpha,
-                        value.color_space))
-            coros.append(coro)
-        await asyncio.gather(*coros)
+        async with self.batch() as changes:
+            for value in preset.values:
+                changes._color_set(
+                        value.key,
+                        iterm2.color.Color(
+                            value.red,
+                            value.green,
+                            value.blue,
+                            value.alpha,
+                            value.color_space))
 
 
     async def async_set_foreground_color(self, value):
@@ -1535,13 +1622,17 @@ class Profile(WriteOnlyProfile):
 
 
     def __init__(self, session_id, connection, profile_property_list):
-        props = {}
+        # Values are decoded from JSON when first read, since callers
+        # usually read only a few of the hundreds of properties.
+        raw = {}
         for prop in profile_property_list:
-            props[prop.key] = json.loads(prop.json_value)
+            raw[prop.key] = prop.json_value
+        self.__raw = raw
+        self.__props = {}
 
         guid_key = "Guid"
-        if guid_key in props:
-            guid = props[guid_key]
+        if guid_key in raw:
+            guid = self._get(guid_key)
         else:
             guid = None
 
@@ -1549,11 +1640,21 @@ class Profile(WriteOnlyProfile):
 
         self.connection = connection
         self.session_id = session_id
-        self.__props = props
+
+    def _get(self, key):
+        """Returns the decoded value for a key, decoding it if needed.
+
+        :throws: KeyError if the profile has no such property."""
+        props = self.__props
+        if key in props:
+            return props[key]
+        value = json.loads(self.__raw[key])
+        props[key] = value
+        return value
 
     def _simple_get(self, key):
-        if key in self.__props:
-            return self.__props[key]
+        if key in self.__raw:
+            return self._get(key)
         else:
             return None
 
@@ -1566,7 +1667,7 @@ class Profile(WriteOnlyProfile):
         """
         try:
             color = iterm2.color.Color()
-            color.from_dict(self.__props[key])
+            color.from_dict(self._get(key))
             return color
         except ValueError:
             return None
@@ -1575,7 +1676,12 @@ class Profile(WriteOnlyProfile):
 
     @property
     def all_properties(self):
-        return dict(self.__props)
+        props = self.__props
+        if len(props) < len(self.__raw):
+            for key, json_value in self.__raw.items():
+                if key not in props:
+                    props[key] = json.loads(json_value)
+        return {key: props[key] for key in self.__raw}
 
     @property
     def foreground_color(self):
@@ -2245,6 +2351,13 @@ class Profile(WriteOnlyProfile):
         :returns: A string identifying this profile"""
         return self._simple_get("Guid")
 
+    @property
+    def tags(self):
+        """Returns the profile's tags.
+
+        :returns: A list of strings. Nested tags are separated by slashes."""
+        return self._simple_get("Tags") or []
+
     @property
     def triggers(self):
         """The triggers.
@@ -0,0 +1,279 @@
+"""Keeps profiles on the client so reading them doesn't require a request each time.
+
+A :class:`ProfileCache` holds the properties of each profile it has
+fetched, keyed by GUID. iTerm2 posts a notification whenever a profile
+changes. The cache drops that profile's entry so the next read fetches it
+again, and only it. Entries are also refetched once they are older than
+the cache's staleness bound, in case a change was missed.
+
+Sessions' profiles are cached by session ID. iTerm2 posts no notification
+when a session's own copy of its profile is changed, so a session's entry is
+dropped when this script changes its profile, when it switches to a profile
+with another name, and when the profile it was copied from changes. Changes
+made to a session's profile by other scripts or in iTerm2's Edit Session
+window are seen only once the entry is older than the staleness bound.
+"""
+import asyncio
+import json
+
+import iterm2.api_pb2
+import iterm2.notifications
+import iterm2.profile
+import iterm2.rpc
+import iterm2.variables
+
+def _value_of(properties, key):
+    for prop in properties:
+        if prop.key == key:
+            return json.loads(prop.json_value)
+    return None
+
+def _guid_of(properties):
+    return _value_of(properties, "Guid")
+
+class _Entry:
+    def __init__(self, properties, time):
+        self.properties = properties
+        self.time = time
+
+class ProfileCache:
+    """Serves profiles from memory, kept current by profile change notifications.
+
+    :param connection: The :class:`iterm2.Connection` to use.
+    :param max_age: The most seconds an entry may be served without being fetched again, or None to rely only on change notifications.
+
+    Example:
+
+      .. code-block:: python
+
+          async with iterm2.ProfileCache(connection, max_age=30) as cache:
+              for profile in await cache.async_get():
+                  print(profile.name)
+    """
+    def __init__(self, connection, max_age=60):
+        self.__connection = connection
+        self.__max_age = max_age
+        # GUID -> _Entry
+        self.__profiles = {}
+        # GUIDs from the last full listing, in order, or None if unknown.
+        self.__guids = None
+        self.__guids_time = None
+        # Session ID -> _Entry
+        self.__sessions = {}
+        # Increases on every change so fetches that raced with one aren't stored.
+        self.__generation = 0
+        self.__tokens = []
+
+    async def __aenter__(self):
+        await self.async_start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, _tb):
+        await self.async_stop()
+
+    @property
+    def max_age(self):
+        """:returns: The most seconds an entry is served without being fetched again, or None for no limit."""
+        return self.__max_age
+
+    async def async_start(self):
+        """Starts watching for profile changes. Not needed when used as a context manager."""
+        async def async_ignore(_connection, _message):
+            pass
+
+        async def async_on_terminate(_connection, message):
+            """Called when a session terminates. Forgets its profile."""
+            self.__sessions.pop(message.uniqueIdentifier, None)
+
+        async def async_on_profile_name(_connection, message):
+            """Called when a session switches profiles. Forgets its profile."""
+            self.invalidate_session(message.identifier)
+
+        # See OutputRateMonitor for why notifications are observed this way.
+        # iTerm2 reports changes to every profile once subscribed for any.
+        iterm2.notifications._get_dispatch_observers().append(self._observe)
+        iterm2.rpc._get_session_profile_write_observers().append(self._observe_session_write)
+        self.__tokens.append(await iterm2.notifications.async_subscribe_to_profile_change_notification(
+            self.__connection,
+            async_ignore,
+            ""))
+        self.__tokens.append(await iterm2.notifications.async_subscribe_to_terminate_session_notification(
+            self.__connection,
+            async_on_terminate))
+        self.__tokens.append(await iterm2.notifications.async_subscribe_to_variable_change_notification(
+            self.__connection,
+            async_on_profile_name,
+            iterm2.variables.VariableScopes.SESSION.value,
+            "profileName",
+            "all"))
+
+    async def async_stop(self):
+        """Stops watching for profile changes and empties the cache."""
+        iterm2.notifications._get_dispatch_observers().remove(self._observe)
+        iterm2.rpc._get_session_profile_write_observers().remove(self._observe_session_write)
+        for token in self.__tokens:
+            await iterm2.notifications.async_unsubscribe(self.__connection, token)
+        self.__tokens = []
+        self.invalidate()
+
+    def invalidate(self, guid=None):
+        """Forgets cached profiles so they are fetched again on the next read.
+
+        :param guid: The GUID of the profile to forget, or None to forget all of them.
+        """
+        self.__generation += 1
+        if guid is None:
+            self.__profiles = {}
+            self.__guids = None
+            self.__sessions = {}
+            return
+        self.__profiles.pop(guid, None)
+        if self.__guids is not None and guid not in self.__guids:
+            # A new profile. The listing must be fetched again to place it.
+            self.__guids = None
+        # A session's profile may be a copy of the one that changed.
+        for session_id, entry in list(self.__sessions.items()):
+            if guid in (_guid_of(entry.properties), _value_of(entry.properties, "Original Guid")):
+                del self.__sessions[session_id]
+
+    def invalidate_session(self, session_id):
+        """Forgets a session's cached profile so it is fetched again on the next read.
+
+        :param session_id: The session ID, or "all" for every session.
+        """
+        self.__generation += 1
+        if session_id == "all":
+            self.__sessions = {}
+        else:
+            self.__sessions.pop(session_id, None)
+
+    def _observe_session_write(self, connection, session_id):
+        if connection is self.__connection:
+            self.invalidate_session(session_id)
+
+    def _observe(self, message):
+        if message.notification.HasField("profile_changed_notification"):
+            self.invalidate(message.notification.profile_changed_notification.guid)
+
+    def _now(self):
+        return asyncio.get_event_loop().time()
+
+    def _fresh(self, time):
+        return self.__max_age is None or self._now() - time <= self.__max_age
+
+    async def _async_fetch(self, guids):
+        """Fetches full profiles and stores them.
+
+        :param guids: The GUIDs to fetch, or None for all.
+
+        :returns: A list of the property lists fetched, in the order the server gave them.
+        """
+        generation = self.__generation
+        time = self._now()
+        response = await iterm2.rpc.async_list_profiles(self.__connection, guids, None)
+        result = []
+        for response_profile in response.list_profiles_response.profiles:
+            properties = list(response_profile.properties)
+            result.append(properties)
+            guid = _guid_of(properties)
+            if guid is not None and generation == self.__generation:
+                self.__profiles[guid] = _Entry(properties, time)
+        if guids is None and generation == self.__generation:
+            self.__guids = [_guid_of(properties) for properties in result]
+            self.__guids_time = time
+        return result
+
+    async def _async_properties(self, guids):
+        """:returns: A list of property lists for the requested profiles, fetching only those not fresh in the cache."""
+        if guids is None:
+            if self.__guids is None or not self._fresh(self.__guids_time):
+                return await self._async_fetch(None)
+            guids = self.__guids
+            listing = True
+        else:
+            listing = False
+        missing = [guid for guid in guids
+                   if guid not in self.__profiles or not self._fresh(self.__profiles[guid].time)]
+        fetched = {}
+        missing_set = set(missing)
+        if missing:
+            for properties in await self._async_fetch(missing):
+                fetched[_guid_of(properties)] = properties
+        result = []
+        for guid in guids:
+            if guid in fetched:
+                result.append(fetched[guid])
+            elif guid in self.__profiles and guid not in missing_set:
+                result.append(self.__profiles[guid].properties)
+        if listing and len(result) < len(guids):
+            # Some profiles were deleted.
+            self.__guids = [_guid_of(properties) for properties in result]
+        return result
+
+    async def async_get(self, guids=None):
+        """Gets full profiles, like :meth:`iterm2.Profile.async_get`.
+
+        :param guids: The GUIDs of the profiles to get, or None for all of them.
+
+        :returns: A list of :class:`iterm2.Profile` objects. Unknown GUIDs are left out.
+        """
+        return [iterm2.profile.Profile(None, self.__connection, properties)
+                for properties in await self._async_properties(guids)]
+
+    async def async_get_partial(self, guids=None, properties=["Guid", "Name"]):
+        """Gets profiles with only some properties, like :meth:`iterm2.PartialProfile.async_get`.
+
+        Full profiles are cached, so asking for different properties later doesn't need another request.
+
+        :param guids: The GUIDs of the profiles to get, or None for all of them.
+        :param properties: The keys of the properties to include, or None for all.
+
+        :returns: A list of :class:`iterm2.PartialProfile` objects.
+        """
+        keys = None if properties is None else set(properties)
+        return [iterm2.profile.PartialProfile(
+                    None,
+                    self.__connection,
+                    [prop for prop in profile_properties if keys is None or prop.key in keys])
+                for profile_properties in await self._async_properties(guids)]
+
+    async def async_get_session_profile(self, session):
+        """Gets the profile of a session, like :meth:`iterm2.Session.async_get_profile`.
+
+        :param session: The :class:`iterm2.Session`.
+
+        :returns: A :class:`iterm2.Profile`.
+
+        :throws: :class:`iterm2.rpc.RPCException` if something goes wrong.
+        """
+        session_id = session.session_id
+        entry = self.__sessions.get(session_id)
+        if entry is None or not self._fresh(entry.time):
+            generation = self.__generation
+            time = self._now()
+            response = await iterm2.rpc.async_get_profile(self.__connection, session_id)
+            status = response.get_profile_property_response.status
+            if status != iterm2.api_pb2.GetProfilePropertyResponse.Status.Value("OK"):
+                raise iterm2.rpc.RPCException(
+                    iterm2.api_pb2.GetProfilePropertyResponse.Status.Name(status))
+            entry = _Entry(list(response.get_profile_property_response.properties), time)
+            if generation == self.__generation:
+                self.__sessions[session_id] = entry
+        return iterm2.profile.Profile(session_id, self.__connection, entry.properties)
+
+async def async_get_profile_cache(connection, max_age=60):
+    """Returns the :class:`ProfileCache` shared by this script for a connection, starting it if needed.
+
+    :param connection: The :class:`iterm2.Connection` to use.
+    :param max_age: The staleness bound to use if the cache is created by this call.
+
+    :returns: A running :class:`ProfileCache`.
+    """
+    if not hasattr(async_get_profile_cache, 'caches'):
+        async_get_profile_cache.caches = {}
+    cache = async_get_profile_cache.caches.get(connection)
+    if cache is None:
+        cache = ProfileCache(connection, max_age)
+        async_get_profile_cache.caches[connection] = cache
+        await cache.async_start()
+    return cache
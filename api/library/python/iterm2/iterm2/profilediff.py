@@ -0,0 +1,281 @@
+"""Applies profile changes to many sessions, sending only what differs.
+
+For each session, only the keys the target sets are fetched. They are
+compared with the target, and the keys that differ are sent in one request
+with :meth:`iterm2.profile.WriteOnlyProfile.async_set_properties`. Sessions
+that already match are left alone.
+
+iTerm2 lets a session change only some of its profile's keys, such as
+colors, cursor and transparency settings, but not fonts, key mappings, or
+its command. When copying a full :class:`iterm2.Profile`, other keys are
+left out and reported in :attr:`ProfileApplyResult.skipped_keys`.
+"""
+import asyncio
+import json
+
+import iterm2.api_pb2
+import iterm2.app
+import iterm2.profile
+import iterm2.rpc
+
+# Keys that identify a profile rather than describe how it looks. They are
+# not copied when the target is a full Profile.
+_IDENTITY_KEYS = {
+    "Guid",
+    "Original Guid",
+    "Name",
+    "Dynamic Profile Parent Name",
+    "Dynamic Profile Filename",
+}
+
+# Keys a session's profile may be changed in. This must match
+# +[iTermProfilePreferences valueIsLegal:forKey:], which rejects the whole
+# request if any other key is set.
+_SESSION_KEYS = frozenset([
+    # Strings
+    "Name",
+    "Badge Text",
+    "Answerback String",
+    # Colors
+    "Foreground Color",
+    "Background Color",
+    "Bold Color",
+    "Link Color",
+    "Selection Color",
+    "Selected Text Color",
+    "Cursor Color",
+    "Cursor Text Color",
+    "Ansi 0 Color",
+    "Ansi 1 Color",
+    "Ansi 2 Color",
+    "Ansi 3 Color",
+    "Ansi 4 Color",
+    "Ansi 5 Color",
+    "Ansi 6 Color",
+    "Ansi 7 Color",
+    "Ansi 8 Color",
+    "Ansi 9 Color",
+    "Ansi 10 Color",
+    "Ansi 11 Color",
+    "Ansi 12 Color",
+    "Ansi 13 Color",
+    "Ansi 14 Color",
+    "Ansi 15 Color",
+    "Cursor Guide Color",
+    "Badge Color",
+    "Tab Color",
+    "Underline Color",
+    # Numbers
+    "Use Cursor Guide",
+    "Use Tab Color",
+    "Use Underline Color",
+    "Smart Cursor Color",
+    "Minimum Contrast",
+    "Cursor Boost",
+    "Cursor Type",
+    "Blinking Cursor",
+    "Use Bold Font",
+    "Thin Strokes",
+    "ASCII Ligatures",
+    "Non-ASCII Ligatures",
+    "Use Bright Bold",
+    "Blink Allowed",
+    "Use Italic Font",
+    "Ambiguous Double Width",
+    "Unicode Normalization",
+    "Horizontal Spacing",
+    "Vertical Spacing",
+    "Use Non-ASCII Font",
+    "Transparency",
+    "Blur",
+    "Blur Radius",
+    "Background Image Is Tiled",
+    "Background Image Mode",
+    "Blend",
+    "Sync Title",
+    "Disable Window Resizing",
+    "Only The Default BG Color Uses Transparency",
+    "ASCII Anti Aliased",
+    "Non-ASCII Anti Aliased",
+    "Scrollback Lines",
+    "Unlimited Scrollback",
+    "Scrollback With Status Bar",
+    "Scrollback in Alternate Screen",
+    "Character Encoding",
+    "Mouse Reporting",
+    "Mouse Reporting allow mouse wheel",
+    "Unicode Version",
+    "Allow Title Reporting",
+    "Allow Title Setting",
+    "Disable Printing",
+    "Disable Smcup Rmcup",
+    "Silence Bell",
+    "BM Growl",
+    "Send Bell Alert",
+    "Send Idle Alert",
+    "Send New Output Alert",
+    "Send Session Ended Alert",
+    "Send Terminal Generated Alerts",
+    "Flashing Bell",
+    "Visual Bell",
+    "Close Sessions On End",
+    "Prompt Before Closing 2",
+    "Session Close Undo Timeout",
+    "Reduce Flicker",
+    "Show Status Bar",
+    "Send Code When Idle",
+    "Idle Code",
+    "Idle Period",
+    "Option Key Sends",
+    "Right Option Key Sends",
+    "Application Keypad Allowed",
+    "Place Prompt at First Column",
+    "Show Mark Indicators",
+    "Draw Powerline Glyphs",
+    # Dictionaries
+    "Status Bar Layout",
+])
+
+class ProfileApplyResult:
+    """What happened when changes were applied to one session."""
+    def __init__(self, session_id, changed_keys, exception, skipped_keys):
+        self.__session_id = session_id
+        self.__changed_keys = changed_keys
+        self.__exception = exception
+        self.__skipped_keys = skipped_keys
+
+    def __repr__(self):
+        if self.__exception is not None:
+            return "<ProfileApplyResult {} failed: {!r}>".format(self.__session_id, self.__exception)
+        return "<ProfileApplyResult {} changed {}>".format(self.__session_id, self.__changed_keys)
+
+    @property
+    def session_id(self):
+        """:returns: The session ID."""
+        return self.__session_id
+
+    @property
+    def changed_keys(self):
+        """:returns: A list of the keys that were sent, or None if the session failed before they were known."""
+        return self.__changed_keys
+
+    @property
+    def skipped_keys(self):
+        """:returns: A list of the target's keys that were not compared or sent because a session's profile can't be changed in them."""
+        return self.__skipped_keys
+
+    @property
+    def exception(self):
+        """:returns: The exception that stopped this session, or None if it succeeded."""
+        return self.__exception
+
+    @property
+    def succeeded(self):
+        """:returns: True if the session now matches the target, except for :attr:`skipped_keys`."""
+        return self.__exception is None
+
+def _target_values(target):
+    """Finds the values to copy from a target.
+
+    :param target: A :class:`iterm2.LocalWriteOnlyProfile` or :class:`iterm2.Profile`.
+
+    :returns: (values, skipped keys). Values is a dict from key to decoded
+        value. For a Profile, keys a session can't change are left out of
+        it and listed in skipped keys, sorted.
+    """
+    if isinstance(target, iterm2.profile.LocalWriteOnlyProfile):
+        return {key: json.loads(value) for key, value in target.values.items() if key is not None}, []
+    values = {}
+    skipped = []
+    for key, value in target.all_properties.items():
+        if key in _IDENTITY_KEYS:
+            continue
+        if key in _SESSION_KEYS:
+            values[key] = value
+        else:
+            skipped.append(key)
+    return values, sorted(skipped)
+
+def diff_profile(target, current):
+    """Finds the properties a profile needs to change to match a target.
+
+    :param target: A :class:`iterm2.LocalWriteOnlyProfile` giving the values wanted, or a :class:`iterm2.Profile` to copy. A Profile's GUID, name, and dynamic profile keys are not copied, nor are keys a session's profile can't be changed in, such as fonts and key mappings.
+    :param current: The :class:`iterm2.Profile` to compare with. It only needs the target's keys.
+
+    :returns: A :class:`iterm2.LocalWriteOnlyProfile` holding only the keys whose values differ.
+    """
+    values, _skipped = _target_values(target)
+    return _diff(values, current)
+
+def _diff(values, current):
+    changes = iterm2.profile.LocalWriteOnlyProfile()
+    for key, value in values.items():
+        if current._simple_get(key) != value:
+            changes._simple_set(key, value)
+    return changes
+
+async def async_apply_profile(connection, target, sessions=None, concurrency=16):
+    """Makes many sessions' profiles match a target, changing only what differs.
+
+    Sessions are processed concurrently. A failure in one session is
+    reported in its result and does not stop the others. Each session's
+    changes are applied together or not at all.
+
+    :param connection: The :class:`iterm2.Connection` to use.
+    :param target: A :class:`iterm2.LocalWriteOnlyProfile` giving the values wanted, or a :class:`iterm2.Profile` to copy. See :func:`diff_profile`.
+    :param sessions: A list of :class:`iterm2.Session` to change, or None for every session, including buried ones.
+    :param concurrency: The maximum number of sessions to work on at once.
+
+    :returns: A dict from session ID to :class:`ProfileApplyResult`.
+
+    Example:
+
+      .. code-block:: python
+
+          look = iterm2.LocalWriteOnlyProfile()
+          look.set_background_color(iterm2.Color(0, 0, 40))
+          look.set_transparency(0.1)
+          results = await iterm2.async_apply_profile(connection, look)
+          for result in results.values():
+              if not result.succeeded:
+                  print(result.session_id, result.exception)
+    """
+    if sessions is None:
+        app = await iterm2.app.async_get_app(connection)
+        sessions = []
+        for window in app.terminal_windows:
+            for tab in window.tabs:
+                sessions.extend(tab.sessions)
+        sessions.extend(app.buried_sessions)
+
+    values, skipped_keys = _target_values(target)
+    keys = list(values.keys())
+    if not keys:
+        return {session.session_id: ProfileApplyResult(session.session_id, [], None, skipped_keys)
+                for session in sessions}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def async_apply_one(session_id):
+        changed_keys = None
+        try:
+            async with semaphore:
+                response = await iterm2.rpc.async_get_profile(connection, session_id, keys)
+                status = response.get_profile_property_response.status
+                if status != iterm2.api_pb2.GetProfilePropertyResponse.Status.Value("OK"):
+                    raise iterm2.rpc.RPCException(
+                        iterm2.api_pb2.GetProfilePropertyResponse.Status.Name(status))
+                current = iterm2.profile.Profile(
+                    session_id,
+                    connection,
+                    response.get_profile_property_response.properties)
+                changes = _diff(values, current)
+                changed_keys = list(changes.values.keys())
+                if changed_keys:
+                    await current.async_set_properties(changes)
+        except Exception as e:
+            return ProfileApplyResult(session_id, changed_keys, e, skipped_keys)
+        return ProfileApplyResult(session_id, changed_keys, None, skipped_keys)
+
+    session_ids = [session.session_id for session in sessions]
+    results = await asyncio.gather(*[async_apply_one(session_id) for session_id in session_ids])
+    return dict(zip(session_ids, results))
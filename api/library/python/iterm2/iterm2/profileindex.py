@@ -0,0 +1,290 @@
+"""Finds profiles by name or tag without asking iTerm2 each time.
+
+A :class:`ProfileIndex` fetches only the few properties it needs for every
+profile once. It then keeps them current by fetching again only the
+profiles that iTerm2 reports as changed. Lookups are answered locally:
+
+* By name prefix, from a sorted list of lowercased names.
+* By approximate name, from an inverted index of the three-character
+  sequences (trigrams) in each name. Names are ranked by how many trigrams
+  they share with the query.
+* By tag. A tag also matches the tags nested under it, so `"prod"` finds
+  profiles tagged `"prod/web"`.
+
+Lookups return GUIDs. Use :meth:`ProfileIndex.profile` to get a profile's
+name, for example to pass to :meth:`iterm2.Window.async_create_tab`.
+"""
+import asyncio
+import bisect
+import collections
+import re
+
+import iterm2.notifications
+import iterm2.profile
+
+def _trigrams(text):
+    """:returns: The set of trigrams of a string.
+
+    Case is ignored and punctuation counts as a space, so "Web-Prod" and
+    "web prod" match. The string is padded so short strings and the starts
+    of words count."""
+    padded = "  " + " ".join(re.findall(r"\w+", text.lower())) + " "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class ProfileIndex:
+    """A local index of profiles for lookups by name and tag.
+
+    :param connection: The :class:`iterm2.Connection` to use.
+    :param properties: Keys of more properties to fetch and keep for each profile, beyond its GUID, name, and tags.
+
+    If updating the index after a change fails, the next lookup raises the
+    exception. The changed profiles are fetched again on the next change
+    or by :meth:`async_refresh`.
+
+    Example:
+
+      .. code-block:: python
+
+          async with iterm2.ProfileIndex(connection) as index:
+              guids = index.search_fuzzy("web-12 prod", limit=1)
+              if guids:
+                  await window.async_create_tab(profile=index.profile(guids[0]).name)
+    """
+    def __init__(self, connection, properties=None):
+        self.__connection = connection
+        self.__properties = ["Guid", "Name", "Tags"] + list(properties or [])
+        # GUID -> PartialProfile
+        self.__profiles = {}
+        # Sorted list of (lowercased name, GUID).
+        self.__names = []
+        # Trigram -> set of GUIDs
+        self.__trigrams = collections.defaultdict(set)
+        # GUID -> number of trigrams in its name
+        self.__trigram_counts = {}
+        # Lowercased tag -> set of GUIDs
+        self.__tags = collections.defaultdict(set)
+        self.__pending = set()
+        self.__refresh_task = None
+        # The exception from the last failed update after a change, until a lookup raises it.
+        self.__refresh_error = None
+        self.__tokens = []
+
+    async def __aenter__(self):
+        await self.async_start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, _tb):
+        await self.async_stop()
+
+    def __len__(self):
+        return len(self.__profiles)
+
+    @property
+    def guids(self):
+        """:returns: A list of the GUIDs of all indexed profiles."""
+        self._raise_refresh_error()
+        return list(self.__profiles.keys())
+
+    def profile(self, guid):
+        """:returns: The :class:`iterm2.PartialProfile` with a GUID, holding only the indexed properties, or None if not indexed."""
+        self._raise_refresh_error()
+        return self.__profiles.get(guid)
+
+    async def async_start(self):
+        """Indexes all profiles and starts following changes. Not needed when used as a context manager."""
+        async def async_ignore(_connection, _message):
+            pass
+
+        # See OutputRateMonitor for why notifications are observed this way.
+        # iTerm2 reports changes to every profile once subscribed for any.
+        iterm2.notifications._get_dispatch_observers().append(self._observe)
+        self.__tokens.append(await iterm2.notifications.async_subscribe_to_profile_change_notification(
+            self.__connection,
+            async_ignore,
+            ""))
+        await self.async_refresh()
+
+    async def async_stop(self):
+        """Stops following changes. The index keeps its contents."""
+        iterm2.notifications._get_dispatch_observers().remove(self._observe)
+        for token in self.__tokens:
+            await iterm2.notifications.async_unsubscribe(self.__connection, token)
+        self.__tokens = []
+        if self.__refresh_task is not None:
+            self.__refresh_task.cancel()
+            self.__refresh_task = None
+
+    async def async_refresh(self, guids=None):
+        """Fetches profiles and updates the index.
+
+        Profiles that failed to update after a change are fetched again too.
+
+        :param guids: The GUIDs of the profiles to fetch again, or None to rebuild the whole index. Profiles among `guids` that no longer exist are removed, and new ones are added.
+
+        :throws: :class:`iterm2.rpc.RPCException` if something goes wrong.
+        """
+        failed = set(self.__pending) if self.__refresh_task is None else set()
+        if guids is not None:
+            guids = list(set(guids) | failed)
+        profiles = await iterm2.profile.PartialProfile.async_get(
+            self.__connection,
+            guids,
+            self.__properties)
+        if guids is None:
+            self.__profiles = {}
+            self.__names = []
+            self.__trigrams = collections.defaultdict(set)
+            self.__trigram_counts = {}
+            self.__tags = collections.defaultdict(set)
+            stale = set()
+        else:
+            stale = set(guids)
+        for profile in profiles:
+            guid = profile.guid
+            if guid is None:
+                continue
+            stale.discard(guid)
+            self._remove(guid)
+            self._add(profile)
+        for guid in stale:
+            self._remove(guid)
+        self.__pending -= failed
+        self.__refresh_error = None
+
+    def _observe(self, message):
+        if not message.notification.HasField("profile_changed_notification"):
+            return
+        self.__pending.add(message.notification.profile_changed_notification.guid)
+        if self.__refresh_task is None:
+            self.__refresh_task = asyncio.ensure_future(self._async_refresh_pending())
+
+    async def _async_refresh_pending(self):
+        """Fetches the profiles reported as changed, including any reported while fetching.
+
+        If fetching fails, the GUIDs are kept so the next change notification
+        or :meth:`async_refresh` tries them again, and the exception is kept
+        for the next lookup to raise."""
+        try:
+            while self.__pending:
+                guids = list(self.__pending)
+                self.__pending = set()
+                try:
+                    await self.async_refresh(guids)
+                except asyncio.CancelledError:
+                    self.__pending |= set(guids)
+                    raise
+                except Exception as e:
+                    self.__pending |= set(guids)
+                    self.__refresh_error = e
+                    return
+        finally:
+            self.__refresh_task = None
+
+    def _raise_refresh_error(self):
+        """Raises the exception from the last failed update after a change, once."""
+        if self.__refresh_error is not None:
+            error = self.__refresh_error
+            self.__refresh_error = None
+            raise error
+
+    def _add(self, profile):
+        guid = profile.guid
+        name = (profile.name or "").lower()
+        self.__profiles[guid] = profile
+        bisect.insort(self.__names, (name, guid))
+        trigrams = _trigrams(name)
+        self.__trigram_counts[guid] = len(trigrams)
+        for trigram in trigrams:
+            self.__trigrams[trigram].add(guid)
+        for tag in profile.tags:
+            self.__tags[tag.lower()].add(guid)
+
+    def _remove(self, guid):
+        profile = self.__profiles.pop(guid, None)
+        if profile is None:
+            return
+        name = (profile.name or "").lower()
+        i = bisect.bisect_left(self.__names, (name, guid))
+        if i < len(self.__names) and self.__names[i] == (name, guid):
+            del self.__names[i]
+        del self.__trigram_counts[guid]
+        for trigram in _trigrams(name):
+            postings = self.__trigrams.get(trigram)
+            if postings is not None:
+                postings.discard(guid)
+                if not postings:
+                    del self.__trigrams[trigram]
+        for tag in profile.tags:
+            postings = self.__tags.get(tag.lower())
+            if postings is not None:
+                postings.discard(guid)
+                if not postings:
+                    del self.__tags[tag.lower()]
+
+    def search_prefix(self, prefix, limit=None):
+        """Finds profiles whose names begin with a prefix, ignoring case.
+
+        :param prefix: The beginning of the name.
+        :param limit: The most GUIDs to return, or None for no limit.
+
+        :returns: A list of GUIDs, in order of name.
+        """
+        self._raise_refresh_error()
+        prefix = prefix.lower()
+        result = []
+        i = bisect.bisect_left(self.__names, (prefix,))
+        while i < len(self.__names) and self.__names[i][0].startswith(prefix):
+            if limit is not None and len(result) >= limit:
+                break
+            result.append(self.__names[i][1])
+            i += 1
+        return result
+
+    def search_fuzzy(self, query, limit=10, min_similarity=0.3):
+        """Finds profiles whose names are similar to a query, ignoring case.
+
+        Similarity is the Dice coefficient of the trigram sets of the query
+        and the name: 1 for the same trigrams, 0 for none in common. Only
+        names sharing at least one trigram with the query are scored.
+        Punctuation is treated as a space.
+
+        :param query: The text to look for.
+        :param limit: The most GUIDs to return, or None for no limit.
+        :param min_similarity: Leave out profiles less similar than this.
+
+        :returns: A list of GUIDs, most similar first.
+        """
+        self._raise_refresh_error()
+        query_trigrams = _trigrams(query)
+        shared = collections.Counter()
+        for trigram in query_trigrams:
+            postings = self.__trigrams.get(trigram)
+            if postings:
+                shared.update(postings)
+        scored = []
+        for guid, count in shared.items():
+            similarity = 2.0 * count / (len(query_trigrams) + self.__trigram_counts[guid])
+            if similarity >= min_similarity:
+                scored.append((-similarity, guid))
+        scored.sort()
+        if limit is not None:
+            scored = scored[:limit]
+        return [guid for _similarity, guid in scored]
+
+    def search_tag(self, tag, include_nested=True):
+        """Finds profiles with a tag, ignoring case.
+
+        :param tag: The tag to look for.
+        :param include_nested: If True, also find profiles with tags nested under this one, such as `"prod/web"` for `"prod"`.
+
+        :returns: A list of GUIDs, in order of name.
+        """
+        self._raise_refresh_error()
+        tag = tag.lower()
+        guids = set(self.__tags.get(tag, ()))
+        if include_nested:
+            nested = tag + "/"
+            for other, postings in self.__tags.items():
+                if other.startswith(nested):
+                    guids |= postings
+        return sorted(guids, key=lambda guid: ((self.__profiles[guid].name or "").lower(), guid))
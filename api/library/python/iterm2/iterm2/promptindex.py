@@ -0,0 +1,283 @@
+"""Keeps track of where each command and its output are in a session.
+
+The server only reports the most recent prompt, so a :class:`PromptIndex`
+asks for it each time a prompt notification arrives and remembers it. When
+the next prompt arrives, the earlier command is complete: its output ends
+where the new prompt begins. The command's text and the start of its output
+are then read from the few rows holding the command.
+
+This requires shell integration. Only commands whose prompts appear after
+the index starts are known. When a session with no recorded commands is
+looked up, its most recent prompt is fetched and recorded, so the latest
+command is known even if the index started after it.
+"""
+import asyncio
+import collections
+
+import iterm2.api_pb2
+import iterm2.notifications
+import iterm2.rpc
+import iterm2.screen
+import iterm2.util
+
+class CommandRecord:
+    """Describes one command and where its output is.
+
+    Line numbers are absolute, counting lines lost from the head of history.
+    """
+    def __init__(self, prompt_line, command_start, working_directory):
+        self._prompt_line = prompt_line
+        self._command_start = command_start
+        self._working_directory = working_directory
+        self._command = None
+        self._output_start = None
+        self._output_end = None
+
+    def __repr__(self):
+        return "<CommandRecord prompt_line={} command={!r} output=[{}, {})>".format(
+            self._prompt_line, self._command, self._output_start, self._output_end)
+
+    @property
+    def prompt_line(self):
+        """:returns: The line number where the prompt begins."""
+        return self._prompt_line
+
+    @property
+    def command_start(self):
+        """:returns: The :class:`iterm2.util.Point` where the command begins, just after the prompt."""
+        return self._command_start
+
+    @property
+    def working_directory(self):
+        """:returns: The working directory at the prompt, or None if unknown."""
+        return self._working_directory
+
+    @property
+    def command(self):
+        """:returns: The command's text, or None if it hasn't been read yet."""
+        return self._command
+
+    @property
+    def output_start(self):
+        """:returns: The line number where the output begins, or None if it hasn't been found yet."""
+        return self._output_start
+
+    @property
+    def output_end(self):
+        """:returns: The line number after the output, or None if the command is still running."""
+        return self._output_end
+
+    @property
+    def finished(self):
+        """:returns: True if a later prompt has appeared, so the output is complete."""
+        return self._output_end is not None
+
+class _SessionCommands:
+    def __init__(self, max_commands):
+        self.records = collections.deque(maxlen=max_commands)
+        self.lock = asyncio.Lock()
+
+class PromptIndex:
+    """Records the commands run in each session.
+
+    Use :func:`async_get_prompt_index` to get one shared by the whole
+    script, which :meth:`iterm2.Session.async_get_command_output` uses.
+
+    :param connection: The :class:`iterm2.Connection` to use.
+    :param session: A session ID to watch, or None to watch all sessions.
+    :param max_commands: The most commands to remember per session. The oldest are forgotten first.
+    :param max_command_lines: The most rows a command line may span.
+
+    Example:
+
+      .. code-block:: python
+
+          async with iterm2.PromptIndex(connection) as index:
+              await asyncio.sleep(60)
+              for record in index.commands(session.session_id):
+                  print(record.command, record.output_start, record.output_end)
+    """
+    def __init__(self, connection, session=None, max_commands=1000, max_command_lines=50):
+        self.__connection = connection
+        self.__session = session
+        self.__max_commands = max_commands
+        self.__max_command_lines = max_command_lines
+        self.__sessions = {}
+        self.__tokens = []
+
+    async def __aenter__(self):
+        await self.async_start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, _tb):
+        await self.async_stop()
+
+    async def async_start(self):
+        """Starts watching for prompts. Not needed when used as a context manager."""
+        async def async_ignore(_connection, _message):
+            pass
+
+        async def async_on_terminate(_connection, message):
+            """Called when a session terminates. Forgets its commands."""
+            self.__sessions.pop(message.uniqueIdentifier, None)
+
+        # See OutputRateMonitor for why notifications are observed this way.
+        iterm2.notifications._get_dispatch_observers().append(self._observe)
+        self.__tokens.append(await iterm2.notifications.async_subscribe_to_prompt_notification(
+            self.__connection,
+            async_ignore,
+            self.__session))
+        self.__tokens.append(await iterm2.notifications.async_subscribe_to_terminate_session_notification(
+            self.__connection,
+            async_on_terminate))
+
+    async def async_stop(self):
+        """Stops watching for prompts."""
+        iterm2.notifications._get_dispatch_observers().remove(self._observe)
+        for token in self.__tokens:
+            await iterm2.notifications.async_unsubscribe(self.__connection, token)
+        self.__tokens = []
+
+    def commands(self, session_id):
+        """:returns: A list of :class:`CommandRecord` for a session, oldest first. The last one may still be running."""
+        state = self.__sessions.get(session_id)
+        if state is None:
+            return []
+        return list(state.records)
+
+    async def async_get_command(self, session_id, n):
+        """Looks up a command, filling in its text if it isn't known yet.
+
+        :param session_id: The session ID.
+        :param n: The index of the command, as in :meth:`commands`. Negative values count from the end, so -1 is the latest.
+
+        If no commands have been recorded for the session, its most recent
+        prompt is fetched and recorded first.
+
+        :returns: A :class:`CommandRecord`.
+
+        :throws: IndexError if there is no such command, or :class:`iterm2.rpc.RPCException` if something goes wrong.
+        """
+        state = self.__sessions.get(session_id)
+        if state is None or not state.records:
+            await self._async_record_prompt(session_id)
+            state = self.__sessions.get(session_id)
+        if state is None or not state.records:
+            raise IndexError(
+                "No prompt found in session {}. Shell integration must be installed.".format(session_id))
+        try:
+            record = state.records[n]
+        except IndexError:
+            raise IndexError("Only {} commands are recorded for session {}".format(len(state.records), session_id))
+        if record._output_start is None:
+            await self._async_read_command(session_id, record, None)
+        return record
+
+    def _observe(self, message):
+        if not message.notification.HasField("prompt_notification"):
+            return
+        session_id = message.notification.prompt_notification.session
+        if self.__session is not None and session_id != self.__session:
+            return
+        asyncio.ensure_future(self._async_on_prompt(session_id))
+
+    async def _async_on_prompt(self, session_id):
+        try:
+            await self._async_record_prompt(session_id)
+        except iterm2.rpc.RPCException:
+            # Nobody awaits this task, so there's no one to report to.
+            pass
+
+    async def _async_record_prompt(self, session_id):
+        """Fetches the session's most recent prompt and records it if it is new.
+
+        :throws: :class:`iterm2.rpc.RPCException` if something goes wrong.
+        """
+        state = self.__sessions.get(session_id)
+        if state is None:
+            state = _SessionCommands(self.__max_commands)
+            self.__sessions[session_id] = state
+        async with state.lock:
+            response = await iterm2.rpc.async_get_prompt(self.__connection, session_id)
+            prompt = response.get_prompt_response
+            if prompt.status != iterm2.api_pb2.GetPromptResponse.Status.Value("OK"):
+                return
+            if not prompt.HasField("prompt_range"):
+                return
+            prompt_line = prompt.prompt_range.start.y
+            if state.records and state.records[-1].prompt_line == prompt_line:
+                # Already seen.
+                return
+            if prompt.HasField("command_range"):
+                start = prompt.command_range.start
+            else:
+                start = prompt.prompt_range.end
+            if state.records:
+                previous = state.records[-1]
+                previous._output_end = prompt_line
+                try:
+                    await self._async_read_command(session_id, previous, prompt_line)
+                except iterm2.rpc.RPCException:
+                    pass
+            state.records.append(CommandRecord(
+                prompt_line,
+                iterm2.util.Point(start.x, start.y),
+                prompt.working_directory if prompt.HasField("working_directory") else None))
+
+    async def _async_read_command(self, session_id, record, limit):
+        """Reads the rows holding a command to find its text and where its output begins.
+
+        :param limit: A line number at which to stop reading, or None.
+        """
+        first = record.command_start.y
+        end = first + self.__max_command_lines
+        if limit is not None:
+            end = min(end, limit)
+        if end <= first:
+            record._command = ""
+            record._output_start = first
+            return
+        coord_range = iterm2.util.CoordRange(iterm2.util.Point(0, first), iterm2.util.Point(0, end))
+        response = await iterm2.rpc.async_get_screen_contents(
+            self.__connection,
+            session_id,
+            iterm2.util.WindowedCoordRange(coord_range))
+        status = response.get_buffer_response.status
+        if status != iterm2.api_pb2.GetBufferResponse.Status.Value("OK"):
+            raise iterm2.rpc.RPCException(iterm2.api_pb2.GetBufferResponse.Status.Name(status))
+        contents = iterm2.screen.ScreenContents(response.get_buffer_response)
+        first = contents.windowed_coord_range.coordRange.start.y
+        parts = []
+        output_start = end
+        for i in range(contents.number_of_lines):
+            line = contents.line(i)
+            text = line.string
+            if first + i == record.command_start.y:
+                x = min(record.command_start.x, line.number_of_cells)
+                text = text[line.offset_of_cell(x):]
+            parts.append(text)
+            if line.hard_eol:
+                output_start = first + i + 1
+                break
+        record._command = "".join(parts).rstrip()
+        record._output_start = output_start
+
+async def async_get_prompt_index(connection):
+    """Returns the :class:`PromptIndex` shared by this script for a connection, starting it if needed.
+
+    It watches all sessions. Of the commands run before it starts, only the
+    latest in each session can be found, so call this early to have it start
+    recording.
+
+    :param connection: The :class:`iterm2.Connection` to use.
+
+    :returns: A running :class:`PromptIndex`.
+    """
+    if not hasattr(async_get_prompt_index, 'indexes'):
+        async_get_prompt_index.indexes = {}
+    index = async_get_prompt_index.indexes.get(connection)
+    if index is None:
+        index = PromptIndex(connection)
+        async_get_prompt_index.indexes[connection] = index
+        await index.async_start()
+    return index
@@ -0,0 +1,292 @@
+"""Measures how fast sessions produce output and holds back screen consumers when it is too fast.
+
+A command like `yes` or a busy log tail produces screen updates far faster
+than a script can usefully fetch and process the screen. An
+:class:`OutputRateMonitor` counts screen updates per session over a sliding
+window. When a session's rate goes above a threshold it is throttled until
+the rate drops again. A :class:`iterm2.ScreenStreamer` created with a rate
+monitor waits while its session is throttled instead of fetching the screen
+on every update.
+"""
+import asyncio
+import json
+
+import iterm2.notifications
+import iterm2.rpc
+import iterm2.timer
+
+class SlidingWindowCounter:
+    """Counts events over the last `window` seconds.
+
+    The window is divided into `buckets` buckets, so counts are accurate to
+    within `window / buckets` seconds. Adding an event and reading the count
+    take constant time.
+
+    :param window: The length of the window in seconds.
+    :param buckets: The number of buckets the window is divided into.
+    """
+    def __init__(self, window, buckets=10):
+        self.__window = window
+        self.__width = window / buckets
+        self.__counts = [0] * buckets
+        self.__newest = None
+        self.__total = 0
+
+    def _advance(self, now):
+        """Empties buckets that have slid out of the window."""
+        index = int(now / self.__width)
+        if self.__newest is None:
+            self.__newest = index
+            return
+        steps = index - self.__newest
+        if steps <= 0:
+            return
+        n = len(self.__counts)
+        if steps >= n:
+            self.__counts = [0] * n
+            self.__total = 0
+        else:
+            for i in range(1, steps + 1):
+                slot = (self.__newest + i) % n
+                self.__total -= self.__counts[slot]
+                self.__counts[slot] = 0
+        self.__newest = index
+
+    def add(self, now, count=1):
+        """Records events.
+
+        :param now: The current time in seconds, e.g., from the event loop's `time()`.
+        :param count: The number of events.
+        """
+        self._advance(now)
+        self.__counts[self.__newest % len(self.__counts)] += count
+        self.__total += count
+
+    def count(self, now):
+        """:returns: The number of events in the window ending at `now`."""
+        self._advance(now)
+        return self.__total
+
+    def rate(self, now):
+        """:returns: Events per second over the window ending at `now`."""
+        return self.count(now) / self.__window
+
+# Transitions kept for async_get. Older ones are dropped, so a monitor used
+# only to throttle streamers doesn't accumulate them.
+_MAX_QUEUED_TRANSITIONS = 1024
+
+class _SessionRate:
+    def __init__(self, window, buckets):
+        self.counter = SlidingWindowCounter(window, buckets)
+        self.throttled = False
+        self.resumed = asyncio.Event()
+        self.resumed.set()
+        self.published = None
+        self.published_time = None
+
+class OutputRateMonitor:
+    """Tracks screen updates per second for each session.
+
+    A session becomes throttled when its rate reaches `threshold` and stays
+    throttled until the rate falls to `resume_threshold`. Rates are sampled
+    using the shared :class:`iterm2.TimerWheel`, so an idle session costs
+    nothing.
+
+    Pass the monitor to :meth:`iterm2.Session.get_screen_streamer` to hold
+    back a :class:`iterm2.ScreenStreamer` while its session is throttled.
+    Updates that arrive while it is held back are coalesced into one.
+
+    :param connection: The :class:`iterm2.Connection` to use.
+    :param threshold: Screen updates per second at which a session is throttled.
+    :param resume_threshold: Screen updates per second at or below which a
+      throttled session resumes. Defaults to half of `threshold`.
+    :param window: The length in seconds of the window rates are measured over.
+    :param session: A session ID to watch, or None to watch all sessions.
+    :param throttled_interval: How often in seconds a throttled consumer may
+      proceed. If None, throttled consumers are paused until the session resumes.
+    :param variable: The name of a session variable, such as `user.outputRate`,
+      in which to publish each session's rate (rounded to an integer) so that
+      other scripts can watch it. It is updated at most once per window. If
+      None, rates are not published.
+
+    Example:
+
+      .. code-block:: python
+
+          async with iterm2.OutputRateMonitor(connection, threshold=50) as rates:
+              async with session.get_screen_streamer(rate_monitor=rates) as streamer:
+                  while True:
+                      contents = await streamer.async_get()
+                      do_something(contents)
+    """
+    def __init__(self, connection, threshold, resume_threshold=None, window=1, session=None, throttled_interval=None, variable=None):
+        self.__connection = connection
+        self.__threshold = threshold
+        if resume_threshold is None:
+            resume_threshold = threshold / 2
+        self.__resume_threshold = resume_threshold
+        self.__window = window
+        self.__buckets = 10
+        self.__session = session
+        self.__throttled_interval = throttled_interval
+        self.__variable = variable
+        self.__wheel = iterm2.timer.get_timer_wheel()
+        self.__sessions = {}
+        self.__queue = asyncio.Queue(maxsize=_MAX_QUEUED_TRANSITIONS)
+        self.__tokens = []
+
+    async def __aenter__(self):
+        async def async_ignore(_connection, _message):
+            pass
+
+        async def async_on_terminate(_connection, message):
+            """Called when a session terminates. Stops tracking it."""
+            self._forget(message.uniqueIdentifier)
+
+        # Screen updates are counted by a dispatch observer rather than the
+        # subscription's callback because callbacks for all sessions are
+        # skipped for sessions that have their own subscriptions, such as
+        # those of screen streamers.
+        iterm2.notifications._get_dispatch_observers().append(self._observe)
+        self.__tokens.append(await iterm2.notifications.async_subscribe_to_screen_update_notification(
+            self.__connection,
+            async_ignore,
+            self.__session))
+        self.__tokens.append(await iterm2.notifications.async_subscribe_to_terminate_session_notification(
+            self.__connection,
+            async_on_terminate))
+        return self
+
+    async def __aexit__(self, exc_type, exc, _tb):
+        iterm2.notifications._get_dispatch_observers().remove(self._observe)
+        for session_id in list(self.__sessions.keys()):
+            self._forget(session_id)
+        for token in self.__tokens:
+            await iterm2.notifications.async_unsubscribe(self.__connection, token)
+        self.__tokens = []
+
+    @property
+    def rates(self):
+        """:returns: A dict from session ID to screen updates per second, for sessions with recent updates."""
+        now = asyncio.get_event_loop().time()
+        return {session_id: state.counter.rate(now) for session_id, state in self.__sessions.items()}
+
+    @property
+    def throttled_sessions(self):
+        """:returns: A set of session IDs that are currently throttled."""
+        return {session_id for session_id, state in self.__sessions.items() if state.throttled}
+
+    def rate(self, session_id):
+        """:returns: Screen updates per second for a session."""
+        state = self.__sessions.get(session_id)
+        if state is None:
+            return 0
+        return state.counter.rate(asyncio.get_event_loop().time())
+
+    def is_throttled(self, session_id):
+        """:returns: True if the session is throttled."""
+        state = self.__sessions.get(session_id)
+        return state is not None and state.throttled
+
+    async def async_get(self):
+        """Waits for a session to become throttled or to resume.
+
+        Transitions are queued until they are fetched, but only the most
+        recent 1024 are kept.
+
+        :returns: A tuple of (session ID, True if throttled or False if resumed).
+        """
+        return await self.__queue.get()
+
+    async def async_wait_if_throttled(self, session_id, since=None):
+        """Returns right away unless the session is throttled.
+
+        If it is throttled, waits until it resumes. If `throttled_interval` was
+        given, waits at most until that long after `since`.
+
+        :param session_id: The session ID.
+        :param since: The event loop time at which the caller last proceeded, or None.
+        """
+        state = self.__sessions.get(session_id)
+        if state is None or not state.throttled:
+            return
+        if self.__throttled_interval is None:
+            await state.resumed.wait()
+            return
+        if since is None:
+            return
+        remaining = since + self.__throttled_interval - asyncio.get_event_loop().time()
+        if remaining <= 0:
+            return
+        try:
+            await asyncio.wait_for(state.resumed.wait(), remaining)
+        except asyncio.TimeoutError:
+            pass
+
+    def _observe(self, message):
+        if not message.notification.HasField("screen_update_notification"):
+            return
+        session_id = message.notification.screen_update_notification.session
+        if self.__session is not None and session_id != self.__session:
+            return
+        state = self.__sessions.get(session_id)
+        if state is None:
+            state = _SessionRate(self.__window, self.__buckets)
+            self.__sessions[session_id] = state
+        now = asyncio.get_event_loop().time()
+        state.counter.add(now)
+        if not state.throttled and state.counter.rate(now) >= self.__threshold:
+            self._set_throttled(session_id, state, True)
+        key = (self, session_id)
+        if key not in self.__wheel:
+            self.__wheel.schedule(key, self.__window / self.__buckets, self._sample, session_id)
+
+    def _sample(self, session_id):
+        """Called periodically while a session has recent updates."""
+        state = self.__sessions.get(session_id)
+        if state is None:
+            return
+        rate = state.counter.rate(asyncio.get_event_loop().time())
+        transition = state.throttled and rate <= self.__resume_threshold
+        if transition:
+            self._set_throttled(session_id, state, False)
+        self._publish(session_id, state, rate, transition or rate == 0)
+        if rate > 0 or state.throttled:
+            self.__wheel.schedule((self, session_id), self.__window / self.__buckets, self._sample, session_id)
+        else:
+            del self.__sessions[session_id]
+
+    def _set_throttled(self, session_id, state, throttled):
+        state.throttled = throttled
+        if throttled:
+            state.resumed.clear()
+        else:
+            state.resumed.set()
+        if self.__queue.full():
+            self.__queue.get_nowait()
+        self.__queue.put_nowait((session_id, throttled))
+
+    def _publish(self, session_id, state, rate, force):
+        """Sets the session variable, at most once per window unless forced."""
+        if self.__variable is None:
+            return
+        value = int(round(rate))
+        if value == state.published:
+            return
+        now = asyncio.get_event_loop().time()
+        if not force and state.published_time is not None and now - state.published_time < self.__window:
+            return
+        state.published = value
+        state.published_time = now
+        asyncio.ensure_future(iterm2.rpc.async_variable(
+            self.__connection,
+            session_id,
+            [(self.__variable, json.dumps(value))],
+            []))
+
+    def _forget(self, session_id):
+        state = self.__sessions.pop(session_id, None)
+        if state is None:
+            return
+        self.__wheel.cancel((self, session_id))
+        state.resumed.set()
@@ -0,0 +1,395 @@
+"""Records the screen of a session and plays recordings back.
+
+A :class:`SessionRecorder` saves a frame each time the screen changes. Most
+frames are stored as the lines that changed since the previous frame, found
+with a :class:`iterm2.ScreenDiffer`. A keyframe holding the whole screen
+starts each chunk of frames, and is also used whenever a delta would be
+larger than the screen itself.
+
+The file begins with a line holding the magic string `iterm2-recording 1`
+and a line of JSON describing the recording. Chunks follow, each a
+little-endian header (uint32 compressed length, float64 time of the first
+frame, uint32 number of frames) and then zlib-compressed JSON, one frame per
+line. The recorder holds only the current chunk in memory. A chunk is
+written when it has `frames_per_chunk` frames or once its first frame is
+`seconds_per_chunk` seconds old, even if the screen has stopped changing, so
+little is lost if the recorder stops unexpectedly.
+
+A :class:`SessionRecording` reads the chunk headers to build an index. To
+show a frame it decompresses only the chunk holding it and replays the
+frames from the chunk's keyframe.
+
+To convert a recording for `asciinema play`, run:
+
+  .. code-block:: bash
+
+      python3 -m iterm2.recorder export recording.itr recording.cast
+"""
+import argparse
+import asyncio
+import bisect
+import json
+import struct
+import sys
+import time
+import zlib
+
+import iterm2.api_pb2
+import iterm2.rpc
+import iterm2.screen
+import iterm2.screendiff
+import iterm2.timer
+
+_MAGIC = b"iterm2-recording 1\n"
+_CHUNK_HEADER = struct.Struct("<IdI")
+
+class RecordedFrame:
+    """The screen at one moment of a recording."""
+    def __init__(self, time, lines, cursor):
+        self.__time = time
+        self.__lines = lines
+        self.__cursor = cursor
+
+    def __repr__(self):
+        return "<RecordedFrame time={:.3f} lines={}>".format(self.__time, len(self.__lines))
+
+    @property
+    def time(self):
+        """:returns: Seconds since the recording started."""
+        return self.__time
+
+    @property
+    def lines(self):
+        """:returns: A list of strings, one per line of the screen."""
+        return self.__lines
+
+    @property
+    def cursor(self):
+        """:returns: The cursor position as an (x, y) tuple, with y counted from the top of the screen."""
+        return self.__cursor
+
+class SessionRecorder:
+    """Records a session's screen to a file.
+
+    :param session: The :class:`iterm2.Session` to record.
+    :param path: The file to write. It is replaced if it exists.
+    :param frames_per_chunk: The most frames to keep in memory before writing them out. Each chunk begins with a keyframe.
+    :param seconds_per_chunk: The longest time a frame is kept in memory before being written out.
+
+    Example:
+
+      .. code-block:: python
+
+          async with iterm2.SessionRecorder(session, "incident.itr"):
+              await asyncio.sleep(600)
+    """
+    def __init__(self, session, path, frames_per_chunk=100, seconds_per_chunk=10):
+        self.__session = session
+        self.__path = path
+        self.__frames_per_chunk = frames_per_chunk
+        self.__seconds_per_chunk = seconds_per_chunk
+        self.__file = None
+        self.__differ = iterm2.screendiff.ScreenDiffer()
+        self.__cursor = None
+        self.__chunk = []
+        self.__chunk_time = None
+        self.__start = None
+        self.__number_of_frames = 0
+        self.__streamer = None
+        self.__task = None
+        self.__wheel = iterm2.timer.get_timer_wheel()
+
+    async def __aenter__(self):
+        self.__file = open(self.__path, "wb")
+        self.__start = asyncio.get_event_loop().time()
+        response = await iterm2.rpc.async_get_buffer_with_screen_contents(
+            self.__session.connection,
+            self.__session.session_id)
+        status = response.get_buffer_response.status
+        if status != iterm2.api_pb2.GetBufferResponse.Status.Value("OK"):
+            self.__file.close()
+            raise iterm2.rpc.RPCException(iterm2.api_pb2.GetBufferResponse.Status.Name(status))
+        contents = iterm2.screen.ScreenContents(response.get_buffer_response)
+        header = {
+            "session": self.__session.session_id,
+            "timestamp": time.time(),
+            "height": contents.number_of_lines,
+            "width": max([contents.line(i).number_of_cells for i in range(contents.number_of_lines)] + [0])}
+        if self.__session.grid_size is not None:
+            header["width"] = self.__session.grid_size.width
+            header["height"] = self.__session.grid_size.height
+        self.__file.write(_MAGIC)
+        self.__file.write(json.dumps(header).encode("utf-8") + b"\n")
+        self._add_frame(contents)
+
+        self.__streamer = self.__session.get_screen_streamer()
+        await self.__streamer.__aenter__()
+        self.__task = asyncio.ensure_future(self._async_record())
+        return self
+
+    async def __aexit__(self, exc_type, exc, _tb):
+        self.__task.cancel()
+        error = None
+        try:
+            await self.__task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            # Usually the session ended. The frames so far are still saved.
+            error = e
+        try:
+            await self.__streamer.__aexit__(exc_type, exc, _tb)
+        finally:
+            self._write_chunk()
+            self.__file.close()
+        if error is not None:
+            raise error
+
+    @property
+    def number_of_frames(self):
+        """:returns: The number of frames recorded so far."""
+        return self.__number_of_frames
+
+    async def _async_record(self):
+        while True:
+            contents = await self.__streamer.async_get()
+            self._add_frame(contents)
+
+    def _add_frame(self, contents):
+        now = asyncio.get_event_loop().time() - self.__start
+        diff = self.__differ.update(contents)
+        cursor = contents.cursor_coord
+        cursor = [cursor.x, cursor.y - contents.windowed_coord_range.coordRange.start.y]
+        if diff.is_empty and cursor == self.__cursor:
+            return
+        lines = [contents.line(i).string for i in range(contents.number_of_lines)]
+        frame = {"t": round(now, 3), "c": cursor}
+        if self.__chunk_time is not None and (len(self.__chunk) >= self.__frames_per_chunk or
+                                              now - self.__chunk_time >= self.__seconds_per_chunk):
+            self._write_chunk()
+        if not self.__chunk or len(diff.changed_lines) >= len(lines):
+            frame["k"] = lines
+        else:
+            frame["e"] = [[edit.old_range.location,
+                           edit.old_range.length,
+                           lines[edit.new_range.location:edit.new_range.location + edit.new_range.length]]
+                          for edit in diff.edits]
+        if not self.__chunk:
+            # The same rounded time as the frame, so readers find the frame in this chunk.
+            self.__chunk_time = frame["t"]
+            # Write the chunk out on time even if no more frames arrive.
+            self.__wheel.schedule((self, "chunk"), self.__seconds_per_chunk, self._write_chunk)
+        self.__chunk.append(frame)
+        self.__cursor = cursor
+        self.__number_of_frames += 1
+
+    def _write_chunk(self):
+        self.__wheel.cancel((self, "chunk"))
+        if not self.__chunk:
+            return
+        data = zlib.compress("".join(json.dumps(frame) + "\n" for frame in self.__chunk).encode("utf-8"))
+        self.__file.write(_CHUNK_HEADER.pack(len(data), self.__chunk_time, len(self.__chunk)))
+        self.__file.write(data)
+        self.__file.flush()
+        self.__chunk = []
+        self.__chunk_time = None
+
+def _apply(lines, frame):
+    """:returns: The lines of a frame, given the lines of the frame before it."""
+    keyframe = frame.get("k")
+    if keyframe is not None:
+        return keyframe
+    result = []
+    i = 0
+    for location, length, new_lines in frame["e"]:
+        result.extend(lines[i:location])
+        result.extend(new_lines)
+        i = location + length
+    result.extend(lines[i:])
+    return result
+
+class SessionRecording:
+    """Reads a recording made by :class:`SessionRecorder`.
+
+    Only the chunk index is held in memory. A chunk that was cut short
+    because the recorder stopped unexpectedly is ignored.
+
+    :param path: The recording file.
+    """
+    def __init__(self, path):
+        self.__file = open(path, "rb")
+        if self.__file.readline() != _MAGIC:
+            self.__file.close()
+            raise ValueError("{} is not a session recording".format(path))
+        self.__header = json.loads(self.__file.readline().decode("utf-8"))
+        # (time of first frame, index of first frame, offset of data, compressed length)
+        self.__chunks = []
+        self.__number_of_frames = 0
+        offset = self.__file.tell()
+        end = self.__file.seek(0, 2)
+        while offset + _CHUNK_HEADER.size <= end:
+            self.__file.seek(offset)
+            length, start, count = _CHUNK_HEADER.unpack(self.__file.read(_CHUNK_HEADER.size))
+            offset += _CHUNK_HEADER.size
+            if offset + length > end:
+                break
+            self.__chunks.append((start, self.__number_of_frames, offset, length))
+            self.__number_of_frames += count
+            offset += length
+        self.__chunk_times = [chunk[0] for chunk in self.__chunks]
+        self.__chunk_frames = [chunk[1] for chunk in self.__chunks]
+        self.__cache = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, _tb):
+        self.close()
+
+    def close(self):
+        """Closes the file."""
+        self.__file.close()
+
+    @property
+    def session_id(self):
+        """:returns: The ID of the session that was recorded."""
+        return self.__header["session"]
+
+    @property
+    def timestamp(self):
+        """:returns: When the recording started, in seconds since the epoch."""
+        return self.__header["timestamp"]
+
+    @property
+    def width(self):
+        """:returns: The width of the screen in cells."""
+        return self.__header["width"]
+
+    @property
+    def height(self):
+        """:returns: The height of the screen in lines."""
+        return self.__header["height"]
+
+    @property
+    def number_of_frames(self):
+        """:returns: The number of frames in the recording."""
+        return self.__number_of_frames
+
+    def _chunk_frames(self, chunk_index):
+        """:returns: A list of RecordedFrame for a chunk. The last one read is cached."""
+        if self.__cache is not None and self.__cache[0] == chunk_index:
+            return self.__cache[1]
+        _start, _first, offset, length = self.__chunks[chunk_index]
+        self.__file.seek(offset)
+        text = zlib.decompress(self.__file.read(length)).decode("utf-8")
+        frames = []
+        lines = []
+        for row in text.split("\n")[:-1]:
+            frame = json.loads(row)
+            lines = _apply(lines, frame)
+            frames.append(RecordedFrame(frame["t"], lines, tuple(frame["c"])))
+        self.__cache = (chunk_index, frames)
+        return frames
+
+    def frame(self, index):
+        """Rebuilds a frame.
+
+        :param index: The index of the frame, from 0 to :attr:`number_of_frames` - 1.
+
+        :returns: A :class:`RecordedFrame`.
+        """
+        if index < 0 or index >= self.__number_of_frames:
+            raise IndexError("frame index out of range")
+        chunk_index = bisect.bisect_right(self.__chunk_frames, index) - 1
+        return self._chunk_frames(chunk_index)[index - self.__chunk_frames[chunk_index]]
+
+    def frame_at(self, seconds):
+        """Rebuilds the frame on screen at a moment.
+
+        :param seconds: Seconds since the recording started.
+
+        :returns: A :class:`RecordedFrame`, or None if the time is before the first frame.
+        """
+        chunk_index = bisect.bisect_right(self.__chunk_times, seconds) - 1
+        if chunk_index < 0:
+            return None
+        frames = self._chunk_frames(chunk_index)
+        i = bisect.bisect_right([frame.time for frame in frames], seconds) - 1
+        # Older recordings stored the chunk's time unrounded, a little after
+        # its first frame's rounded time.
+        return frames[max(i, 0)]
+
+    def frames(self):
+        """:returns: An iterator over all frames, in order, holding one chunk in memory at a time."""
+        for chunk_index in range(len(self.__chunks)):
+            for frame in self._chunk_frames(chunk_index):
+                yield frame
+
+    def export_asciicast(self, output):
+        """Writes the recording in asciicast v2 format, as used by asciinema.
+
+        Each frame becomes output that redraws the lines that changed,
+        scrolling the terminal first when the screen scrolled.
+
+        :param output: A text file object to write to.
+        """
+        output.write(json.dumps({
+            "version": 2,
+            "width": self.width,
+            "height": self.height,
+            "timestamp": int(self.timestamp)}) + "\n")
+        previous = None
+        for frame in self.frames():
+            output.write(json.dumps([frame.time, "o", _frame_output(previous, frame, self.height)]) + "\n")
+            previous = frame
+
+def _scroll_amount(old, new):
+    """:returns: How many lines `old` scrolled up by to become `new`, or 0."""
+    for shift in range(1, len(old)):
+        if old[shift:] == new[:len(old) - shift]:
+            return shift
+    return 0
+
+def _frame_output(previous, frame, height):
+    """:returns: Terminal output that turns the screen from `previous` into `frame`."""
+    parts = []
+    if previous is None:
+        parts.append("\x1b[H\x1b[2J")
+        old = []
+    else:
+        old = previous.lines
+        shift = _scroll_amount(old, frame.lines) if old != frame.lines else 0
+        if shift:
+            parts.append("\x1b[{};1H".format(height) + "\n" * shift)
+            old = old[shift:]
+    for y, line in enumerate(frame.lines):
+        if y < len(old) and old[y] == line:
+            continue
+        parts.append("\x1b[{};1H\x1b[2K{}".format(y + 1, line))
+    x, y = frame.cursor
+    parts.append("\x1b[{};{}H".format(y + 1, x + 1))
+    return "".join(parts)
+
+def _export(args):
+    with SessionRecording(args.recording) as recording:
+        with open(args.output, "w") as output:
+            recording.export_asciicast(output)
+
+def main():
+    """Command-line interface to convert recordings."""
+    parser = argparse.ArgumentParser(description="Converts iTerm2 session recordings.")
+    subparsers = parser.add_subparsers(dest="command")
+
+    export_parser = subparsers.add_parser("export", help="Convert a recording to asciicast v2")
+    export_parser.add_argument("recording", help="Recording file")
+    export_parser.add_argument("output", help="File to write")
+    export_parser.set_defaults(func=_export)
+
+    args = parser.parse_args()
+    if not hasattr(args, "func"):
+        parser.print_help()
+        sys.exit(1)
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
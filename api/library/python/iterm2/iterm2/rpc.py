@@ -143,12 +143,13 @@ async def async_create_tab(connection, profile=None, window=None, index=None, co
         request.create_tab_request.custom_profile_properties.extend(_profile_properties_from_dict(profile_customizations))
     return await _async_call(connection, request)
 
-async def async_get_buffer_with_screen_contents(connection, session=None):
+async def async_get_buffer_with_screen_contents(connection, session=None, since_generation=None):
     """
     Gets the contents of a session's mutable area.
 
     connection: A connected iterm2.Connection.
     session: Session ID to split
+    since_generation: If not None, only lines changed after this generation are returned if possible.
 
     Returns: iterm2.api_pb2.ServerOriginatedMessage
     """
@@ -156,15 +157,18 @@ async def async_get_buffer_with_screen_contents(connection, session=None):
     if session is not None:
         request.get_buffer_request.session = session
     request.get_buffer_request.line_range.screen_contents_only = True
+    if since_generation is not None:
+        request.get_buffer_request.since_generation = since_generation
     return await _async_call(connection, request)
 
-async def async_get_screen_contents(connection, session, windowedCoordRange):
+async def async_get_screen_contents(connection, session, windowedCoordRange, include_styles=False):
     """
     Gets screen contents.
 
     connection: A connected iterm2.Connection.
     session: Session ID
     windowedCoordRange: The range of characters to fetch.
+    include_styles: If True, each line includes runs of colors and attributes.
 
     Returns: iterm2.api_pb2.ServerOriginatedMessage
     """
@@ -172,6 +176,8 @@ async def async_get_screen_contents(connection, session, windowedCoordRange):
     if session is not None:
         request.get_buffer_request.session = session
     request.get_buffer_request.line_range.windowed_coord_range.CopyFrom(windowedCoordRange.proto)
+    if include_styles:
+        request.get_buffer_request.include_styles = True
     return await _async_call(connection, request)
 
 async def async_get_prompt(connection, session=None):
@@ -256,7 +262,29 @@ async def async_set_profile_property(connection, session_id, key, value, guids=N
         request.set_profile_property_request.session = session_id
     request.set_profile_property_request.key = key
     request.set_profile_property_request.json_value = json.dumps(value)
-    return await _async_call(connection, request)
+    return await _async_call_setting_session_profile(connection, session_id, request)
+
+async def async_set_profile_properties(connection, session_id, assignments, guids=None):
+    """
+    Sets several properties of a session's profile in one request. Either all are set or none are,
+    except when session_id is "all": sessions are changed one at a time, so a rejection partway leaves
+    the earlier sessions changed. Older versions of iTerm2 don't understand this request and respond
+    with REQUEST_MALFORMED.
+
+    :param connection: A connected iterm2.Connection.
+    :param session_id: Session ID to modify or None. If None, guids must be set.
+    :param assignments: A dict from key to JSON-encoded value, like LocalWriteOnlyProfile.values.
+    :param guids: List of GUIDs of the profile to modify or None. If None, session_id must be set.
+
+    Returns: iterm2.api_pb2.ServerOriginatedMessage
+    """
+    request = _alloc_request()
+    if session_id is None:
+        request.set_profile_property_request.guid_list.guids.extend(guids);
+    else:
+        request.set_profile_property_request.session = session_id
+    request.set_profile_property_request.assignments.extend(_profile_properties_from_dict(assignments))
+    return await _async_call_setting_session_profile(connection, session_id, request)
 
 async def async_get_profile(connection, session=None, keys=None):
     """
@@ -611,6 +639,28 @@ def _alloc_request():
     request.id = _alloc_id()
     return request
 
+def _get_session_profile_write_observers():
+    """Returns functions called after a request to change a session's profile is answered.
+
+    iTerm2 posts no profile change notification when only a session's copy
+    of its profile changes, so caches of session profiles watch for this
+    script's changes here.
+
+    :returns: [function taking (iterm2.Connection, session ID or "all"), ...]
+    """
+    if not hasattr(_get_session_profile_write_observers, 'observers'):
+        _get_session_profile_write_observers.observers = []
+    return _get_session_profile_write_observers.observers
+
+async def _async_call_setting_session_profile(connection, session_id, request):
+    try:
+        return await _async_call(connection, request)
+    finally:
+        # Even a failed request may have changed some sessions.
+        if session_id is not None:
+            for observer in list(_get_session_profile_write_observers()):
+                observer(connection, session_id)
+
 async def _async_call(connection, request):
     await connection.async_send_message(request)
     response = await connection.async_dispatch_until_id(request.id)
@@ -1,22 +1,52 @@
 """Provides access to screen contents."""
+import array
 import asyncio
+import bisect
 import iterm2.api_pb2
 import iterm2.notifications
 import iterm2.rpc
+import iterm2.screenarray
 import iterm2.util
 
 class LineContents:
     """Describes the contents of a line."""
     def __init__(self, proto):
         self.__proto = proto
-        self.__offset_of_cell = [0]
-        self.__length_of_cell = []
+        # Built on first use. See _index().
+        self.__run_cells = None
+        self.__run_offsets = None
+        self.__run_widths = None
+        self.__styles = None
+
+    def _index(self):
+        """Builds prefix sums over the runs of `code_points_per_cell`.
+
+        For each run this records the index of its first cell, the offset in
+        the text of its first cell, and its code points per cell. That takes
+        space proportional to the number of runs rather than the number of
+        cells. One more entry at the end holds the totals.
+        """
+        if self.__run_cells is not None:
+            return
+        run_cells = array.array("l")
+        run_offsets = array.array("l")
+        run_widths = array.array("l")
+        cell = 0
         offset = 0
-        for cppc in proto.code_points_per_cell:
-            for i in range(cppc.repeats):
-                offset += cppc.num_code_points
-                self.__offset_of_cell.append(offset)
-                self.__length_of_cell.append(cppc.num_code_points)
+        for cppc in self.__proto.code_points_per_cell:
+            if cppc.repeats <= 0:
+                continue
+            run_cells.append(cell)
+            run_offsets.append(offset)
+            run_widths.append(cppc.num_code_points)
+            cell += cppc.repeats
+            offset += cppc.repeats * cppc.num_code_points
+        run_cells.append(cell)
+        run_offsets.append(offset)
+        run_widths.append(0)
+        self.__run_cells = run_cells
+        self.__run_offsets = run_offsets
+        self.__run_widths = run_widths
 
     @property
     def string(self):
@@ -25,15 +55,59 @@ class LineContents:
         """
         return self.__proto.text
 
+    @property
+    def number_of_cells(self):
+        """
+        :returns: The number of cells described by the line, not counting uninitialized cells at its end."""
+        self._index()
+        return self.__run_cells[-1]
+
+    def offset_of_cell(self, x):
+        """Returns the offset in :attr:`string` of the cell at index `x`.
+
+        :param x: The cell index. May equal :attr:`number_of_cells`, giving the length of the text.
+        :returns: An index into :attr:`string`.
+        """
+        self._index()
+        if x < 0 or x > self.__run_cells[-1]:
+            raise IndexError("cell index out of range")
+        run = bisect.bisect_right(self.__run_cells, x) - 1
+        return self.__run_offsets[run] + (x - self.__run_cells[run]) * self.__run_widths[run]
+
+    def cell_at_offset(self, offset):
+        """Returns the index of the cell containing the code point at `offset` in :attr:`string`.
+
+        :param offset: An index into :attr:`string`. May equal the length of the text, giving :attr:`number_of_cells`.
+        :returns: A cell index.
+        """
+        self._index()
+        if offset < 0 or offset > self.__run_offsets[-1]:
+            raise IndexError("text offset out of range")
+        # Runs of cells without code points share their offset with the next
+        # run, so this finds the run that has a code point at `offset` (or
+        # the final entry, for the end of the text).
+        run = bisect.bisect_right(self.__run_offsets, offset) - 1
+        width = self.__run_widths[run]
+        if width == 0:
+            return self.__run_cells[run]
+        return self.__run_cells[run] + (offset - self.__run_offsets[run]) // width
+
     def string_at(self, x):
         """Returns the string of the cell at index `x`.
 
         :param x: The index to look up.
         :returns: A string giving the contents of the cell at that index, or empty string if none.
         """
-        offset = self.__offset_of_cell[x]
-        limit = offset + self.__length_of_cell[x]
-        return self.__proto.text[offset:limit]
+        self._index()
+        n = self.__run_cells[-1]
+        if x < 0:
+            x += n
+        if x < 0 or x >= n:
+            raise IndexError("cell index out of range")
+        run = bisect.bisect_right(self.__run_cells, x) - 1
+        width = self.__run_widths[run]
+        offset = self.__run_offsets[run] + (x - self.__run_cells[run]) * width
+        return self.__proto.text[offset:offset + width]
 
     @property
     def hard_eol(self):
@@ -41,10 +115,111 @@ class LineContents:
         :returns: True if the line has a hard newline. If False, the text of a longer line wraps onto the next line."""
         return self.__proto.continuation == iterm2.api_pb2.LineContents.Continuation.Value("CONTINUATION_HARD_EOL")
 
+    @property
+    def styles(self):
+        """
+        :returns: The :class:`CellStyles` of the line's cells, or None if they weren't requested. Pass `include_styles=True` to :meth:`iterm2.Session.async_get_screen_contents` to get them."""
+        if self.__styles is None:
+            if not self.__proto.style_runs and self.number_of_cells > 0:
+                return None
+            self.__styles = CellStyles(self.__proto.style_runs)
+        return self.__styles
+
+class CellStyles:
+    """The colors and attributes of each cell in a line.
+
+    The server sends runs of cells that share a style. These are expanded
+    into compact arrays with one entry per cell, so looking up a cell's
+    style doesn't create an object.
+
+    A color is an integer whose top byte is its mode. For
+    :data:`COLOR_MODE_ALTERNATE` and :data:`COLOR_MODE_PALETTE` the low byte
+    is the color. For :data:`COLOR_MODE_24BIT` the low three bytes are red,
+    green, and blue. Use :meth:`color_mode` and :meth:`color_value` to take
+    a color apart.
+
+    Don't create this yourself. Use :attr:`LineContents.styles` instead.
+    """
+    BOLD = 1
+    FAINT = 2
+    ITALIC = 4
+    BLINK = 8
+    UNDERLINE = 16
+
+    COLOR_MODE_ALTERNATE = 0
+    COLOR_MODE_PALETTE = 1
+    COLOR_MODE_24BIT = 2
+
+    ALTERNATE_DEFAULT = 0
+    ALTERNATE_SELECTED = 1
+    ALTERNATE_CURSOR = 2
+    ALTERNATE_REVERSED_DEFAULT = 3
+    ALTERNATE_SYSTEM_MESSAGE = 4
+
+    def __init__(self, runs):
+        self.__runs = runs
+        self.__foreground = array.array("L")
+        self.__background = array.array("L")
+        self.__flags = array.array("B")
+        for run in runs:
+            if run.repeats <= 0:
+                continue
+            self.__foreground.extend(array.array("L", [run.foreground]) * run.repeats)
+            self.__background.extend(array.array("L", [run.background]) * run.repeats)
+            self.__flags.extend(array.array("B", [run.flags]) * run.repeats)
+
+    def __len__(self):
+        return len(self.__flags)
+
+    @property
+    def foreground(self):
+        """:returns: An `array.array` of the foreground color of each cell."""
+        return self.__foreground
+
+    @property
+    def background(self):
+        """:returns: An `array.array` of the background color of each cell."""
+        return self.__background
+
+    @property
+    def flags(self):
+        """:returns: An `array.array` of the attributes of each cell. Each is a bitwise OR of :data:`BOLD`, :data:`FAINT`, :data:`ITALIC`, :data:`BLINK`, and :data:`UNDERLINE`."""
+        return self.__flags
+
+    @property
+    def runs(self):
+        """Runs of adjacent cells with the same style, as sent by the server.
+
+        :returns: A list of (first cell, number of cells, foreground, background, flags) tuples."""
+        result = []
+        cell = 0
+        for run in self.__runs:
+            if run.repeats <= 0:
+                continue
+            result.append((cell, run.repeats, run.foreground, run.background, run.flags))
+            cell += run.repeats
+        return result
+
+    @staticmethod
+    def color_mode(color):
+        """:returns: The mode of a color: :data:`COLOR_MODE_ALTERNATE`, :data:`COLOR_MODE_PALETTE`, or :data:`COLOR_MODE_24BIT`."""
+        return color >> 24
+
+    @staticmethod
+    def color_value(color):
+        """Takes a color apart.
+
+        :returns: For :data:`COLOR_MODE_24BIT`, a (red, green, blue) tuple of values from 0 to 255. For :data:`COLOR_MODE_PALETTE`, the index in the 256-color palette. For :data:`COLOR_MODE_ALTERNATE`, one of :data:`ALTERNATE_DEFAULT`, :data:`ALTERNATE_SELECTED`, :data:`ALTERNATE_CURSOR`, :data:`ALTERNATE_REVERSED_DEFAULT`, or :data:`ALTERNATE_SYSTEM_MESSAGE`.
+        """
+        if color >> 24 == CellStyles.COLOR_MODE_24BIT:
+            return ((color >> 16) & 0xff, (color >> 8) & 0xff, color & 0xff)
+        return color & 0xff
+
 class ScreenContents:
     """Describes screen contents."""
     def __init__(self, proto):
         self.__proto = proto
+        self.__lines = [None] * len(proto.contents)
 
     @property
     def windowed_coord_range(self):
@@ -73,7 +248,27 @@ class ScreenContents:
 
         :returns: A :class:`LineContents` object.
         """
-        return LineContents(self.__proto.contents[index])
+        line = self.__lines[index]
+        if line is None:
+            line = LineContents(self.__proto.contents[index])
+            self.__lines[index] = line
+        return line
+
+    def _line_proto(self, index):
+        return self.__proto.contents[index]
+
+    def to_array(self, width=None, fill=0, as_chars=False):
+        """Returns the lines as a two-dimensional NumPy array with one column per cell.
+
+        Requires NumPy. See :mod:`iterm2.screenarray` for functions that operate on the result.
+
+        :param width: The number of columns. Longer lines are cut off. If None, the longest line's number of cells.
+        :param fill: The code point for cells with no contents.
+        :param as_chars: If True, returns an array of one-character strings (dtype `<U1`) instead of code points.
+
+        :returns: A `numpy.ndarray` of shape (:attr:`number_of_lines`, width).
+        """
+        return iterm2.screenarray.screen_contents_to_array(self, width, fill, as_chars)
 
     @property
     def cursor_coord(self):
@@ -89,15 +284,111 @@ class ScreenContents:
         :returns: The number of lines ever received before the top line of the screen."""
         return self.__proto.num_lines_above_screen
 
+class _WrappedLine:
+    """A line that may have been soft-wrapped over several rows.
+
+    Maps offsets in the joined text of the rows back to cells.
+
+    :param rows: A list of (line number, :class:`LineContents`) for consecutive rows. All but the last are soft-wrapped."""
+    def __init__(self, rows):
+        self.rows = rows
+        self.__row_offsets = []
+        offset = 0
+        for _y, line in rows:
+            self.__row_offsets.append(offset)
+            offset += len(line.string)
+        self.text = "".join(line.string for _y, line in rows)
+
+    def _point(self, offset, is_end):
+        # An offset on the boundary between two rows is the end of the
+        # earlier row when it ends a match and the start of the later one
+        # when it begins a match.
+        if is_end and offset > 0:
+            index = bisect.bisect_left(self.__row_offsets, offset) - 1
+        else:
+            index = bisect.bisect_right(self.__row_offsets, offset) - 1
+        y, line = self.rows[index]
+        offset_in_row = offset - self.__row_offsets[index]
+        x = line.cell_at_offset(offset_in_row)
+        if is_end and line.offset_of_cell(x) < offset_in_row:
+            # The range ends partway through a cell with several code points.
+            x += 1
+        return iterm2.util.Point(x, y)
+
+    def coord_range(self, start, end):
+        """:returns: The :class:`iterm2.util.CoordRange` of cells holding `text[start:end]`."""
+        return iterm2.util.CoordRange(self._point(start, False), self._point(end, True))
+
+class _LineCache:
+    """Remembers a session's screen lines by absolute line number.
+
+    Lets a :class:`ScreenStreamer` ask for only the lines that changed since
+    its last fetch and fill in the rest from here."""
+    def __init__(self):
+        self.generation = None
+        self.__lines = {}
+        self.__number_of_lines = 0
+
+    def apply(self, response):
+        """Merges a response into the cache.
+
+        :param response: An iterm2.api_pb2.GetBufferResponse for the screen.
+
+        :returns: An iterm2.api_pb2.GetBufferResponse holding every line of the
+          screen, or None if the response is a delta that needs lines this
+          cache doesn't have.
+        """
+        first = response.windowed_coord_range.coord_range.start.y
+        if not response.delta:
+            lines = list(response.contents)
+            merged = response
+        else:
+            if self.generation is None:
+                return None
+            changed = dict(zip(response.changed_lines, response.contents))
+            lines = []
+            for y in range(first, first + self.__number_of_lines):
+                line = changed.get(y)
+                if line is None:
+                    line = self.__lines.get(y)
+                if line is None:
+                    return None
+                lines.append(line)
+            merged = iterm2.api_pb2.GetBufferResponse()
+            merged.CopyFrom(response)
+            merged.ClearField("delta")
+            merged.ClearField("changed_lines")
+            del merged.contents[:]
+            merged.contents.extend(lines)
+
+        # Lines are keyed by absolute line number, so lines that merely moved
+        # up the screen are still found after scrolling.
+        self.__lines = {first + i: line for i, line in enumerate(lines)}
+        self.__number_of_lines = len(lines)
+        if response.HasField("generation"):
+            self.generation = response.generation
+        else:
+            self.generation = None
+        return merged
+
+    def clear(self):
+        """Forgets all lines so the next fetch gets the whole screen."""
+        self.generation = None
+        self.__lines = {}
+        self.__number_of_lines = 0
+
 class ScreenStreamer:
     """An asyncio context manager for monitoring the screen contents.
 
     Don't create this yourself. Use Session.get_screen_streamer() instead. See
     its docstring for more info."""
-    def __init__(self, connection, session_id, want_contents=True):
+    def __init__(self, connection, session_id, want_contents=True, rate_monitor=None):
         self.connection = connection
         self.session_id = session_id
         self.want_contents = want_contents
+        self.rate_monitor = rate_monitor
+        self.last_time = None
+        self.line_cache = _LineCache()
         self.future = None
         self.token = None
 
@@ -108,6 +399,12 @@ class ScreenStreamer:
             if future is None:
                 # Ignore reentrant calls
                 return
+            if (self.want_contents and
+                    message.HasField("generation") and
+                    self.line_cache.generation is not None and
+                    message.generation <= self.line_cache.generation):
+                # Already fetched contents at least this new.
+                return
 
             self.future = None
             if future is not None and not future.done():
@@ -133,12 +430,25 @@ class ScreenStreamer:
         await self.future
         self.future = None
 
+        if self.rate_monitor is not None:
+            # Updates that arrive while waiting are dropped, so they are
+            # coalesced into this one.
+            await self.rate_monitor.async_wait_if_throttled(self.session_id, self.last_time)
+            self.last_time = asyncio.get_event_loop().time()
+
         if self.want_contents:
-            result = await iterm2.rpc.async_get_buffer_with_screen_contents(
-                self.connection,
-                self.session_id)
-            if result.get_buffer_response.status == iterm2.api_pb2.GetBufferResponse.Status.Value("OK"):
-                return ScreenContents(result.get_buffer_response)
-            else:
-                raise iterm2.rpc.RPCException(iterm2.api_pb2.GetBufferResponse.Status.Name(result.get_buffer_response.status))
+            while True:
+                # Only lines that changed since the last fetch are transferred.
+                result = await iterm2.rpc.async_get_buffer_with_screen_contents(
+                    self.connection,
+                    self.session_id,
+                    self.line_cache.generation)
+                if result.get_buffer_response.status != iterm2.api_pb2.GetBufferResponse.Status.Value("OK"):
+                    self.line_cache.clear()
+                    raise iterm2.rpc.RPCException(iterm2.api_pb2.GetBufferResponse.Status.Name(result.get_buffer_response.status))
+                merged = self.line_cache.apply(result.get_buffer_response)
+                if merged is not None:
+                    return ScreenContents(merged)
+                # The cache lacks lines the delta doesn't include. Fetch everything.
+                self.line_cache.clear()
 
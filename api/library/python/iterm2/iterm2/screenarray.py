@@ -0,0 +1,134 @@
+"""Converts screen contents to NumPy arrays for analysis.
+
+NumPy is optional. It is only imported when one of these functions is
+called. Install it with `pip install iterm2[numpy]`.
+
+A grid is a two-dimensional array of code points with one row per line and
+one column per cell. Each cell holds the first code point of its contents,
+so combining marks are dropped. Cells with no contents, such as those past
+the end of a line or the right half of a double-width character, hold
+`fill`.
+"""
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("This requires NumPy. Install it with `pip install iterm2[numpy]`.")
+    return numpy
+
+def _row(numpy, proto, width, fill):
+    """Returns the code points of one line's cells, padded or cut to `width`."""
+    repeats = []
+    widths = []
+    for cppc in proto.code_points_per_cell:
+        if cppc.repeats > 0:
+            repeats.append(cppc.repeats)
+            widths.append(cppc.num_code_points)
+    row = numpy.full(width, fill, dtype=numpy.uint32)
+    if not repeats:
+        return row
+    code_points = numpy.frombuffer(proto.text.encode("utf-32-le"), dtype="<u4")
+    cell_widths = numpy.repeat(numpy.array(widths, dtype=numpy.int64), repeats)[:width]
+    offsets = numpy.cumsum(cell_widths) - cell_widths
+    occupied = (cell_widths > 0) & (offsets < len(code_points))
+    n = len(cell_widths)
+    row[:n][occupied] = code_points[offsets[occupied]]
+    return row
+
+def screen_contents_to_array(contents, width=None, fill=0, as_chars=False):
+    """Converts a :class:`iterm2.ScreenContents` to a grid.
+
+    Use :meth:`iterm2.ScreenContents.to_array` rather than calling this directly.
+
+    :param contents: The :class:`iterm2.ScreenContents` to convert.
+    :param width: The number of columns. Longer lines are cut off. If None, the longest line's number of cells.
+    :param fill: The code point for cells with no contents.
+    :param as_chars: If True, returns an array of one-character strings (dtype `<U1`) instead of code points.
+
+    :returns: A `numpy.ndarray` of shape (number of lines, width) and dtype `uint32`, or `<U1` if `as_chars` is True.
+    """
+    numpy = _numpy()
+    protos = [contents._line_proto(i) for i in range(contents.number_of_lines)]
+    if width is None:
+        width = max([sum(cppc.repeats for cppc in proto.code_points_per_cell if cppc.repeats > 0) for proto in protos] + [0])
+    grid = numpy.full((len(protos), width), fill, dtype=numpy.uint32)
+    for y, proto in enumerate(protos):
+        grid[y] = _row(numpy, proto, width, fill)
+    if as_chars:
+        return grid.view("<U1")
+    return grid
+
+def _code_points(numpy, grid):
+    if grid.dtype.kind == "U":
+        return grid.view(numpy.uint32)
+    return grid
+
+def blank_mask(grid, blanks=" \0"):
+    """Finds blank cells.
+
+    :param grid: A grid from :meth:`iterm2.ScreenContents.to_array`.
+    :param blanks: Characters that count as blank.
+
+    :returns: A boolean array shaped like `grid` that is True at blank cells.
+    """
+    numpy = _numpy()
+    return numpy.isin(_code_points(numpy, grid), [ord(c) for c in blanks])
+
+def column_occupancy(grid, blanks=" \0"):
+    """Measures how much of each column is filled.
+
+    :param grid: A grid from :meth:`iterm2.ScreenContents.to_array`.
+    :param blanks: Characters that count as blank.
+
+    :returns: A float array with one value per column giving the fraction of rows whose cell there is not blank.
+    """
+    if grid.shape[0] == 0:
+        return _numpy().zeros(grid.shape[1])
+    return 1 - blank_mask(grid, blanks).mean(axis=0)
+
+def column_ranges(grid, min_gap=1, blanks=" \0"):
+    """Finds columns of a table, separated by columns that are blank in every row.
+
+    :param grid: A grid from :meth:`iterm2.ScreenContents.to_array`.
+    :param min_gap: The fewest consecutive blank columns that separate two table columns.
+    :param blanks: Characters that count as blank.
+
+    :returns: A list of :class:`iterm2.Range` giving the cells of each table column, left to right.
+    """
+    import iterm2.util
+    numpy = _numpy()
+    occupied = ~blank_mask(grid, blanks).all(axis=0)
+    # Find the starts and ends of runs of occupied columns.
+    edges = numpy.diff(numpy.concatenate(([0], occupied.astype(numpy.int8), [0])))
+    starts = numpy.flatnonzero(edges == 1)
+    ends = numpy.flatnonzero(edges == -1)
+    ranges = []
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        if ranges and start - (ranges[-1][0] + ranges[-1][1]) < min_gap:
+            ranges[-1] = (ranges[-1][0], end - ranges[-1][0])
+        else:
+            ranges.append((start, end - start))
+    return [iterm2.util.Range(location, length) for location, length in ranges]
+
+def split_columns(grid, ranges, strip=True):
+    """Cuts each row of a grid into strings, one per column range.
+
+    :param grid: A grid from :meth:`iterm2.ScreenContents.to_array`.
+    :param ranges: A list of :class:`iterm2.Range`, such as from :func:`column_ranges`.
+    :param strip: If True, surrounding whitespace is removed from each string.
+
+    :returns: A list with one list of strings per row.
+    """
+    numpy = _numpy()
+    chars = _code_points(numpy, grid)
+    # Empty cells become spaces so they aren't dropped from the strings.
+    chars = numpy.where(chars == 0, ord(" "), chars).astype(numpy.uint32).view("<U1")
+    rows = []
+    for row in chars:
+        cells = []
+        for r in ranges:
+            value = "".join(row[r.location:r.location + r.length].tolist())
+            cells.append(value.strip() if strip else value)
+        rows.append(cells)
+    return rows
@@ -0,0 +1,207 @@
+"""Finds which lines changed between two snapshots of a screen.
+
+Lines are compared by their text and continuation, which are read once
+per snapshot. Two strategies are tried and the one
+that touches fewer lines wins:
+
+* Scrolling: lines are paired by absolute line number, using the start of
+  each snapshot's `windowed_coord_range`. Output that scrolls the screen
+  becomes a deletion at the top, an insertion at the bottom, and
+  replacements for only the lines that differ in between.
+* Matching: the longest runs of equal lines are found wherever they are,
+  like `difflib`. This catches regions that move without the screen
+  scrolling, such as a full-screen editor or pager scrolling its view.
+"""
+import difflib
+
+import iterm2.util
+
+class LineEdit:
+    """One step in turning the old lines into the new ones.
+
+    :param kind: One of :data:`INSERT`, :data:`DELETE`, or :data:`REPLACE`.
+    :param old_range: A :class:`iterm2.Range` of line indexes in the old snapshot.
+    :param new_range: A :class:`iterm2.Range` of line indexes in the new snapshot.
+    """
+    INSERT = "insert"
+    DELETE = "delete"
+    REPLACE = "replace"
+
+    def __init__(self, kind, old_range, new_range):
+        self.__kind = kind
+        self.__old_range = old_range
+        self.__new_range = new_range
+
+    def __repr__(self):
+        return "<LineEdit {} old={} new={}>".format(self.__kind, self.__old_range, self.__new_range)
+
+    @property
+    def kind(self):
+        """:returns: One of :data:`INSERT`, :data:`DELETE`, or :data:`REPLACE`."""
+        return self.__kind
+
+    @property
+    def old_range(self):
+        """:returns: The :class:`iterm2.Range` of indexes of affected lines in the old snapshot. Empty for insertions."""
+        return self.__old_range
+
+    @property
+    def new_range(self):
+        """:returns: The :class:`iterm2.Range` of indexes of affected lines in the new snapshot. Empty for deletions."""
+        return self.__new_range
+
+class ScreenDiff:
+    """The difference between two snapshots of a screen.
+
+    Don't create this yourself. Use :class:`ScreenDiffer` or
+    :func:`diff_screen_contents`."""
+    def __init__(self, edits, scrolled):
+        self.__edits = edits
+        self.__scrolled = scrolled
+
+    def __repr__(self):
+        return "<ScreenDiff scrolled={} edits={}>".format(self.__scrolled, self.__edits)
+
+    @property
+    def edits(self):
+        """:returns: A list of :class:`LineEdit` in order of position. Lines not covered by an edit are unchanged."""
+        return self.__edits
+
+    @property
+    def scrolled(self):
+        """:returns: The number of lines the screen scrolled by, from the change in absolute line numbers. Zero if the scrolling strategy wasn't used."""
+        return self.__scrolled
+
+    @property
+    def changed_lines(self):
+        """:returns: A list of indexes of lines in the new snapshot that were inserted or replaced."""
+        lines = []
+        for edit in self.__edits:
+            lines.extend(range(edit.new_range.location, edit.new_range.location + edit.new_range.length))
+        return lines
+
+    @property
+    def is_empty(self):
+        """:returns: True if the snapshots have the same lines."""
+        return not self.__edits
+
+def _keys(contents):
+    """:returns: A list of (text, continuation) tuples for the lines of a :class:`iterm2.ScreenContents`."""
+    keys = []
+    for i in range(contents.number_of_lines):
+        proto = contents._line_proto(i)
+        keys.append((proto.text, proto.continuation))
+    return keys
+
+def _first_line(contents):
+    return contents.windowed_coord_range.coordRange.start.y
+
+def _cost(edits):
+    return sum(max(edit.old_range.length, edit.new_range.length) for edit in edits)
+
+def _edit(kind, old_start, old_end, new_start, new_end):
+    return LineEdit(kind,
+                    iterm2.util.Range(old_start, old_end - old_start),
+                    iterm2.util.Range(new_start, new_end - new_start))
+
+def _scroll_edits(old_keys, new_keys, shift):
+    """Pairs lines by absolute line number.
+
+    :param shift: How far the first line's absolute line number moved. Old line `i + shift` pairs with new line `i`.
+    """
+    edits = []
+    old_start = max(0, shift)
+    new_start = max(0, -shift)
+    overlap = max(0, min(len(old_keys) - old_start, len(new_keys) - new_start))
+    if old_start > 0:
+        edits.append(_edit(LineEdit.DELETE, 0, old_start, 0, 0))
+    if new_start > 0:
+        edits.append(_edit(LineEdit.INSERT, 0, 0, 0, new_start))
+    i = 0
+    while i < overlap:
+        if old_keys[old_start + i] == new_keys[new_start + i]:
+            i += 1
+            continue
+        j = i + 1
+        while j < overlap and old_keys[old_start + j] != new_keys[new_start + j]:
+            j += 1
+        edits.append(_edit(LineEdit.REPLACE, old_start + i, old_start + j, new_start + i, new_start + j))
+        i = j
+    old_end = old_start + overlap
+    new_end = new_start + overlap
+    if old_end < len(old_keys):
+        edits.append(_edit(LineEdit.DELETE, old_end, len(old_keys), new_end, new_end))
+    if new_end < len(new_keys):
+        edits.append(_edit(LineEdit.INSERT, old_end, old_end, new_end, len(new_keys)))
+    return edits
+
+def _matching_edits(old_keys, new_keys):
+    """Finds the longest runs of equal lines anywhere."""
+    matcher = difflib.SequenceMatcher(None, old_keys, new_keys, autojunk=False)
+    return [_edit(tag, i1, i2, j1, j2)
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+            if tag != "equal"]
+
+def _diff(old_keys, new_keys, shift):
+    edits = _scroll_edits(old_keys, new_keys, shift)
+    if all(edit.kind != LineEdit.REPLACE for edit in edits):
+        # Only lines that scrolled in or out changed.
+        return ScreenDiff(edits, shift)
+    matched = _matching_edits(old_keys, new_keys)
+    if _cost(matched) < _cost(edits):
+        return ScreenDiff(matched, 0)
+    return ScreenDiff(edits, shift)
+
+def diff_screen_contents(old, new):
+    """Compares two snapshots of a screen.
+
+    To compare a stream of snapshots, use a :class:`ScreenDiffer`, which
+    reads each snapshot's lines only once.
+
+    :param old: The earlier :class:`iterm2.ScreenContents`.
+    :param new: The later :class:`iterm2.ScreenContents`.
+
+    :returns: A :class:`ScreenDiff`.
+    """
+    return _diff(_keys(old), _keys(new), _first_line(new) - _first_line(old))
+
+class ScreenDiffer:
+    """Compares each snapshot of a screen with the one before it.
+
+    Example:
+
+      .. code-block:: python
+
+          differ = iterm2.ScreenDiffer()
+          async with session.get_screen_streamer() as streamer:
+              while True:
+                  contents = await streamer.async_get()
+                  diff = differ.update(contents)
+                  for index in diff.changed_lines:
+                      print(contents.line(index).string)
+    """
+    def __init__(self):
+        self.__keys = None
+        self.__first_line = None
+
+    def update(self, contents):
+        """Records a new snapshot and compares it with the previous one.
+
+        :param contents: The latest :class:`iterm2.ScreenContents`.
+
+        :returns: A :class:`ScreenDiff`. For the first snapshot, every line is an insertion.
+        """
+        keys = _keys(contents)
+        first_line = _first_line(contents)
+        if self.__keys is None:
+            diff = _diff([], keys, 0)
+        else:
+            diff = _diff(self.__keys, keys, first_line - self.__first_line)
+        self.__keys = keys
+        self.__first_line = first_line
+        return diff
+
+    def reset(self):
+        """Forgets the previous snapshot, so the next one is treated as all new."""
+        self.__keys = None
+        self.__first_line = None
@@ -1,11 +1,12 @@
 """Provides interfaces for interacting with selected text regions."""
+import asyncio
+import collections
 import enum
 import iterm2.api_pb2
 import iterm2.connection
+import iterm2.rpc
 import iterm2.screen
 import iterm2.util
-import itertools
-from operator import itemgetter
 
 class SelectionMode(enum.Enum):
     """Enumerated list of selection modes.
@@ -78,16 +79,13 @@ class SubSelection:
             self.__windowedCoordRange)
         if result.get_buffer_response.status == iterm2.api_pb2.GetBufferResponse.Status.Value("OK"):
             screenContents = iterm2.screen.ScreenContents(result.get_buffer_response)
-            s = ""
-            wcr = screenContents.windowed_coord_range
-            i = 0
-            while i < screenContents.number_of_lines:
+            parts = []
+            for i in range(screenContents.number_of_lines):
                 line = screenContents.line(i)
-                i += 1
-                s += line.string
+                parts.append(line.string)
                 if line.hard_eol:
-                    s += "\n"
-            return s
+                    parts.append("\n")
+            return "".join(parts)
         else:
             raise iterm2.rpc.RPCException(iterm2.api_pb2.GetBufferResponse.Status.Name(result.get_buffer_response.status))
 
@@ -126,37 +124,71 @@ class Selection:
     def subSelections(self):
         return self.__subSelections
 
-    async def _async_get_content_in_range(self, connection, session_id, coordRange):
-        result = await iterm2.rpc.async_get_screen_contents(
-            connection,
-            session_id,
-            coordRange)
-        if result.get_buffer_response.status == iterm2.api_pb2.GetBufferResponse.Status.Value("OK"):
-            screenContents = iterm2.screen.ScreenContents(result.get_buffer_response)
-            s = ""
-            wcr = screenContents.windowed_coord_range
-            i = 0
-            while i < screenContents.number_of_lines:
-                line = screenContents.line(i)
-                i += 1
-                s += line.string
-                if line.hard_eol:
-                    s += "\n"
-            return s
-
-    async def async_get_string(self, connection, session_id, width):
-        if len(self.__subSelections) == 1:
-            return await self.__subSelections[0].async_get_string(connection, session_id)
-
-        result = ""
-        async def handleRange(coordRange, eol):
-            content = await self._async_get_content_in_range(connection, session_id, coordRange)
-            nonlocal result
-            result += content
-            if eol and not content.endswith("\n"):
-                result += "\n"
+    async def async_get_string(self, connection, session_id, width, writer=None, concurrency=4, chunk_lines=1000):
+        """Gets the text belonging to each subselection and concatenates them with newlines.
+
+        The rows holding the selected ranges are fetched in as few requests
+        as possible: ranges on the same or adjacent rows share a request, and
+        no request covers more than `chunk_lines` rows. Up to `concurrency`
+        requests are in flight at once, and rows are discarded once their
+        text has been taken.
+
+        :param connection: A :class:`iterm2.connection.Connection`.
+        :param session_id: A string session ID.
+        :param width: The width of the session in cells.
+        :param writer: If not None, an object with a `write` method, such as a file, that is given the text a piece at a time as it arrives. Use this for very large selections to avoid building one large string.
+        :param concurrency: The maximum number of requests in flight at once.
+        :param chunk_lines: The maximum number of rows to fetch in one request.
+
+        :returns: A string with the selected text, or None if `writer` was given.
+
+        :throws: :class:`iterm2.rpc.RPCException` if something goes wrong.
+        """
+        if len(self.__subSelections) == 1 and self.__subSelections[0].windowedCoordRange.hasWindow:
+            # Only the server knows how to cut a box out of wrapped lines.
+            s = await self.__subSelections[0].async_get_string(connection, session_id)
+            if writer is None:
+                return s
+            writer.write(s)
+            return None
+
+        ranges = []
+        async def handleRange(windowedCoordRange, eol):
+            ranges.append((windowedCoordRange.coordRange, eol))
         await self.async_enumerate_ranges(connection, session_id, width, handleRange)
-        return result
+
+        parts = []
+        if writer is None:
+            write = parts.append
+        else:
+            write = writer.write
+        fetcher = _RowFetcher(connection, session_id, _row_spans(ranges, chunk_lines), concurrency)
+        try:
+            for coordRange, eol in ranges:
+                # The range's end is its last cell, not the one after.
+                start = coordRange.start
+                last = coordRange.end
+                endsWithNewline = False
+                for y in range(start.y, last.y + 1):
+                    line = await fetcher.async_line(y)
+                    if line is None:
+                        continue
+                    n = line.number_of_cells
+                    x0 = min(start.x, n) if y == start.y else 0
+                    x1 = min(last.x + 1, n) if y == last.y else n
+                    text = line.string[line.offset_of_cell(x0):line.offset_of_cell(x1)] if x0 < x1 else ""
+                    if line.hard_eol and (y < last.y or last.x + 1 >= n):
+                        text += "\n"
+                    if text:
+                        write(text)
+                        endsWithNewline = text.endswith("\n")
+                if eol and not endsWithNewline:
+                    write("\n")
+        finally:
+            fetcher.cancel()
+        if writer is None:
+            return "".join(parts)
+        return None
 
     async def async_enumerate_ranges(self, connection, session_id, width, cb):
         """Gets the text belonging to each subselection and concatenates them with newlines.
@@ -171,34 +203,19 @@ class Selection:
 
         # Ranges ending at connectors don't get a newline following.
         connectors = set()
-        indexes = set()
+        # Half-open intervals of cell indexes.
+        intervals = []
         for outer in self.__subSelections:
             if outer.connected:
                 thePosition = outer.windowedCoordRange.coordRange.end.x + outer.windowedCoordRange.coordRange.end.y * width;
                 connectors |= {thePosition}
 
-            theRange = iterm2.util.Range(0, 0)
             def handleRange(outerRange):
-                nonlocal indexes
-                nonlocal theRange
                 theRange = iterm2.util.Range(
                         outerRange.start.x + outerRange.start.y * width,
                         outerRange.length(width));
-
-                indexesToAdd = theRange.toSet
-                indexesToRemove = set()
-                def f(values):
-                    i,x=values
-                    return i-x
-                # Iterate contiguous ranges
-                indexes_of_interest = indexes.intersection(indexesToAdd)
-                for k, g in itertools.groupby(enumerate(sorted(indexes_of_interest)), f):
-                    # range exists in both indexes and theRange
-                    values_in_range=map(itemgetter(1), g)
-                    indexesToRemove |= set(values_in_range)
-                    indexesToAdd -= set(values_in_range)
-                indexes -= indexesToRemove
-                indexes |= indexesToAdd
+                if theRange.length > 0:
+                    intervals.append((theRange.location, theRange.max))
 
                 # In multipart windowed ranges, add connectors for the endpoint of all but the last
                 # range. Each enumerated range is on its own line.
@@ -209,34 +226,96 @@ class Selection:
 
             outer.enumerateRanges(handleRange)
 
-        # the ranges may be out of order so put them in an array and then sort it.
-        allRanges = []
-        def f(values):
-            i,x=values
-            return i-x
-        # Iterate contiguous ranges
-        for k, g in itertools.groupby(enumerate(sorted(indexes)), f):
-            # range exists in both indexes and theRange
-            values_in_range=list(map(itemgetter(1), g))
-            coordRange = iterm2.util.CoordRange(
-                    iterm2.util.Point(
-                        min(values_in_range) % width,
-                        min(values_in_range) // width),
-                    iterm2.util.Point(
-                        max(values_in_range) % width,
-                        max(values_in_range) // width))
-            allRanges.append(coordRange)
-
-        def rangeKey(r):
-            return r.start.y * width + r.start.x
-        sortedRanges = sorted(allRanges, key=rangeKey)
-        for idx, theRange in enumerate(sortedRanges):
-            endIndex = theRange.start.x + theRange.start.y * width + theRange.length(width)
-            eol = (endIndex not in connectors) and idx + 1 < len(sortedRanges)
+        mergedRanges = _merge_intervals(intervals)
+        for idx, (start, end) in enumerate(mergedRanges):
+            last = end - 1
+            theRange = iterm2.util.CoordRange(
+                    iterm2.util.Point(start % width, start // width),
+                    iterm2.util.Point(last % width, last // width))
+            eol = (last not in connectors) and idx + 1 < len(mergedRanges)
             stop = await cb(iterm2.util.WindowedCoordRange(theRange), eol)
             if stop:
                 break
 
+def _merge_intervals(intervals):
+    """Merges overlapping and adjacent intervals.
+
+    :param intervals: A list of (start, end) tuples of half-open intervals. None may be empty.
+
+    :returns: A sorted list of disjoint (start, end) tuples covering the same values, with a gap between each.
+    """
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+def _row_spans(ranges, chunk_lines):
+    """Finds which rows to fetch for a list of ranges.
+
+    :param ranges: A sorted list of (:class:`iterm2.util.CoordRange`, eol) tuples whose ends are their last cells.
+    :param chunk_lines: The maximum number of rows in a span.
+
+    :returns: A sorted list of (first row, row after last) tuples.
+    """
+    rows = _merge_intervals([(r.start.y, r.end.y + 1) for r, _eol in ranges])
+    spans = []
+    for first, limit in rows:
+        for y in range(first, limit, chunk_lines):
+            spans.append((y, min(limit, y + chunk_lines)))
+    return spans
+
+class _RowFetcher:
+    """Fetches spans of rows in order, with several requests in flight.
+
+    Rows must be asked for in increasing order. Only the span holding the
+    latest row asked for and those being prefetched are kept."""
+    def __init__(self, connection, session_id, spans, concurrency):
+        self.__connection = connection
+        self.__session_id = session_id
+        self.__spans = spans
+        self.__concurrency = max(1, concurrency)
+        self.__next = 0
+        self.__tasks = collections.deque()
+        self.__limit = None
+        self.__contents = None
+        self.__first = None
+
+    async def _async_fetch(self, first, limit):
+        coordRange = iterm2.util.CoordRange(iterm2.util.Point(0, first), iterm2.util.Point(0, limit))
+        result = await iterm2.rpc.async_get_screen_contents(
+            self.__connection,
+            self.__session_id,
+            iterm2.util.WindowedCoordRange(coordRange))
+        status = result.get_buffer_response.status
+        if status != iterm2.api_pb2.GetBufferResponse.Status.Value("OK"):
+            raise iterm2.rpc.RPCException(iterm2.api_pb2.GetBufferResponse.Status.Name(status))
+        return (limit, iterm2.screen.ScreenContents(result.get_buffer_response))
+
+    async def async_line(self, y):
+        """:returns: The :class:`iterm2.LineContents` of row `y`, or None if the server didn't return it."""
+        while self.__limit is None or y >= self.__limit:
+            while self.__next < len(self.__spans) and len(self.__tasks) < self.__concurrency:
+                first, limit = self.__spans[self.__next]
+                self.__tasks.append(asyncio.ensure_future(self._async_fetch(first, limit)))
+                self.__next += 1
+            if not self.__tasks:
+                return None
+            self.__limit, self.__contents = await self.__tasks.popleft()
+            self.__first = self.__contents.windowed_coord_range.coordRange.start.y
+        i = y - self.__first
+        if i < 0 or i >= self.__contents.number_of_lines:
+            return None
+        return self.__contents.line(i)
+
+    def cancel(self):
+        """Cancels requests that are still in flight."""
+        for task in self.__tasks:
+            task.cancel()
+        self.__tasks.clear()
 
 MODE_MAP = {
         iterm2.api_pb2.SelectionMode.Value("CHARACTER"): SelectionMode.CHARACTER,
@@ -1,17 +1,20 @@
 """Provides classes for interacting with iTerm2 sessions."""
 import asyncio
+import collections
 
 import iterm2.api_pb2
 import iterm2.app
 import iterm2.connection
 import iterm2.notifications
 import iterm2.profile
+import iterm2.promptindex
 import iterm2.rpc
 import iterm2.screen
 import iterm2.selection
 import iterm2.util
 
 import json
+import re
 
 class SplitPaneException(Exception):
     """Something went wrong when trying to split a pane."""
@@ -206,7 +209,7 @@ class Session:
         """
         return self.__session_id
 
-    def get_screen_streamer(self, want_contents=True):
+    def get_screen_streamer(self, want_contents=True, rate_monitor=None):
         """
         Provides a nice interface for receiving updates to the screen.
 
@@ -220,9 +223,13 @@ class Session:
               contents = await streamer.async_get()
               do_something(contents)
 
+        :param want_contents: If False, :meth:`ScreenStreamer.async_get` returns None instead of fetching the screen.
+        :param rate_monitor: An :class:`OutputRateMonitor`. While it reports
+          this session as throttled, the streamer is held back.
+
         :returns: A :class:`ScreenStreamer`.
         """
-        return iterm2.screen.ScreenStreamer(self.connection, self.__session_id, want_contents=want_contents)
+        return iterm2.screen.ScreenStreamer(self.connection, self.__session_id, want_contents=want_contents, rate_monitor=rate_monitor)
 
     async def async_send_text(self, text, suppress_broadcast=False):
         """
@@ -323,11 +330,12 @@ class Session:
         else:
             raise iterm2.rpc.RPCException(iterm2.api_pb2.GetBufferResponse.Status.Name(status))
 
-    async def async_get_screen_contents(self, windowedCoordRange):
+    async def async_get_screen_contents(self, windowedCoordRange, include_styles=False):
         """
         Fetches the last lines of the session, reaching into history if needed.
 
         :param windowedCooordRange: A :class:`iterm2.util.WindowedCoordRange` describing the range to fetch.
+        :param include_styles: If True, also fetch the colors and attributes of each cell. See :attr:`iterm2.LineContents.styles`.
 
         :returns: The buffer contents, a :class:`iterm2.screen.ScreenContents`.
 
@@ -336,7 +344,8 @@ class Session:
         response = await iterm2.rpc.async_get_screen_contents(
             self.connection,
             self.__session_id,
-            windowedCoordRange)
+            windowedCoordRange,
+            include_styles)
         status = response.get_buffer_response.status
         if status == iterm2.api_pb2.GetBufferResponse.Status.Value("OK"):
             return iterm2.screen.ScreenContents(response.get_buffer_response)
@@ -360,6 +369,41 @@ class Session:
         else:
             raise iterm2.rpc.RPCException(iterm2.api_pb2.GetPromptResponse.Status.Name(status))
 
+    async def async_get_command_output(self, n=-1, chunk_lines=1000):
+        """
+        Fetches the output of a command run in this session.
+
+        Commands are recorded by the :class:`iterm2.PromptIndex` returned by
+        :func:`iterm2.async_get_prompt_index`. Only commands whose prompts
+        appear after it starts are known, so call it when your script starts.
+        If nothing has been recorded for this session yet, its most recent
+        prompt is looked up, so the latest command can always be found. The
+        output is read a chunk at a time, as by :meth:`async_iter_lines`.
+
+        Requires shell integration.
+
+        :param n: The index of the command among those recorded, oldest first. Negative values count from the end, so -1 is the latest, which may still be running.
+        :param chunk_lines: The maximum number of lines to fetch in one request.
+
+        :returns: The output as a string, with a newline after each line. Output lost from the head of history is omitted.
+
+        :throws: IndexError if there is no such command, or :class:`RPCException` if something goes wrong.
+        """
+        index = await iterm2.promptindex.async_get_prompt_index(self.connection)
+        record = await index.async_get_command(self.__session_id, n)
+        parts = []
+        async for _line_number, line in self.async_iter_lines(record.output_start, record.output_end, chunk_lines):
+            parts.append(line.string)
+            if line.hard_eol:
+                parts.append("\n")
+        output = "".join(parts)
+        if record.output_end is None:
+            # Drop the empty rows below the cursor.
+            output = output.rstrip("\n")
+            if output:
+                output += "\n"
+        return output
+
     async def async_set_profile_property(self, key, json_value):
         """
         Sets the value of a property in this session.
@@ -557,16 +601,18 @@ class Session:
             subs.append(sub)
         return iterm2.Selection(subs)
 
-    async def async_get_selection_text(self, selection):
+    async def async_get_selection_text(self, selection, writer=None):
         """Fetches the text within a selection region.
 
         :param selection: A :class:`iterm2.selection.Selection` defining a region in the session.
+        :param writer: If not None, an object with a `write` method, such as a file, that is given the text a piece at a time instead of returning it. Use this for very large selections.
 
-        :returns: A string with the selection's contents. Discontiguous selections are combined with newlines."""
+        :returns: A string with the selection's contents, or None if `writer` was given. Discontiguous selections are combined with newlines."""
         return await selection.async_get_string(
                 self.connection,
                 self.session_id,
-                self.grid_size.width)
+                self.grid_size.width,
+                writer)
 
     async def async_set_selection(self, selection):
         """
@@ -592,6 +638,181 @@ class Session:
         dict = json.loads(response.get_property_response.json_value)
         return (dict["grid"], dict["history"], dict["overflow"], dict["first_visible"] )
 
+    async def async_iter_lines(self, start=None, end=None, chunk_lines=1000):
+        """
+        Reads lines of the session, including scrollback history, a chunk at a time.
+
+        Only one chunk is held in memory at a time, and the next chunk is
+        fetched while the current one is being consumed.
+
+        Line numbers are absolute, like `Coord.y`: they count lines lost from
+        the head of history when it became full. If lines are lost while
+        iterating, they are skipped, which shows up as a gap in the line
+        numbers.
+
+        :param start: The first line number to read, or None to begin with the oldest available line.
+        :param end: The line number to stop before, or None to read through the last line at the time of the call.
+        :param chunk_lines: The maximum number of lines to fetch in one request.
+
+        :returns: An async iterator of (line number, :class:`iterm2.LineContents`) tuples.
+
+        :throws: :class:`RPCException` if something goes wrong.
+
+        Example:
+
+          .. code-block:: python
+
+              async for line_number, line in session.async_iter_lines():
+                  print(line_number, line.string)
+        """
+        grid, history, overflow, _first_visible = await self.async_get_line_info()
+        if start is None:
+            start = overflow
+        if end is None:
+            end = overflow + history + grid
+
+        async def async_fetch(first):
+            """Fetches the chunk beginning at `first`, or at the oldest line if `first` was lost.
+
+            :returns: (line number after the chunk, first line number of the chunk, ScreenContents or None)
+            """
+            _grid, _history, overflow, _first_visible = await self.async_get_line_info()
+            first = max(first, overflow)
+            limit = min(end, first + chunk_lines)
+            if first >= limit:
+                return (limit, first, None)
+            coord_range = iterm2.util.CoordRange(
+                iterm2.util.Point(0, first),
+                iterm2.util.Point(0, limit))
+            contents = await self.async_get_screen_contents(iterm2.util.WindowedCoordRange(coord_range))
+            return (limit, first, contents)
+
+        task = asyncio.ensure_future(async_fetch(start))
+        try:
+            while task is not None:
+                limit, first, contents = await task
+                if limit < end:
+                    task = asyncio.ensure_future(async_fetch(limit))
+                else:
+                    task = None
+                if contents is None:
+                    continue
+                for i in range(contents.number_of_lines):
+                    yield (first + i, contents.line(i))
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def async_search(self, pattern, start=None, end=None, chunk_lines=1000, concurrency=4, max_results=None):
+        """
+        Searches the session's contents, including scrollback history, for a regular expression.
+
+        Lines that were soft-wrapped are joined before searching, so a match
+        may span more than one row of the screen. Matches do not cross hard
+        newlines.
+
+        History is fetched in chunks of `chunk_lines` lines, with up to
+        `concurrency` chunks in flight at once.
+
+        :param pattern: A regular expression, either a string or a compiled pattern from the `re` module.
+        :param start: The first line number to search, or None to begin with the oldest available line.
+        :param end: The line number to stop before, or None to search through the last line at the time of the call.
+        :param chunk_lines: The maximum number of lines to fetch in one request.
+        :param concurrency: The maximum number of fetches to run at once.
+        :param max_results: Stop after this many matches, or None for no limit.
+
+        :returns: A list of :class:`iterm2.util.CoordRange` giving the cells of each match, in order. Empty matches are omitted.
+
+        :throws: :class:`RPCException` if something goes wrong.
+
+        Example:
+
+          .. code-block:: python
+
+              ranges = await session.async_search(r"error: .*")
+              if ranges:
+                  sub = iterm2.SubSelection(
+                          iterm2.util.WindowedCoordRange(ranges[-1]),
+                          iterm2.SelectionMode.CHARACTER,
+                          False)
+                  await session.async_set_selection(iterm2.Selection([sub]))
+        """
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern)
+        grid, history, overflow, _first_visible = await self.async_get_line_info()
+        if start is None:
+            start = overflow
+        if end is None:
+            end = overflow + history + grid
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def async_fetch(first, limit):
+            """Fetches lines `first` up to `limit`, less any lost from the head of history.
+
+            :returns: (first line number of the chunk, ScreenContents or None)
+            """
+            async with semaphore:
+                _grid, _history, overflow, _first_visible = await self.async_get_line_info()
+                first = max(first, overflow)
+                if first >= limit:
+                    return (first, None)
+                coord_range = iterm2.util.CoordRange(
+                    iterm2.util.Point(0, first),
+                    iterm2.util.Point(0, limit))
+                contents = await self.async_get_screen_contents(iterm2.util.WindowedCoordRange(coord_range))
+                return (first, contents)
+
+        chunks = [(first, min(end, first + chunk_lines)) for first in range(start, end, chunk_lines)]
+        # Keep a bounded number of fetches ahead of the scanner.
+        pending = collections.deque()
+        next_chunk = 0
+        results = []
+        rows = []
+        try:
+            while next_chunk < len(chunks) or pending:
+                while next_chunk < len(chunks) and len(pending) < 2 * concurrency:
+                    pending.append(asyncio.ensure_future(async_fetch(*chunks[next_chunk])))
+                    next_chunk += 1
+                first, contents = await pending.popleft()
+                if contents is None:
+                    continue
+                for i in range(contents.number_of_lines):
+                    y = first + i
+                    if rows and rows[-1][0] + 1 != y:
+                        # Lines were lost in between, so the wrapped line can't be completed.
+                        results.extend(_search_wrapped_line(pattern, rows))
+                        rows = []
+                    line = contents.line(i)
+                    rows.append((y, line))
+                    if line.hard_eol:
+                        results.extend(_search_wrapped_line(pattern, rows))
+                        rows = []
+                if max_results is not None and len(results) >= max_results:
+                    return results[:max_results]
+            results.extend(_search_wrapped_line(pattern, rows))
+        finally:
+            for task in pending:
+                task.cancel()
+        if max_results is not None:
+            return results[:max_results]
+        return results
+
+
+def _search_wrapped_line(pattern, rows):
+    """Finds matches in a line that may have been soft-wrapped over several rows.
+
+    :param pattern: A compiled regular expression.
+    :param rows: A list of (line number, :class:`iterm2.LineContents`) for consecutive rows. All but the last are soft-wrapped.
+
+    :returns: A list of :class:`iterm2.util.CoordRange`.
+    """
+    if not rows:
+        return []
+    line = iterm2.screen._WrappedLine(rows)
+    return [line.coord_range(match.start(), match.end())
+            for match in pattern.finditer(line.text)
+            if match.start() != match.end()]
+
 
 class InvalidSessionId(Exception):
     """The specified session ID is not allowed in this method."""
@@ -0,0 +1,348 @@
+"""Indexes the text of every session so it can be searched quickly.
+
+A :class:`ScrollbackIndex` watches for screen updates in all sessions and
+fetches only lines it hasn't seen yet. Lines in scrollback history don't
+change, so they are indexed once. Lines on the screen may still change, so
+they are re-read on each update and kept apart from history.
+
+Postings are stored in segments, oldest first. When the number of postings
+exceeds the limit, the oldest segment is dropped, so memory stays bounded
+no matter how much output the sessions produce. Lines on screens count
+toward the limit but are never dropped. Lines that have been lost from the
+head of a session's history are never returned.
+"""
+import array
+import asyncio
+import bisect
+import json
+import re
+
+import iterm2.api_pb2
+import iterm2.notifications
+import iterm2.rpc
+import iterm2.timer
+import iterm2.util
+
+# Postings pack a session number and a line number into one integer.
+_LINE_BITS = 40
+_LINE_MASK = (1 << _LINE_BITS) - 1
+
+class _Segment:
+    """A group of postings that are evicted together."""
+    def __init__(self):
+        # term -> array of packed (session number, line number)
+        self.postings = {}
+        self.size = 0
+        self.__sorted_terms = None
+
+    def add(self, term, posting):
+        postings = self.postings.get(term)
+        if postings is None:
+            postings = array.array("q")
+            self.postings[term] = postings
+            self.__sorted_terms = None
+        postings.append(posting)
+        self.size += 1
+
+    def get(self, term, default=None):
+        return self.postings.get(term, default)
+
+    def terms_with_prefix(self, prefix):
+        if self.__sorted_terms is None:
+            self.__sorted_terms = sorted(self.postings)
+        terms = self.__sorted_terms
+        i = bisect.bisect_left(terms, prefix)
+        while i < len(terms) and terms[i].startswith(prefix):
+            yield terms[i]
+            i += 1
+
+class _SessionState:
+    def __init__(self, number):
+        self.number = number
+        # The first line not yet in the permanent index.
+        self.next_line = None
+        # Lines before this have been lost from the head of history.
+        self.overflow = 0
+        # term -> [line number, ...] for lines that may still change.
+        self.screen_postings = {}
+        # The number of (term, line) entries in screen_postings.
+        self.screen_size = 0
+        self.busy = False
+        self.again = False
+
+class ScrollbackIndex:
+    """An inverted index of the text in all sessions.
+
+    Terms are runs of word characters, compared case-insensitively.
+
+    :param connection: The :class:`iterm2.Connection` to use.
+    :param max_postings: The most (term, line) entries to keep. When exceeded, the oldest lines are forgotten.
+    :param delay: Seconds to wait after a screen update before reading new lines, so bursts of output are read at once.
+    :param chunk_lines: The maximum number of lines to fetch in one request.
+    :param concurrency: The maximum number of sessions to read at once.
+
+    Example:
+
+      .. code-block:: python
+
+          async with iterm2.ScrollbackIndex(connection) as index:
+              await index.async_index_session(session.session_id)
+              for session_id, line_number in index.search("e1234"):
+                  print(session_id, line_number)
+    """
+    TOKEN_PATTERN = re.compile(r"\w+")
+    MAX_TERM_LENGTH = 64
+
+    def __init__(self, connection, max_postings=2000000, delay=0.5, chunk_lines=1000, concurrency=8):
+        self.__connection = connection
+        self.__max_postings = max_postings
+        self.__segment_size = max(1, max_postings // 16)
+        self.__delay = delay
+        self.__chunk_lines = chunk_lines
+        self.__semaphore = asyncio.Semaphore(concurrency)
+        self.__wheel = iterm2.timer.get_timer_wheel()
+        self.__segments = [_Segment()]
+        self.__number_of_postings = 0
+        self.__sessions = {}
+        self.__session_ids = {}
+        self.__next_number = 0
+        self.__tokens = []
+
+    async def __aenter__(self):
+        async def async_ignore(_connection, _message):
+            pass
+
+        async def async_on_terminate(_connection, message):
+            """Called when a session terminates. Stops returning its lines."""
+            state = self.__sessions.pop(message.uniqueIdentifier, None)
+            if state is not None:
+                del self.__session_ids[state.number]
+                self.__number_of_postings -= state.screen_size
+            self.__wheel.cancel((self, message.uniqueIdentifier))
+
+        # See OutputRateMonitor for why updates are observed this way.
+        iterm2.notifications._get_dispatch_observers().append(self._observe)
+        self.__tokens.append(await iterm2.notifications.async_subscribe_to_screen_update_notification(
+            self.__connection,
+            async_ignore,
+            None))
+        self.__tokens.append(await iterm2.notifications.async_subscribe_to_terminate_session_notification(
+            self.__connection,
+            async_on_terminate))
+        return self
+
+    async def __aexit__(self, exc_type, exc, _tb):
+        iterm2.notifications._get_dispatch_observers().remove(self._observe)
+        for session_id in self.__sessions:
+            self.__wheel.cancel((self, session_id))
+        for token in self.__tokens:
+            await iterm2.notifications.async_unsubscribe(self.__connection, token)
+        self.__tokens = []
+
+    @property
+    def number_of_postings(self):
+        """:returns: The number of (term, line) entries in the index, including lines on screens."""
+        return self.__number_of_postings
+
+    def search(self, term, limit=None):
+        """Finds lines containing a term.
+
+        :param term: A word to look for.
+        :param limit: The maximum number of results, or None for all.
+
+        :returns: A list of (session ID, line number) tuples, newest lines first.
+        """
+        term = term.lower()
+        return self._search(lambda postings: [postings.get(term, ())], limit)
+
+    def search_prefix(self, prefix, limit=None):
+        """Finds lines containing a term that begins with `prefix`.
+
+        :param prefix: The beginning of a word to look for.
+        :param limit: The maximum number of results, or None for all.
+
+        :returns: A list of (session ID, line number) tuples, newest lines first.
+        """
+        prefix = prefix.lower()
+
+        def lookup(postings):
+            if isinstance(postings, _Segment):
+                return [postings.postings[term] for term in postings.terms_with_prefix(prefix)]
+            return [lines for term, lines in postings.items() if term.startswith(prefix)]
+        return self._search(lookup, limit)
+
+    async def async_index_session(self, session_id):
+        """Reads any lines of a session that haven't been indexed yet.
+
+        Sessions are indexed automatically when their screens change. Use
+        this to index a session's existing history right away.
+
+        :param session_id: The session ID.
+
+        :throws: :class:`iterm2.rpc.RPCException` if something goes wrong.
+        """
+        state = self._state(session_id)
+        if state.busy:
+            state.again = True
+            return
+        state.busy = True
+        try:
+            while True:
+                state.again = False
+                async with self.__semaphore:
+                    await self._async_read_new_lines(session_id, state)
+                if not state.again:
+                    break
+        finally:
+            state.busy = False
+
+    def _state(self, session_id):
+        state = self.__sessions.get(session_id)
+        if state is None:
+            state = _SessionState(self.__next_number)
+            self.__next_number += 1
+            self.__sessions[session_id] = state
+            self.__session_ids[state.number] = session_id
+        return state
+
+    def _observe(self, message):
+        if not message.notification.HasField("screen_update_notification"):
+            return
+        session_id = message.notification.screen_update_notification.session
+        key = (self, session_id)
+        if key not in self.__wheel:
+            self.__wheel.schedule(key, self.__delay, self._async_index_session_quietly, session_id)
+
+    async def _async_index_session_quietly(self, session_id):
+        try:
+            await self.async_index_session(session_id)
+        except iterm2.rpc.RPCException:
+            # The session probably went away.
+            pass
+
+    def _search(self, lookup, limit):
+        results = []
+        # A line appears once per matching term, but is returned once.
+        seen = set()
+
+        def add(session_id, line):
+            key = (session_id, line)
+            if key not in seen:
+                seen.add(key)
+                results.append(key)
+            return limit is not None and len(results) >= limit
+
+        # Lines on screens are newest.
+        for state in list(self.__sessions.values()):
+            session_id = self.__session_ids[state.number]
+            lines = set()
+            for group in lookup(state.screen_postings):
+                lines.update(group)
+            for line in sorted(lines, reverse=True):
+                if add(session_id, line):
+                    return results
+        for segment in reversed(self.__segments):
+            for postings in lookup(segment):
+                for posting in reversed(postings):
+                    session_id = self.__session_ids.get(posting >> _LINE_BITS)
+                    if session_id is None:
+                        continue
+                    line = posting & _LINE_MASK
+                    if line < self.__sessions[session_id].overflow:
+                        continue
+                    if add(session_id, line):
+                        return results
+        return results
+
+    def _add_permanent(self, state, rows):
+        """Indexes a logical line that will not change.
+
+        :param rows: [(line number, text), ...] for rows joined by soft wraps.
+        """
+        for term, line in self._terms_by_row(rows):
+            segment = self.__segments[-1]
+            if segment.size >= self.__segment_size:
+                segment = _Segment()
+                self.__segments.append(segment)
+            segment.add(term, (state.number << _LINE_BITS) | line)
+            self.__number_of_postings += 1
+        self._evict()
+
+    def _set_screen_postings(self, state, screen_postings):
+        """Replaces the postings of the lines on a session's screen."""
+        size = sum(len(lines) for lines in screen_postings.values())
+        self.__number_of_postings += size - state.screen_size
+        state.screen_postings = screen_postings
+        state.screen_size = size
+        self._evict()
+
+    def _evict(self):
+        """Drops the oldest segments until the number of postings is within the limit.
+
+        Lines on screens can't be dropped, so the newest segment is always kept."""
+        while self.__number_of_postings > self.__max_postings and len(self.__segments) > 1:
+            self.__number_of_postings -= self.__segments.pop(0).size
+
+    def _terms_by_row(self, rows):
+        """Yields (term, line number of the row where it starts) for a logical line."""
+        text = "".join(row_text for _line, row_text in rows)
+        starts = []
+        offset = 0
+        for _line, row_text in rows:
+            starts.append(offset)
+            offset += len(row_text)
+        seen = set()
+        for match in ScrollbackIndex.TOKEN_PATTERN.finditer(text):
+            term = match.group(0)
+            if len(term) > ScrollbackIndex.MAX_TERM_LENGTH:
+                continue
+            line = rows[bisect.bisect_right(starts, match.start()) - 1][0]
+            key = (term.lower(), line)
+            if key not in seen:
+                seen.add(key)
+                yield key
+
+    async def _async_read_new_lines(self, session_id, state):
+        response = await iterm2.rpc.async_get_property(self.__connection, "number_of_lines", session_id=session_id)
+        status = response.get_property_response.status
+        if status != iterm2.api_pb2.GetPropertyResponse.Status.Value("OK"):
+            raise iterm2.rpc.RPCException(iterm2.api_pb2.GetPropertyResponse.Status.Name(status))
+        info = json.loads(response.get_property_response.json_value)
+        overflow = info["overflow"]
+        screen_top = overflow + info["history"]
+        end = screen_top + info["grid"]
+        state.overflow = overflow
+        if state.next_line is None or state.next_line < overflow:
+            state.next_line = overflow
+
+        screen_postings = {}
+        rows = []
+        first = state.next_line
+        while first < end:
+            limit = min(end, first + self.__chunk_lines)
+            coord_range = iterm2.util.CoordRange(iterm2.util.Point(0, first), iterm2.util.Point(0, limit))
+            response = await iterm2.rpc.async_get_screen_contents(
+                self.__connection,
+                session_id,
+                iterm2.util.WindowedCoordRange(coord_range))
+            status = response.get_buffer_response.status
+            if status != iterm2.api_pb2.GetBufferResponse.Status.Value("OK"):
+                raise iterm2.rpc.RPCException(iterm2.api_pb2.GetBufferResponse.Status.Name(status))
+            for i, line in enumerate(response.get_buffer_response.contents):
+                y = first + i
+                rows.append((y, line.text))
+                if line.continuation == iterm2.api_pb2.LineContents.Continuation.Value("CONTINUATION_SOFT_EOL"):
+                    continue
+                if y < screen_top:
+                    self._add_permanent(state, rows)
+                    state.next_line = y + 1
+                else:
+                    for term, row_line in self._terms_by_row(rows):
+                        screen_postings.setdefault(term, []).append(row_line)
+                rows = []
+            first = limit
+
+        # A wrapped line that continues past the end is read again next time.
+        for term, row_line in self._terms_by_row(rows):
+            screen_postings.setdefault(term, []).append(row_line)
+        self._set_screen_postings(state, screen_postings)
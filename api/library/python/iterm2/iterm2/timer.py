@@ -0,0 +1,295 @@
+"""Provides cheap keyed timeouts for watching many sessions at once.
+
+Creating an asyncio task that sleeps for each session and each event gets
+expensive when hundreds of sessions are being watched. A :class:`TimerWheel`
+keeps every timeout in a hierarchical timing wheel. Scheduling, cancelling,
+and rescheduling a timeout take constant time, and all timeouts are driven by
+a single callback on the event loop.
+"""
+import asyncio
+import math
+import traceback
+
+import iterm2.notifications
+
+def get_timer_wheel():
+    """Returns the shared timer wheel, creating it if needed.
+
+    :returns: A :class:`TimerWheel`.
+    """
+    if not hasattr(get_timer_wheel, 'wheel'):
+        get_timer_wheel.wheel = TimerWheel()
+    return get_timer_wheel.wheel
+
+class _Timer:
+    def __init__(self, key, expiry, callback, args):
+        self.key = key
+        self.expiry = expiry
+        self.callback = callback
+        self.args = args
+        self.level = None
+        self.slot = None
+
+class TimerWheel:
+    """Runs callbacks after a delay, identified by a key.
+
+    Each key has at most one pending timeout. Scheduling a key that is already
+    pending replaces its timeout.
+
+    :param resolution: The granularity of timeouts in seconds. Timeouts fire
+      on the first tick at or after their deadline.
+    :param slots_per_level: The number of slots in each level of the wheel.
+      Must be a power of two.
+    :param levels: The number of levels. Together with `slots_per_level` and
+      `resolution` this determines the longest timeout that doesn't need to be
+      cascaded more than once per level.
+
+    Example:
+
+      .. code-block:: python
+
+          wheel = iterm2.TimerWheel()
+          wheel.schedule(session_id, 2, reset_indicator, session_id)
+          # Later, push the deadline back:
+          wheel.reschedule(session_id, 2)
+    """
+    def __init__(self, resolution=0.1, slots_per_level=64, levels=4):
+        assert slots_per_level > 1 and (slots_per_level & (slots_per_level - 1)) == 0
+        self.__resolution = resolution
+        self.__bits = slots_per_level.bit_length() - 1
+        self.__mask = slots_per_level - 1
+        self.__levels = levels
+        self.__wheels = [[{} for _ in range(slots_per_level)] for _ in range(levels)]
+        self.__timers = {}
+        self.__start = None
+        self.__current_tick = 0
+        self.__handle = None
+        self.__ticking = False
+
+    def __len__(self):
+        return len(self.__timers)
+
+    def __contains__(self, key):
+        return key in self.__timers
+
+    @property
+    def resolution(self):
+        """:returns: The granularity of timeouts in seconds."""
+        return self.__resolution
+
+    def schedule(self, key, delay, callback, *args):
+        """Runs `callback(*args)` after `delay` seconds.
+
+        If `callback` returns an awaitable it is scheduled as a task. Any
+        timeout already pending for `key` is replaced.
+
+        :param key: A hashable value identifying the timeout, such as a session ID.
+        :param delay: The number of seconds to wait.
+        :param callback: A function or coroutine function.
+        """
+        self.cancel(key)
+        self._start_if_needed()
+        timer = _Timer(key, self.__current_tick + self._ticks(delay), callback, args)
+        self.__timers[key] = timer
+        self._place(timer)
+
+    def reschedule(self, key, delay):
+        """Moves the deadline of a pending timeout to `delay` seconds from now.
+
+        :param key: The key passed to :meth:`schedule`.
+        :param delay: The number of seconds to wait.
+
+        :returns: True if the timeout was pending, False otherwise.
+        """
+        timer = self.__timers.get(key)
+        if timer is None:
+            return False
+        del self.__wheels[timer.level][timer.slot][key]
+        timer.expiry = self.__current_tick + self._ticks(delay)
+        self._place(timer)
+        return True
+
+    def cancel(self, key):
+        """Cancels a pending timeout.
+
+        :param key: The key passed to :meth:`schedule`.
+
+        :returns: True if the timeout was pending, False otherwise.
+        """
+        timer = self.__timers.pop(key, None)
+        if timer is None:
+            return False
+        del self.__wheels[timer.level][timer.slot][key]
+        if not self.__timers:
+            self._stop()
+        return True
+
+    def time_remaining(self, key):
+        """Returns the number of seconds until a timeout fires, or None if it is not pending."""
+        timer = self.__timers.get(key)
+        if timer is None:
+            return None
+        deadline = self.__start + timer.expiry * self.__resolution
+        return max(0, deadline - asyncio.get_event_loop().time())
+
+    def _ticks(self, delay):
+        return max(1, int(math.ceil(delay / self.__resolution)))
+
+    def _place(self, timer):
+        """Puts a timer in the slot of the lowest level whose span covers its expiry."""
+        delta = timer.expiry - self.__current_tick
+        level = 0
+        while level < self.__levels - 1 and delta >> (self.__bits * (level + 1)):
+            level += 1
+        expiry = timer.expiry
+        span = 1 << (self.__bits * self.__levels)
+        if delta >= span:
+            # Too far out for the wheel. Park it in the furthest slot of the
+            # top level; it gets placed again when that slot cascades.
+            expiry = self.__current_tick + span - 1
+        slot = (expiry >> (self.__bits * level)) & self.__mask
+        timer.level = level
+        timer.slot = slot
+        self.__wheels[level][slot][timer.key] = timer
+
+    def _start_if_needed(self):
+        if self.__handle is not None or self.__ticking:
+            return
+        loop = asyncio.get_event_loop()
+        if self.__start is None:
+            self.__start = loop.time()
+        # Nothing was pending, so skip ahead to now without firing anything.
+        self.__current_tick = int((loop.time() - self.__start) / self.__resolution)
+        self._schedule_tick(loop)
+
+    def _stop(self):
+        if self.__handle is not None:
+            self.__handle.cancel()
+            self.__handle = None
+
+    def _schedule_tick(self, loop):
+        next_tick_time = self.__start + (self.__current_tick + 1) * self.__resolution
+        self.__handle = loop.call_at(next_tick_time, self._on_tick)
+
+    def _on_tick(self):
+        """The one loop callback. Advances the wheel to the current time."""
+        self.__handle = None
+        loop = asyncio.get_event_loop()
+        target = int((loop.time() - self.__start) / self.__resolution)
+        # Callbacks may schedule new timers while the wheel is advancing.
+        # Those must be placed relative to the tick being processed.
+        self.__ticking = True
+        try:
+            while self.__current_tick < target and self.__timers:
+                self._advance()
+        finally:
+            self.__ticking = False
+        if self.__timers and self.__handle is None:
+            self._schedule_tick(loop)
+
+    def _advance(self):
+        self.__current_tick += 1
+        tick = self.__current_tick
+
+        # Cascade higher levels first so timers falling through more than one
+        # level this tick end up in the right place.
+        for level in range(self.__levels - 1, 0, -1):
+            if tick & ((1 << (self.__bits * level)) - 1):
+                continue
+            slot = (tick >> (self.__bits * level)) & self.__mask
+            bucket = self.__wheels[level][slot]
+            if bucket:
+                self.__wheels[level][slot] = {}
+                for timer in bucket.values():
+                    self._place(timer)
+
+        slot = tick & self.__mask
+        bucket = self.__wheels[0][slot]
+        if not bucket:
+            return
+        self.__wheels[0][slot] = {}
+        for timer in bucket.values():
+            del self.__timers[timer.key]
+        for timer in bucket.values():
+            self._fire(timer)
+
+    def _fire(self, timer):
+        try:
+            result = timer.callback(*timer.args)
+            if asyncio.iscoroutine(result) or isinstance(result, asyncio.Future):
+                asyncio.ensure_future(result)
+        except Exception:
+            traceback.print_exc()
+
+class QuietMonitor:
+    """Watches for sessions whose screens have not changed for a while.
+
+    One screen-update subscription and one shared :class:`TimerWheel` serve
+    every session, so watching hundreds of sessions is cheap. A session is
+    watched from its first screen update after the monitor starts until it
+    terminates.
+
+    :param connection: The :class:`iterm2.Connection` to use.
+    :param timeout: The number of seconds without a screen update after which a session is reported.
+    :param session: A session ID to watch, or None to watch all sessions.
+    :param wheel: The :class:`TimerWheel` to use, or None for the shared one.
+
+    Example:
+
+      .. code-block:: python
+
+          async with iterm2.QuietMonitor(connection, 30) as mon:
+              while True:
+                  session_id = await mon.async_get()
+                  print("Session {} has been quiet for 30 seconds".format(session_id))
+    """
+    def __init__(self, connection, timeout, session=None, wheel=None):
+        self.__connection = connection
+        self.__timeout = timeout
+        self.__session = session
+        self.__wheel = wheel if wheel is not None else get_timer_wheel()
+        self.__queue = asyncio.Queue()
+        self.__keys = set()
+        self.__tokens = []
+
+    async def __aenter__(self):
+        async def async_on_update(_connection, message):
+            """Called on screen update. Pushes back the session's deadline."""
+            key = (self, message.session)
+            if not self.__wheel.reschedule(key, self.__timeout):
+                self.__keys.add(key)
+                self.__wheel.schedule(key, self.__timeout, self._on_timeout, key)
+
+        async def async_on_terminate(_connection, message):
+            """Called when a session terminates. Stops watching it."""
+            key = (self, message.uniqueIdentifier)
+            self.__keys.discard(key)
+            self.__wheel.cancel(key)
+
+        self.__tokens.append(await iterm2.notifications.async_subscribe_to_screen_update_notification(
+            self.__connection,
+            async_on_update,
+            self.__session))
+        self.__tokens.append(await iterm2.notifications.async_subscribe_to_terminate_session_notification(
+            self.__connection,
+            async_on_terminate))
+        return self
+
+    def _on_timeout(self, key):
+        self.__keys.discard(key)
+        self.__queue.put_nowait(key[1])
+
+    async def async_get(self):
+        """Waits for a session to become quiet.
+
+        :returns: The session ID of a session that has had no screen updates for `timeout` seconds.
+        """
+        return await self.__queue.get()
+
+    async def __aexit__(self, exc_type, exc, _tb):
+        for key in self.__keys:
+            self.__wheel.cancel(key)
+        self.__keys.clear()
+        for token in self.__tokens:
+            await iterm2.notifications.async_unsubscribe(self.__connection, token)
+        self.__tokens = []
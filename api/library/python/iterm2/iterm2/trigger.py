@@ -0,0 +1,497 @@
+"""Runs Python callbacks when output matches patterns.
+
+Unlike triggers configured in a profile, these run in your script and
+receive the session ID and the coordinates of each match.
+
+A :class:`TriggerEngine` watches screen updates and examines only lines
+that are new or changed since it last looked. Lines that scrolled by too
+quickly to be seen on the screen are read from history. Each match fires
+once per line: a match that is still there after a line changes (for
+example, while you type after it) does not fire again.
+
+All patterns are checked together by a :class:`PatternSet`, so adding
+triggers adds little cost per line.
+"""
+import asyncio
+import collections
+import re
+
+import iterm2.api_pb2
+import iterm2.app
+import iterm2.notifications
+import iterm2.rpc
+import iterm2.screen
+import iterm2.timer
+import iterm2.util
+
+try:
+    import re._parser as _sre_parse
+except ImportError:
+    import sre_parse as _sre_parse
+
+_SPECIAL_CHARACTERS = set(".^$*+?{}[]\\|()")
+
+def _is_literal(source):
+    return bool(source) and not any(c in _SPECIAL_CHARACTERS for c in source)
+
+def _required_literal(pattern):
+    """Finds a string that every match of a pattern must contain.
+
+    Looks for runs of literal characters outside of alternations and
+    optional parts, and returns the longest.
+
+    :param pattern: A compiled regular expression.
+
+    :returns: A string, or None if there is no such string of at least two characters.
+    """
+    if pattern.flags & re.IGNORECASE:
+        return None
+    try:
+        parsed = _sre_parse.parse(pattern.pattern, pattern.flags)
+    except Exception:
+        return None
+    runs = [[]]
+
+    def visit(items):
+        for op, value in items:
+            if op == _sre_parse.LITERAL:
+                runs[-1].append(chr(value))
+            elif op == _sre_parse.SUBPATTERN and not value[1] and not value[2]:
+                # A group with no flags of its own.
+                visit(value[3])
+            else:
+                runs.append([])
+    visit(parsed)
+    best = max(("".join(run) for run in runs), key=len)
+    if len(best) < 2:
+        return None
+    return best
+
+class _AhoCorasick:
+    """Finds every occurrence of many strings in one pass over the text."""
+    def __init__(self, words):
+        """:param words: A list of (index, string)."""
+        self.__goto = [{}]
+        self.__fail = [0]
+        self.__output = [[]]
+        for index, word in words:
+            node = 0
+            for c in word:
+                child = self.__goto[node].get(c)
+                if child is None:
+                    child = len(self.__goto)
+                    self.__goto.append({})
+                    self.__fail.append(0)
+                    self.__output.append([])
+                    self.__goto[node][c] = child
+                node = child
+            self.__output[node].append((index, len(word)))
+
+        queue = collections.deque(self.__goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for c, child in self.__goto[node].items():
+                queue.append(child)
+                fail = self.__fail[node]
+                while fail and c not in self.__goto[fail]:
+                    fail = self.__fail[fail]
+                fail = self.__goto[fail].get(c, 0)
+                self.__fail[child] = fail
+                self.__output[child] = self.__output[child] + self.__output[fail]
+
+    def finditer(self, text):
+        """Yields (index, start, end) for each occurrence."""
+        goto = self.__goto
+        fail = self.__fail
+        output = self.__output
+        node = 0
+        for i, c in enumerate(text):
+            while node and c not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(c, 0)
+            for index, length in output[node]:
+                yield (index, i + 1 - length, i + 1)
+
+class PatternSet:
+    """Matches many regular expressions against a string at once.
+
+    One pass of the Aho-Corasick algorithm finds every literal pattern and,
+    for each other pattern, a literal string that all of its matches must
+    contain. Only patterns whose literal string was found are then run. A
+    pattern with no such string, such as `\\d+` or one that ignores case,
+    is run on every string.
+
+    :param patterns: A list of regular expressions, each either a string or a compiled pattern.
+    """
+    def __init__(self, patterns):
+        self.__patterns = []
+        # Index of the keyword -> (index of the pattern, True if the keyword is the whole pattern)
+        self.__keywords = []
+        self.__always = []
+        keywords = []
+        for i, pattern in enumerate(patterns):
+            if isinstance(pattern, str):
+                pattern = re.compile(pattern)
+            self.__patterns.append(pattern)
+            if not (pattern.flags & (re.IGNORECASE | re.VERBOSE)) and _is_literal(pattern.pattern):
+                keywords.append((len(keywords), pattern.pattern))
+                self.__keywords.append((i, True))
+                continue
+            literal = _required_literal(pattern)
+            if literal is None:
+                self.__always.append(i)
+            else:
+                keywords.append((len(keywords), literal))
+                self.__keywords.append((i, False))
+        self.__automaton = _AhoCorasick(keywords) if keywords else None
+
+    def __len__(self):
+        return len(self.__patterns)
+
+    def finditer(self, text):
+        """Finds all matches of all patterns.
+
+        Each pattern's matches don't overlap each other, as with
+        `re.finditer`, but may overlap other patterns' matches. Empty matches
+        are omitted.
+
+        :param text: The string to search.
+
+        :returns: A list of (pattern index, start, end, match) tuples sorted by start and then pattern index. `match` is a `re` match object, or None for a literal pattern.
+        """
+        results = []
+        candidates = set(self.__always)
+        if self.__automaton is not None:
+            last_end = {}
+            for keyword, start, end in self.__automaton.finditer(text):
+                index, is_pattern = self.__keywords[keyword]
+                if not is_pattern:
+                    candidates.add(index)
+                elif start >= last_end.get(index, 0):
+                    last_end[index] = end
+                    results.append((index, start, end, None))
+        for index in candidates:
+            for match in self.__patterns[index].finditer(text):
+                if match.start() != match.end():
+                    results.append((index, match.start(), match.end(), match))
+        results.sort(key=lambda result: (result[1], result[0]))
+        return results
+
+class Trigger:
+    """A pattern and the callback to run when it matches.
+
+    Don't create this yourself. Use :meth:`TriggerEngine.add_trigger`."""
+    def __init__(self, pattern, callback):
+        self.__pattern = pattern
+        self.__callback = callback
+
+    def __repr__(self):
+        return "<Trigger {!r}>".format(self.__pattern)
+
+    @property
+    def pattern(self):
+        """:returns: The regular expression, as given to :meth:`TriggerEngine.add_trigger`."""
+        return self.__pattern
+
+    @property
+    def callback(self):
+        """:returns: The function called with a :class:`TriggerMatch` on each match."""
+        return self.__callback
+
+class TriggerMatch:
+    """Describes where a trigger matched."""
+    def __init__(self, trigger, session_id, coord_range, text, match):
+        self.__trigger = trigger
+        self.__session_id = session_id
+        self.__coord_range = coord_range
+        self.__text = text
+        self.__match = match
+
+    def __repr__(self):
+        return "<TriggerMatch {} in {} at {}>".format(self.__trigger, self.__session_id, self.__coord_range)
+
+    @property
+    def trigger(self):
+        """:returns: The :class:`Trigger` that matched."""
+        return self.__trigger
+
+    @property
+    def session_id(self):
+        """:returns: The ID of the session where the match was found."""
+        return self.__session_id
+
+    @property
+    def coord_range(self):
+        """:returns: The :class:`iterm2.util.CoordRange` of the matching cells. Line numbers are absolute, counting lines lost from the head of history."""
+        return self.__coord_range
+
+    @property
+    def text(self):
+        """:returns: The matching text."""
+        return self.__text
+
+    @property
+    def groups(self):
+        """:returns: A tuple of the pattern's capture groups, as from `re.Match.groups()`. Empty for patterns without groups."""
+        if self.__match is None:
+            return ()
+        return self.__match.groups()
+
+class _SessionState:
+    def __init__(self):
+        self.line_cache = iterm2.screen._LineCache()
+        # The line number after the last row examined.
+        self.end = None
+        # First line number of a logical line -> its text.
+        self.texts = {}
+        # First line number of a logical line -> set of (trigger, start, text) already fired.
+        self.fired = {}
+        self.busy = False
+        self.again = False
+
+class TriggerEngine:
+    """Calls functions when new output matches patterns.
+
+    Callbacks take one argument, a :class:`TriggerMatch`. A callback may be
+    a coroutine function, in which case it is scheduled on the event loop.
+
+    Output already on the screen when the engine starts does not fire
+    triggers.
+
+    :param connection: The :class:`iterm2.Connection` to use.
+    :param session: A session ID to watch, or None to watch all sessions.
+    :param delay: Seconds to wait after a screen update before reading it, so bursts of output are read at once.
+    :param max_backfill_lines: The most lines to read from history when output scrolled by without being seen on the screen.
+
+    Example:
+
+      .. code-block:: python
+
+          async def on_error(match):
+              print("Error in", match.session_id, "at", match.coord_range, ":", match.text)
+
+          async with iterm2.TriggerEngine(connection) as engine:
+              engine.add_trigger(r"error: (.*)", on_error)
+              engine.add_trigger("Segmentation fault", on_error)
+              await asyncio.sleep(3600)
+    """
+    def __init__(self, connection, session=None, delay=0.05, max_backfill_lines=10000):
+        self.__connection = connection
+        self.__session = session
+        self.__delay = delay
+        self.__max_backfill_lines = max_backfill_lines
+        self.__wheel = iterm2.timer.get_timer_wheel()
+        self.__triggers = []
+        # (PatternSet, list of Trigger) built when first needed.
+        self.__compiled = None
+        self.__sessions = {}
+        self.__tokens = []
+
+    async def __aenter__(self):
+        async def async_ignore(_connection, _message):
+            pass
+
+        async def async_on_terminate(_connection, message):
+            """Called when a session terminates. Stops tracking it."""
+            self.__sessions.pop(message.uniqueIdentifier, None)
+            self.__wheel.cancel((self, message.uniqueIdentifier))
+
+        # See OutputRateMonitor for why updates are observed this way.
+        iterm2.notifications._get_dispatch_observers().append(self._observe)
+        self.__tokens.append(await iterm2.notifications.async_subscribe_to_screen_update_notification(
+            self.__connection,
+            async_ignore,
+            self.__session))
+        self.__tokens.append(await iterm2.notifications.async_subscribe_to_terminate_session_notification(
+            self.__connection,
+            async_on_terminate))
+
+        # Note what is already on screen so it doesn't fire.
+        if self.__session is not None:
+            session_ids = [self.__session]
+        else:
+            app = await iterm2.app.async_get_app(self.__connection)
+            session_ids = []
+            for window in app.terminal_windows:
+                for tab in window.tabs:
+                    session_ids.extend(session.session_id for session in tab.sessions)
+        await asyncio.gather(
+            *[self._async_scan_quietly(session_id, False) for session_id in session_ids])
+        return self
+
+    async def __aexit__(self, exc_type, exc, _tb):
+        iterm2.notifications._get_dispatch_observers().remove(self._observe)
+        for session_id in self.__sessions:
+            self.__wheel.cancel((self, session_id))
+        for token in self.__tokens:
+            await iterm2.notifications.async_unsubscribe(self.__connection, token)
+        self.__tokens = []
+
+    @property
+    def triggers(self):
+        """:returns: A list of :class:`Trigger`."""
+        return list(self.__triggers)
+
+    def add_trigger(self, pattern, callback):
+        """Adds a trigger.
+
+        :param pattern: A regular expression, either a string or a compiled pattern from the `re` module.
+        :param callback: A function or coroutine function taking a :class:`TriggerMatch`.
+
+        :returns: The new :class:`Trigger`.
+        """
+        trigger = Trigger(pattern, callback)
+        self.__triggers.append(trigger)
+        self.__compiled = None
+        return trigger
+
+    def remove_trigger(self, trigger):
+        """Removes a trigger added with :meth:`add_trigger`.
+
+        :param trigger: The :class:`Trigger` to remove.
+        """
+        self.__triggers.remove(trigger)
+        self.__compiled = None
+
+    async def async_scan_session(self, session_id):
+        """Examines a session's new output right away instead of waiting for it to update.
+
+        :param session_id: The session ID.
+
+        :throws: :class:`iterm2.rpc.RPCException` if something goes wrong.
+        """
+        await self._async_scan(session_id, True)
+
+    def _observe(self, message):
+        if not message.notification.HasField("screen_update_notification"):
+            return
+        session_id = message.notification.screen_update_notification.session
+        if self.__session is not None and session_id != self.__session:
+            return
+        key = (self, session_id)
+        if key not in self.__wheel:
+            self.__wheel.schedule(key, self.__delay, self._async_scan_quietly, session_id, True)
+
+    async def _async_scan_quietly(self, session_id, fire):
+        try:
+            await self._async_scan(session_id, fire)
+        except iterm2.rpc.RPCException:
+            # The session probably went away.
+            pass
+
+    async def _async_scan(self, session_id, fire):
+        state = self.__sessions.get(session_id)
+        if state is None:
+            state = _SessionState()
+            self.__sessions[session_id] = state
+        if state.busy:
+            state.again = True
+            return
+        state.busy = True
+        try:
+            while True:
+                state.again = False
+                await self._async_read_screen(session_id, state, fire)
+                if not state.again:
+                    break
+                # Anything that arrived meanwhile is new output.
+                fire = True
+        finally:
+            state.busy = False
+
+    async def _async_fetch_screen(self, session_id, state):
+        while True:
+            # Only lines that changed since the last fetch are transferred.
+            response = await iterm2.rpc.async_get_buffer_with_screen_contents(
+                self.__connection,
+                session_id,
+                state.line_cache.generation)
+            status = response.get_buffer_response.status
+            if status != iterm2.api_pb2.GetBufferResponse.Status.Value("OK"):
+                state.line_cache.clear()
+                raise iterm2.rpc.RPCException(iterm2.api_pb2.GetBufferResponse.Status.Name(status))
+            merged = state.line_cache.apply(response.get_buffer_response)
+            if merged is not None:
+                return iterm2.screen.ScreenContents(merged)
+            state.line_cache.clear()
+
+    async def _async_fetch_history(self, session_id, first, limit):
+        coord_range = iterm2.util.CoordRange(iterm2.util.Point(0, first), iterm2.util.Point(0, limit))
+        response = await iterm2.rpc.async_get_screen_contents(
+            self.__connection,
+            session_id,
+            iterm2.util.WindowedCoordRange(coord_range))
+        status = response.get_buffer_response.status
+        if status != iterm2.api_pb2.GetBufferResponse.Status.Value("OK"):
+            raise iterm2.rpc.RPCException(iterm2.api_pb2.GetBufferResponse.Status.Name(status))
+        return iterm2.screen.ScreenContents(response.get_buffer_response)
+
+    async def _async_read_screen(self, session_id, state, fire):
+        contents = await self._async_fetch_screen(session_id, state)
+        first = contents.windowed_coord_range.coordRange.start.y
+        rows = [(first + i, contents.line(i)) for i in range(contents.number_of_lines)]
+        backfill = []
+        if fire and state.end is not None and state.end < first:
+            # Output scrolled off the screen before it could be seen.
+            start = max(state.end, first - self.__max_backfill_lines)
+            history = await self._async_fetch_history(session_id, start, first)
+            backfill = [(start + i, history.line(i)) for i in range(history.number_of_lines)]
+        state.end = first + len(rows)
+
+        texts = {}
+        fired = {}
+        for line in self._logical_lines(backfill + rows):
+            key = line.rows[0][0]
+            previously_fired = state.fired.get(key, set())
+            if key >= first:
+                texts[key] = line.text
+                if state.texts.get(key) == line.text:
+                    fired[key] = previously_fired
+                    continue
+            fired[key] = self._match(session_id, line, previously_fired, fire)
+        state.texts = texts
+        state.fired = {key: value for key, value in fired.items() if key in texts}
+
+    def _logical_lines(self, rows):
+        """Joins soft-wrapped rows.
+
+        :returns: A list of iterm2.screen._WrappedLine.
+        """
+        lines = []
+        current = []
+        for y, line in rows:
+            current.append((y, line))
+            if line.hard_eol:
+                lines.append(iterm2.screen._WrappedLine(current))
+                current = []
+        if current:
+            lines.append(iterm2.screen._WrappedLine(current))
+        return lines
+
+    def _match(self, session_id, line, previously_fired, fire):
+        """Runs all triggers on a line, calling back for matches not in `previously_fired`.
+
+        :returns: The set of matches found.
+        """
+        if not self.__triggers:
+            return set()
+        if self.__compiled is None:
+            self.__compiled = (PatternSet([trigger.pattern for trigger in self.__triggers]), list(self.__triggers))
+        pattern_set, triggers = self.__compiled
+        found = set()
+        for index, start, end, match in pattern_set.finditer(line.text):
+            trigger = triggers[index]
+            text = line.text[start:end]
+            identity = (trigger, start, text)
+            found.add(identity)
+            if not fire or identity in previously_fired:
+                continue
+            result = trigger.callback(TriggerMatch(
+                trigger,
+                session_id,
+                line.coord_range(start, end),
+                text,
+                match))
+            if asyncio.iscoroutine(result):
+                asyncio.ensure_future(result)
+        return found
@@ -21,7 +21,15 @@ class VariableMonitor:
       :param connection: The :class:`iterm2.Connection` to use.
       :param scope: A :class:`iterm2.VariableScope`, describing the context for the name and identifier.
       :param name: The variable name, a string.
-      :param identifier: A tab, window, or session identifier. Must correspond to the passed-in scope. If the scope is `APP` this should be None.
+      :param identifier: A tab, window, or session identifier. Must correspond to the passed-in scope. If the scope is `APP` this should be None. If the scope is `SESSION` this may be "all" to watch the variable in every session, including sessions created later.
+
+      Example:
+
+        .. code-block:: python
+
+            async with iterm2.VariableMonitor(connection, iterm2.VariableScopes.SESSION, "session.hostname", "all") as mon:
+                while True:
+                    session_id, hostname = await mon.async_get_with_identifier()
         """
     def __init__(self, connection, scope, name, identifier):
         self.__connection = connection
@@ -51,6 +59,17 @@ class VariableMonitor:
         jsonNewValue = result.json_new_value
         return json.loads(jsonNewValue)
 
+    async def async_get_with_identifier(self):
+        """
+        Returns the new value of the variable and the identifier of the object it belongs to.
+
+        This is useful when monitoring "all" sessions.
+
+        :returns: A tuple of (identifier, value). The identifier is None for app scope.
+        """
+        result = await self.__queue.get()
+        return (result.identifier or None, json.loads(result.json_new_value))
+
     async def __aexit__(self, exc_type, exc, _tb):
         await iterm2.notifications.async_unsubscribe(self.__connection, self.__token)
 
@@ -34,6 +34,9 @@ setup(name='iterm2',
           'protobuf',
           'websockets',
       ],
+      extras_require={
+          'numpy': ['numpy'],
+      },
       include_package_data=True,
       zip_safe=False)
 
@@ -2641,7 +2641,7 @@ static NSString *const kDiffScriptPath = @"/tmp/diffs";
     [self registerCall:_cmd];
 }
 
-- (void)textViewDidFindDirtyRects {
+- (void)textViewDidFindDirtyRectsOnLines:(NSIndexSet *)absoluteLines allDirty:(BOOL)allDirty {
 }
 
 - (iTermBackgroundImageMode)backgroundImageMode {
@@ -783,6 +783,8 @@ typedef enum {
 - (ITMNotificationResponse *)handleAPINotificationRequest:(ITMNotificationRequest *)request
                                             connectionKey:(NSString *)connectionKey;
 - (ITMSetProfilePropertyResponse_Status)handleSetProfilePropertyForKey:(NSString *)key value:(id)value;
+// Validates all the values before setting any, so they are applied together or not at all.
+- (ITMSetProfilePropertyResponse_Status)handleSetProfileProperties:(NSDictionary<NSString *, id> *)values;
 - (ITMGetProfilePropertyResponse *)handleGetProfilePropertyForKeys:(NSArray<NSString *> *)keys;
 
 // Run a script-side function. Can include composition, references to variables.
@@ -448,6 +448,14 @@ static const NSUInteger kMaxHosts = 100;
     NSMutableDictionary<id, ITMNotificationRequest *> *_locationChangeSubscriptions;
     NSMutableDictionary<id, ITMNotificationRequest *> *_customEscapeSequenceNotifications;
 
+    // Increases each time the screen changes so API clients can fetch only the lines that changed.
+    long long _apiScreenGeneration;
+    // The generation at which every line last changed. Changed lines can't be computed relative to
+    // earlier generations.
+    long long _apiAllDirtyGeneration;
+    // Absolute line number -> generation at which it last changed. Only lines on the screen are kept.
+    NSMutableDictionary<NSNumber *, NSNumber *> *_apiLineGenerations;
+
     // Used by auto-hide. We can't auto hide the tmux gateway session until at least one window has been opened.
     BOOL _hideAfterTmuxWindowOpens;
 
@@ -616,6 +624,9 @@ static const NSUInteger kMaxHosts = 100;
         _promptSubscriptions = [[NSMutableDictionary alloc] init];
         _locationChangeSubscriptions = [[NSMutableDictionary alloc] init];
         _customEscapeSequenceNotifications = [[NSMutableDictionary alloc] init];
+        _apiScreenGeneration = 1;
+        _apiAllDirtyGeneration = 1;
+        _apiLineGenerations = [[NSMutableDictionary alloc] init];
         _metalDisabledTokens = [[NSMutableSet alloc] init];
         _statusChangedAbsLine = -1;
         _nameController = [[iTermSessionNameController alloc] init];
@@ -766,6 +777,7 @@ ITERM_WEAKLY_REFERENCEABLE
     [_promptSubscriptions release];
     [_locationChangeSubscriptions release];
     [_customEscapeSequenceNotifications release];
+    [_apiLineGenerations release];
 
     [_copyModeState release];
     [_metalDisabledTokens release];
@@ -7204,11 +7216,13 @@ ITERM_WEAKLY_REFERENCEABLE
     }
 }
 
-- (void)textViewDidFindDirtyRects {
+- (void)textViewDidFindDirtyRectsOnLines:(NSIndexSet *)absoluteLines allDirty:(BOOL)allDirty {
+    [self updateAPIScreenGenerationWithDirtyLines:absoluteLines allDirty:allDirty];
     if (_updateSubscriptions.count) {
         ITMNotification *notification = [[[ITMNotification alloc] init] autorelease];
         notification.screenUpdateNotification = [[[ITMScreenUpdateNotification alloc] init] autorelease];
         notification.screenUpdateNotification.session = self.guid;
+        notification.screenUpdateNotification.generation = _apiScreenGeneration;
         [_updateSubscriptions enumerateKeysAndObjectsUsingBlock:^(id  _Nonnull key, ITMNotificationRequest * _Nonnull obj, BOOL * _Nonnull stop) {
             [[iTermAPIHelper sharedInstance] postAPINotification:notification
                                                  toConnectionKey:key];
@@ -7216,6 +7230,45 @@ ITERM_WEAKLY_REFERENCEABLE
     }
 }
 
+- (void)updateAPIScreenGenerationWithDirtyLines:(NSIndexSet *)absoluteLines allDirty:(BOOL)allDirty {
+    _apiScreenGeneration++;
+    if (allDirty) {
+        _apiAllDirtyGeneration = _apiScreenGeneration;
+        [_apiLineGenerations removeAllObjects];
+        return;
+    }
+    NSNumber *generation = @(_apiScreenGeneration);
+    [absoluteLines enumerateIndexesUsingBlock:^(NSUInteger idx, BOOL * _Nonnull stop) {
+        _apiLineGenerations[@(idx)] = generation;
+    }];
+
+    // Forget lines that have scrolled off the screen.
+    const long long firstScreenLine = _screen.numberOfScrollbackLines + _screen.totalScrollbackOverflow;
+    NSArray<NSNumber *> *offscreen = [_apiLineGenerations.allKeys filteredArrayUsingBlock:^BOOL(NSNumber *line) {
+        return line.longLongValue < firstScreenLine;
+    }];
+    [_apiLineGenerations removeObjectsForKeys:offscreen];
+}
+
+// Returns the absolute line numbers of screen lines that changed after `generation`, or nil if
+// that can't be determined.
+- (NSIndexSet *)apiScreenLinesChangedSinceGeneration:(long long)generation {
+    if (generation < _apiAllDirtyGeneration || generation > _apiScreenGeneration) {
+        return nil;
+    }
+    const long long firstScreenLine = _screen.numberOfScrollbackLines + _screen.totalScrollbackOverflow;
+    const long long lastScreenLine = firstScreenLine + _screen.height;
+    NSMutableIndexSet *lines = [NSMutableIndexSet indexSet];
+    [_apiLineGenerations enumerateKeysAndObjectsUsingBlock:^(NSNumber * _Nonnull line, NSNumber * _Nonnull lineGeneration, BOOL * _Nonnull stop) {
+        if (lineGeneration.longLongValue > generation &&
+            line.longLongValue >= firstScreenLine &&
+            line.longLongValue < lastScreenLine) {
+            [lines addIndex:line.unsignedIntegerValue];
+        }
+    }];
+    return lines;
+}
+
 - (void)textViewBeginDrag
 {
     [[MovePaneController sharedInstance] beginDrag:self];
@@ -10386,6 +10439,51 @@ ITERM_WEAKLY_REFERENCEABLE
     return string;
 }
 
+static uint32_t PTYSessionAPIPackedColor(int mode, int red, int green, int blue) {
+    if (mode == ColorMode24bit) {
+        return (mode << 24) | (red << 16) | (green << 8) | blue;
+    }
+    return (mode << 24) | red;
+}
+
+// Appends runs describing the colors and attributes of the same cells as stringForLine:length:cppsArray:.
+- (void)appendStyleRunsForLine:(screen_char_t *)screenChars
+                        length:(int)length
+                      runArray:(NSMutableArray<ITMCellStyleRun *> *)runArray {
+    ITMCellStyleRun *run = nil;
+    for (int i = 0; i < length; ++i) {
+        const screen_char_t *c = &screenChars[i];
+        const uint32_t foreground = PTYSessionAPIPackedColor(c->foregroundColorMode, c->foregroundColor, c->fgGreen, c->fgBlue);
+        const uint32_t background = PTYSessionAPIPackedColor(c->backgroundColorMode, c->backgroundColor, c->bgGreen, c->bgBlue);
+        uint32_t flags = 0;
+        if (c->bold) {
+            flags |= ITMCellStyleRun_Flag_Bold;
+        }
+        if (c->faint) {
+            flags |= ITMCellStyleRun_Flag_Faint;
+        }
+        if (c->italic) {
+            flags |= ITMCellStyleRun_Flag_Italic;
+        }
+        if (c->blink) {
+            flags |= ITMCellStyleRun_Flag_Blink;
+        }
+        if (c->underline) {
+            flags |= ITMCellStyleRun_Flag_Underline;
+        }
+        if (run && run.foreground == foreground && run.background == background && run.flags == flags) {
+            run.repeats = run.repeats + 1;
+            continue;
+        }
+        run = [[[ITMCellStyleRun alloc] init] autorelease];
+        run.foreground = foreground;
+        run.background = background;
+        run.flags = flags;
+        run.repeats = 1;
+        [runArray addObject:run];
+    }
+}
+
 - (VT100GridAbsWindowedRange)absoluteWindowedCoordRangeFromLineRange:(ITMLineRange *)lineRange {
     if (lineRange.hasWindowedCoordRange) {
         return VT100GridAbsWindowedRangeMake(VT100GridAbsCoordRangeMake(lineRange.windowedCoordRange.coordRange.start.x,
@@ -10421,16 +10519,9 @@ ITERM_WEAKLY_REFERENCEABLE
     return VT100GridAbsWindowedRangeMake(VT100GridAbsCoordRangeMake(0, range.location, 0, range.length + 1), 0, 0);
 }
 
-- (ITMGetBufferResponse *)handleGetBufferRequest:(ITMGetBufferRequest *)request {
-    ITMGetBufferResponse *response = [[[ITMGetBufferResponse alloc] init] autorelease];
-
-    const VT100GridAbsWindowedRange windowedRange = [self absoluteWindowedCoordRangeFromLineRange:request.lineRange];
-    if (windowedRange.coordRange.start.x < 0) {
-        response.status = ITMGetBufferResponse_Status_InvalidLineRange;
-        return nil;
-    }
-
-    const VT100GridWindowedRange range = VT100GridWindowedRangeFromVT100GridAbsWindowedRange(windowedRange, _screen.totalScrollbackOverflow);
+- (void)appendAPILineContentsInRange:(VT100GridWindowedRange)range
+                       includeStyles:(BOOL)includeStyles
+                          toResponse:(ITMGetBufferResponse *)response {
     iTermTextExtractor *extractor = [iTermTextExtractor textExtractorWithDataSource:_screen];
     __block int firstIndex = -1;
     __block int lastIndex = -1;
@@ -10440,6 +10531,11 @@ ITERM_WEAKLY_REFERENCEABLE
         lineContents.text = [self stringForLine:line + firstIndex
                                          length:lastIndex - firstIndex
                                       cppsArray:lineContents.codePointsPerCellArray];
+        if (includeStyles) {
+            [self appendStyleRunsForLine:line + firstIndex
+                                  length:lastIndex - firstIndex
+                                runArray:lineContents.styleRunsArray];
+        }
         switch (code) {
             case EOL_HARD:
                 lineContents.continuation = ITMLineContents_Continuation_ContinuationHardEol;
@@ -10471,6 +10567,38 @@ ITERM_WEAKLY_REFERENCEABLE
     if (line) {
         handleEol(EOL_SOFT, 0, 0);
     }
+}
+
+- (ITMGetBufferResponse *)handleGetBufferRequest:(ITMGetBufferRequest *)request {
+    ITMGetBufferResponse *response = [[[ITMGetBufferResponse alloc] init] autorelease];
+
+    const VT100GridAbsWindowedRange windowedRange = [self absoluteWindowedCoordRangeFromLineRange:request.lineRange];
+    if (windowedRange.coordRange.start.x < 0) {
+        response.status = ITMGetBufferResponse_Status_InvalidLineRange;
+        return nil;
+    }
+
+    NSIndexSet *changedLines = nil;
+    if (request.hasSinceGeneration && request.lineRange.hasScreenContentsOnly) {
+        changedLines = [self apiScreenLinesChangedSinceGeneration:request.sinceGeneration];
+    }
+    if (changedLines) {
+        response.delta = YES;
+        [changedLines enumerateIndexesUsingBlock:^(NSUInteger idx, BOOL * _Nonnull stop) {
+            const VT100GridAbsWindowedRange lineRange =
+                VT100GridAbsWindowedRangeMake(VT100GridAbsCoordRangeMake(0, idx, 0, idx + 1), 0, 0);
+            [self appendAPILineContentsInRange:VT100GridWindowedRangeFromVT100GridAbsWindowedRange(lineRange, _screen.totalScrollbackOverflow)
+                                 includeStyles:request.includeStyles
+                                    toResponse:response];
+            [response.changedLinesArray addValue:idx];
+        }];
+    } else {
+        const VT100GridWindowedRange range = VT100GridWindowedRangeFromVT100GridAbsWindowedRange(windowedRange, _screen.totalScrollbackOverflow);
+        [self appendAPILineContentsInRange:range
+                             includeStyles:request.includeStyles
+                                toResponse:response];
+    }
+    response.generation = _apiScreenGeneration;
     response.cursor = [[[ITMCoord alloc] init] autorelease];
     response.cursor.x = _screen.currentGrid.cursor.x;
     response.cursor.y = _screen.currentGrid.cursor.y + _screen.numberOfScrollbackLines + _screen.totalScrollbackOverflow;
@@ -10586,12 +10714,18 @@ ITERM_WEAKLY_REFERENCEABLE
 }
 
 - (ITMSetProfilePropertyResponse_Status)handleSetProfilePropertyForKey:(NSString *)key value:(id)value {
-    if (![iTermProfilePreferences valueIsLegal:value forKey:key]) {
-        XLog(@"Value %@ is not legal for key %@", value, key);
-        return ITMSetProfilePropertyResponse_Status_RequestMalformed;
+    return [self handleSetProfileProperties:@{ key: value }];
+}
+
+- (ITMSetProfilePropertyResponse_Status)handleSetProfileProperties:(NSDictionary<NSString *, id> *)values {
+    for (NSString *key in values) {
+        if (![iTermProfilePreferences valueIsLegal:values[key] forKey:key]) {
+            XLog(@"Value %@ is not legal for key %@", values[key], key);
+            return ITMSetProfilePropertyResponse_Status_RequestMalformed;
+        }
     }
 
-    [self setSessionSpecificProfileValues:@{ key: value }];
+    [self setSessionSpecificProfileValues:values];
     return ITMSetProfilePropertyResponse_Status_Ok;
 }
 
@@ -138,7 +138,9 @@ typedef NS_ENUM(NSInteger, PTYTextViewSelectionExtensionUnit) {
 - (BOOL)textViewHasCoprocess;
 - (void)textViewPostTabContentsChangedNotification;
 - (void)textViewInvalidateRestorableState;
-- (void)textViewDidFindDirtyRects;
+// absoluteLines holds the absolute line numbers of the screen lines that changed. If allDirty is
+// YES everything changed and absoluteLines is empty.
+- (void)textViewDidFindDirtyRectsOnLines:(NSIndexSet *)absoluteLines allDirty:(BOOL)allDirty;
 - (void)textViewBeginDrag;
 - (void)textViewMovePane;
 - (void)textViewSwapPane;
@@ -6650,6 +6650,7 @@ static double EuclideanDistance(NSPoint p1, NSPoint p2) {
     }
 
     // Remove results from dirty lines and mark parts of the view as needing display.
+    NSMutableIndexSet *dirtyLines = [NSMutableIndexSet indexSet];
     if (allDirty) {
         foundDirty = YES;
         [_findOnPageHelper removeHighlightsInRange:NSMakeRange(lineStart + totalScrollbackOverflow,
@@ -6660,6 +6661,7 @@ static double EuclideanDistance(NSPoint p1, NSPoint p2) {
             VT100GridRange range = [_dataSource dirtyRangeForLine:y - lineStart];
             if (range.length > 0) {
                 foundDirty = YES;
+                [dirtyLines addIndex:y + totalScrollbackOverflow];
                 [_findOnPageHelper removeHighlightsInRange:NSMakeRange(y + totalScrollbackOverflow, 1)];
                 [_findOnPageHelper removeSearchResultsInRange:NSMakeRange(y + totalScrollbackOverflow, 1)];
                 [self setNeedsDisplayOnLine:y inRange:range];
@@ -6687,7 +6689,7 @@ static double EuclideanDistance(NSPoint p1, NSPoint p2) {
     if (foundDirty) {
         [_dataSource saveToDvr];
         [_delegate textViewInvalidateRestorableState];
-        [_delegate textViewDidFindDirtyRects];
+        [_delegate textViewDidFindDirtyRectsOnLines:dirtyLines allDirty:allDirty];
     }
 
     if (foundDirty && [_dataSource shouldSendContentsChangedNotification]) {
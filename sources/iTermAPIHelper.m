@@ -208,6 +208,9 @@ static id sAPIHelperInstance;
     // signature -> ( connection, request )
     NSMutableDictionary<NSString *, iTermTuple<id, ITMNotificationRequest *> *> *_internalServerOriginatedRPCSubscriptions;
     NSMutableArray<iTermAllSessionsSubscription *> *_allSessionsSubscriptions;
+    // Session variable subscriptions with the identifier "all". Each session gets a reference in
+    // _sessionVariableSubscriptions for each of these, including sessions created later.
+    NSMutableArray<iTermAllSessionsSubscription *> *_allSessionsVariableSubscriptions;
     NSMutableDictionary<NSString *, iTermServerOriginatedRPCCompletionBlock> *_serverOriginatedRPCCompletionBlocks;
     // connectionKey -> RPC ID (RPC ID is key in _serverOriginatedRPCCompletionBlocks)
     // WARNING: These can exist after the block has been removed from
@@ -273,6 +276,7 @@ static id sAPIHelperInstance;
         _serverOriginatedRPCCompletionBlocks = [NSMutableDictionary dictionary];
         _outstandingRPCs = [NSMutableDictionary dictionary];
         _allSessionsSubscriptions = [NSMutableArray array];
+        _allSessionsVariableSubscriptions = [NSMutableArray array];
 
         [[NSNotificationCenter defaultCenter] addObserver:self
                                                  selector:@selector(sessionDidTerminate:)
@@ -352,6 +356,12 @@ static id sAPIHelperInstance;
         [session handleAPINotificationRequest:sub.request
                                 connectionKey:sub.connectionKey];
     }
+    for (iTermAllSessionsSubscription *sub in _allSessionsVariableSubscriptions) {
+        [self addVariableReferenceForRequest:sub.request
+                                  identifier:session.guid
+                                       scope:session.variablesScope
+                               connectionKey:sub.connectionKey];
+    }
 
     [_newSessionSubscriptions enumerateKeysAndObjectsUsingBlock:^(id  _Nonnull key, ITMNotificationRequest * _Nonnull obj, BOOL * _Nonnull stop) {
         ITMNotification *notification = [[ITMNotification alloc] init];
@@ -369,6 +379,29 @@ static id sAPIHelperInstance;
         notification.terminateSessionNotification.uniqueIdentifier = session.guid;
         [self postAPINotification:notification toConnectionKey:key];
     }];
+    [self removeAllSessionsVariableReferencesForSession:session];
+}
+
+// Drops the references that "all" session variable subscriptions added for a session. They would
+// otherwise keep the dead session's scope alive until the subscriber unsubscribes.
+- (void)removeAllSessionsVariableReferencesForSession:(PTYSession *)session {
+    if (_allSessionsVariableSubscriptions.count == 0) {
+        return;
+    }
+    iTermVariableScope *scope = session.variablesScope;
+    NSMutableDictionary<id, NSMutableArray<iTermTuple<ITMNotificationRequest *, iTermVariableReference *> *> *> *subscriptions =
+        [self subscriptionsForVariableChangeScope:ITMVariableScope_Session];
+    for (iTermAllSessionsSubscription *sub in _allSessionsVariableSubscriptions) {
+        NSMutableArray<iTermTuple<ITMNotificationRequest *, iTermVariableReference *> *> *array = subscriptions[sub.connectionKey];
+        [array removeObjectsPassingTest:^BOOL(iTermTuple<ITMNotificationRequest *, iTermVariableReference *> *tuple) {
+            if (tuple.secondObject.scope != scope ||
+                ![NSObject object:tuple.firstObject.variableMonitorRequest isEqualToObject:sub.request.variableMonitorRequest]) {
+                return NO;
+            }
+            [tuple.secondObject removeAllLinks];
+            return YES;
+        }];
+    }
 }
 
 - (void)layoutChanged:(NSNotification *)notification {
@@ -1081,6 +1114,10 @@ static id sAPIHelperInstance;
         response.status = ITMNotificationResponse_Status_RequestMalformed;
         return response;
     }
+    if ([request.variableMonitorRequest.identifier isEqualToString:@"all"]) {
+        return [self handleAllSessionsVariableChangeNotificationRequest:request
+                                                          connectionKey:connectionKey];
+    }
     NSMutableDictionary<id, NSMutableArray<iTermTuple<ITMNotificationRequest *, iTermVariableReference *> *> *> *subscriptions =
         [self subscriptionsForVariableChangeScope:request.variableMonitorRequest.scope];
     NSMutableArray *array = subscriptions[connectionKey];
@@ -1100,21 +1137,10 @@ static id sAPIHelperInstance;
             response.status = ITMNotificationResponse_Status_InvalidIdentifier;
             return response;
         }
-        NSString *name = request.variableMonitorRequest.name;
-        iTermVariableReference *ref = [[iTermVariableReference alloc] initWithPath:name
-                                                                             scope:scope];
-        __weak __typeof(ref) weakRef = ref;
-        __weak __typeof(self) weakSelf = self;
-        ref.onChangeBlock = ^{
-            ITMNotification *notification = [weakSelf variableChangeNotificationWithScope:request.variableMonitorRequest.scope
-                                                                               identifier:identifier
-                                                                                     name:name
-                                                                                 newValue:weakRef.value];
-            if (notification) {
-                [weakSelf postAPINotification:notification toConnectionKey:connectionKey];
-            }
-        };
-        [subscriptions it_addObject:[iTermTuple tupleWithObject:request andObject:ref] toMutableArrayForKey:connectionKey];
+        [self addVariableReferenceForRequest:request
+                                  identifier:identifier
+                                       scope:scope
+                               connectionKey:connectionKey];
     } else {
         if (index == NSNotFound) {
             response.status = ITMNotificationResponse_Status_NotSubscribed;
@@ -1128,6 +1154,79 @@ static id sAPIHelperInstance;
     return response;
 }
 
+// Subscribes to a variable in every session, present and future. Notifications carry the
+// identifier of the session whose variable changed.
+- (ITMNotificationResponse *)handleAllSessionsVariableChangeNotificationRequest:(ITMNotificationRequest *)request
+                                                                 connectionKey:(NSString *)connectionKey {
+    ITMNotificationResponse *response = [[ITMNotificationResponse alloc] init];
+    if (request.variableMonitorRequest.scope != ITMVariableScope_Session) {
+        response.status = ITMNotificationResponse_Status_InvalidIdentifier;
+        return response;
+    }
+    const NSInteger index = [_allSessionsVariableSubscriptions indexOfObjectPassingTest:^BOOL(iTermAllSessionsSubscription * _Nonnull sub,
+                                                                                             NSUInteger idx,
+                                                                                             BOOL * _Nonnull stop) {
+        return ([sub.connectionKey isEqual:connectionKey] &&
+                [NSObject object:sub.request.variableMonitorRequest isEqualToObject:request.variableMonitorRequest]);
+    }];
+    if (request.subscribe) {
+        if (index != NSNotFound) {
+            response.status = ITMNotificationResponse_Status_AlreadySubscribed;
+            return response;
+        }
+        iTermAllSessionsSubscription *sub = [[iTermAllSessionsSubscription alloc] init];
+        sub.request = [request copy];
+        sub.connectionKey = connectionKey;
+        [_allSessionsVariableSubscriptions addObject:sub];
+        for (PTYSession *session in [self allSessions]) {
+            [self addVariableReferenceForRequest:sub.request
+                                      identifier:session.guid
+                                           scope:session.variablesScope
+                                   connectionKey:connectionKey];
+        }
+    } else {
+        if (index == NSNotFound) {
+            response.status = ITMNotificationResponse_Status_NotSubscribed;
+            return response;
+        }
+        [_allSessionsVariableSubscriptions removeObjectAtIndex:index];
+        NSMutableArray<iTermTuple<ITMNotificationRequest *, iTermVariableReference *> *> *array =
+            [self subscriptionsForVariableChangeScope:ITMVariableScope_Session][connectionKey];
+        [array removeObjectsPassingTest:^BOOL(iTermTuple<ITMNotificationRequest *, iTermVariableReference *> *tuple) {
+            if (![NSObject object:tuple.firstObject.variableMonitorRequest isEqualToObject:request.variableMonitorRequest]) {
+                return NO;
+            }
+            [tuple.secondObject removeAllLinks];
+            return YES;
+        }];
+    }
+    response.status = ITMNotificationResponse_Status_Ok;
+    return response;
+}
+
+- (void)addVariableReferenceForRequest:(ITMNotificationRequest *)request
+                            identifier:(NSString *)identifier
+                                 scope:(iTermVariableScope *)scope
+                         connectionKey:(NSString *)connectionKey {
+    NSString *name = request.variableMonitorRequest.name;
+    iTermVariableReference *ref = [[iTermVariableReference alloc] initWithPath:name
+                                                                         scope:scope];
+    __weak __typeof(ref) weakRef = ref;
+    __weak __typeof(self) weakSelf = self;
+    ref.onChangeBlock = ^{
+        ITMNotification *notification = [weakSelf variableChangeNotificationWithScope:request.variableMonitorRequest.scope
+                                                                           identifier:identifier
+                                                                                 name:name
+                                                                             newValue:weakRef.value];
+        if (notification) {
+            [weakSelf postAPINotification:notification toConnectionKey:connectionKey];
+        }
+    };
+    NSMutableDictionary<id, NSMutableArray<iTermTuple<ITMNotificationRequest *, iTermVariableReference *> *> *> *subscriptions =
+        [self subscriptionsForVariableChangeScope:request.variableMonitorRequest.scope];
+    [subscriptions it_addObject:[iTermTuple tupleWithObject:request andObject:ref] toMutableArrayForKey:connectionKey];
+}
+
 - (ITMNotification *)variableChangeNotificationWithScope:(ITMVariableScope)scope
                                               identifier:(NSString *)identifier
                                                     name:(NSString *)variableName
@@ -1336,6 +1435,9 @@ static id sAPIHelperInstance;
     [_allSessionsSubscriptions removeObjectsPassingTest:^BOOL(iTermAllSessionsSubscription *sub) {
         return [sub.connectionKey isEqual:connectionKey];
     }];
+    [_allSessionsVariableSubscriptions removeObjectsPassingTest:^BOOL(iTermAllSessionsSubscription *sub) {
+        return [sub.connectionKey isEqual:connectionKey];
+    }];
     if (rpcsRemoved) {
         [[NSNotificationCenter defaultCenter] postNotificationName:iTermAPIRegisteredFunctionsDidChangeNotification
                                                             object:nil];
@@ -1396,7 +1498,7 @@ static id sAPIHelperInstance;
 - (void)apiServerSetProfileProperty:(ITMSetProfilePropertyRequest *)request
                             handler:(void (^)(ITMSetProfilePropertyResponse *))handler {
     ITMSetProfilePropertyResponse *response = [[ITMSetProfilePropertyResponse alloc] init];
-    ITMSetProfilePropertyResponse_Status (^setter)(id object, NSString *key, id value) = nil;
+    ITMSetProfilePropertyResponse_Status (^setter)(id object, NSDictionary *values) = nil;
     NSMutableArray *objects = [NSMutableArray array];
 
     switch (request.targetOneOfCase) {
@@ -1407,9 +1509,9 @@ static id sAPIHelperInstance;
         }
 
         case ITMSetProfilePropertyRequest_Target_OneOfCase_GuidList: {
-            setter = ^ITMSetProfilePropertyResponse_Status(id object, NSString *key, id value) {
+            setter = ^ITMSetProfilePropertyResponse_Status(id object, NSDictionary *values) {
                 Profile *profile = object;
-                [iTermProfilePreferences setObject:value forKey:key inProfile:profile model:[ProfileModel sharedInstance]];
+                [iTermProfilePreferences setObjectsFromDictionary:values inProfile:profile model:[ProfileModel sharedInstance]];
                 return ITMSetProfilePropertyResponse_Status_Ok;
             };
             for (NSString *guid in request.guidList.guidsArray) {
@@ -1425,8 +1527,8 @@ static id sAPIHelperInstance;
         }
 
         case ITMSetProfilePropertyRequest_Target_OneOfCase_Session: {
-            setter = ^ITMSetProfilePropertyResponse_Status(id object, NSString *key, id value) {
-                return [(PTYSession *)object handleSetProfilePropertyForKey:request.key value:value];
+            setter = ^ITMSetProfilePropertyResponse_Status(id object, NSDictionary *values) {
+                return [(PTYSession *)object handleSetProfileProperties:values];
             };
             if ([request.session isEqualToString:@"all"]) {
                 [objects addObjectsFromArray:[self allSessions]];
@@ -1444,19 +1546,32 @@ static id sAPIHelperInstance;
         }
     }
 
-    NSError *error = nil;
-    id value = [NSJSONSerialization JSONObjectWithData:[request.jsonValue dataUsingEncoding:NSUTF8StringEncoding]
-                                               options:NSJSONReadingAllowFragments
-                                                 error:&error];
-    if (!value || error) {
-        XLog(@"JSON parsing error %@ for value in request %@", error, request);
-        ITMSetProfilePropertyResponse *response = [[ITMSetProfilePropertyResponse alloc] init];
-        response.status = ITMSetProfilePropertyResponse_Status_RequestMalformed;
-        handler(response);
+    // Decode every value before changing anything so a bad one leaves all profiles untouched.
+    NSArray<ITMProfileProperty *> *assignments = request.assignmentsArray;
+    if (!assignments.count) {
+        ITMProfileProperty *property = [[ITMProfileProperty alloc] init];
+        property.key = request.key;
+        property.jsonValue = request.jsonValue;
+        assignments = @[ property ];
+    }
+    NSMutableDictionary *values = [NSMutableDictionary dictionary];
+    for (ITMProfileProperty *property in assignments) {
+        NSError *error = nil;
+        id value = [NSJSONSerialization JSONObjectWithData:[property.jsonValue dataUsingEncoding:NSUTF8StringEncoding]
+                                                   options:NSJSONReadingAllowFragments
+                                                     error:&error];
+        if (!value || error || !property.key.length) {
+            XLog(@"JSON parsing error %@ for value in request %@", error, request);
+            ITMSetProfilePropertyResponse *response = [[ITMSetProfilePropertyResponse alloc] init];
+            response.status = ITMSetProfilePropertyResponse_Status_RequestMalformed;
+            handler(response);
+            return;
+        }
+        values[property.key] = value;
     }
 
     for (id object in objects) {
-        response.status = setter(object, request.key, value);
+        response.status = setter(object, values);
         if (response.status != ITMSetProfilePropertyResponse_Status_Ok) {
             handler(response);
             return;
@@ -32,6 +32,7 @@ CF_EXTERN_C_BEGIN
 @class ITMActivateResponse;
 @class ITMBroadcastDomain;
 @class ITMBroadcastDomainsChangedNotification;
+@class ITMCellStyleRun;
 @class ITMCloseRequest;
 @class ITMCloseRequest_CloseSessions;
 @class ITMCloseRequest_CloseTabs;
@@ -814,6 +815,24 @@ GPBEnumDescriptor *ITMLineContents_Continuation_EnumDescriptor(void);
  **/
 BOOL ITMLineContents_Continuation_IsValidValue(int32_t value);
 
+#pragma mark - Enum ITMCellStyleRun_Flag
+
+typedef GPB_ENUM(ITMCellStyleRun_Flag) {
+  ITMCellStyleRun_Flag_Bold = 1,
+  ITMCellStyleRun_Flag_Faint = 2,
+  ITMCellStyleRun_Flag_Italic = 4,
+  ITMCellStyleRun_Flag_Blink = 8,
+  ITMCellStyleRun_Flag_Underline = 16,
+};
+
+GPBEnumDescriptor *ITMCellStyleRun_Flag_EnumDescriptor(void);
+
+/**
+ * Checks to see if the given value is defined by the enum or was not known at
+ * the time this source was generated.
+ **/
+BOOL ITMCellStyleRun_Flag_IsValidValue(int32_t value);
+
 #pragma mark - Enum ITMSendTextResponse_Status
 
 typedef GPB_ENUM(ITMSendTextResponse_Status) {
@@ -3184,7 +3203,10 @@ typedef GPB_ENUM(ITMVariableMonitorRequest_FieldNumber) {
 @property(nonatomic, readwrite) ITMVariableScope scope;
 
 @property(nonatomic, readwrite) BOOL hasScope;
-/** Session, Window, or Tab identifier. */
+/**
+ * Session, Window, or Tab identifier. For SESSION scope, "all" subscribes to the variable in
+ * every session, including those created later. Notifications give the session's identifier.
+ **/
 @property(nonatomic, readwrite, copy, null_resettable) NSString *identifier;
 /** Test to see if @c identifier has been set. */
 @property(nonatomic, readwrite) BOOL hasIdentifier;
@@ -3511,6 +3533,7 @@ typedef GPB_ENUM(ITMKeystrokeNotification_FieldNumber) {
 
 typedef GPB_ENUM(ITMScreenUpdateNotification_FieldNumber) {
   ITMScreenUpdateNotification_FieldNumber_Session = 1,
+  ITMScreenUpdateNotification_FieldNumber_Generation = 2,
 };
 
 @interface ITMScreenUpdateNotification : GPBMessage
@@ -3519,6 +3542,10 @@ typedef GPB_ENUM(ITMScreenUpdateNotification_FieldNumber) {
 /** Test to see if @c session has been set. */
 @property(nonatomic, readwrite) BOOL hasSession;
 
+/** The screen's generation after this update. See GetBufferRequest.since_generation. */
+@property(nonatomic, readwrite) int64_t generation;
+
+@property(nonatomic, readwrite) BOOL hasGeneration;
 @end
 
 #pragma mark - ITMPromptNotification
@@ -3709,6 +3736,8 @@ typedef GPB_ENUM(ITMLayoutChangedNotification_FieldNumber) {
 typedef GPB_ENUM(ITMGetBufferRequest_FieldNumber) {
   ITMGetBufferRequest_FieldNumber_Session = 1,
   ITMGetBufferRequest_FieldNumber_LineRange = 2,
+  ITMGetBufferRequest_FieldNumber_SinceGeneration = 3,
+  ITMGetBufferRequest_FieldNumber_IncludeStyles = 4,
 };
 
 /**
@@ -3726,6 +3755,22 @@ typedef GPB_ENUM(ITMGetBufferRequest_FieldNumber) {
 /** Test to see if @c lineRange has been set. */
 @property(nonatomic, readwrite) BOOL hasLineRange;
 
+/**
+ * If set, return only the lines that changed after this generation, which should come from an
+ * earlier GetBufferResponse.generation. Only honored when line_range.screen_contents_only is
+ * set. If the server can't tell which lines changed since then (for example, because the
+ * session was resized) it returns all the lines and `delta` is false in the response.
+ **/
+@property(nonatomic, readwrite) int64_t sinceGeneration;
+
+@property(nonatomic, readwrite) BOOL hasSinceGeneration;
+/**
+ * If set, each LineContents in the response includes `style_runs` giving the colors and
+ * attributes of its cells.
+ **/
+@property(nonatomic, readwrite) BOOL includeStyles;
+
+@property(nonatomic, readwrite) BOOL hasIncludeStyles;
 @end
 
 #pragma mark - ITMGetBufferResponse
@@ -3737,6 +3782,9 @@ typedef GPB_ENUM(ITMGetBufferResponse_FieldNumber) {
   ITMGetBufferResponse_FieldNumber_Cursor = 4,
   ITMGetBufferResponse_FieldNumber_NumLinesAboveScreen = 5,
   ITMGetBufferResponse_FieldNumber_WindowedCoordRange = 6,
+  ITMGetBufferResponse_FieldNumber_Generation = 7,
+  ITMGetBufferResponse_FieldNumber_Delta = 8,
+  ITMGetBufferResponse_FieldNumber_ChangedLinesArray = 9,
 };
 
 /**
@@ -3774,6 +3822,25 @@ typedef GPB_ENUM(ITMGetBufferResponse_FieldNumber) {
 /** Test to see if @c windowedCoordRange has been set. */
 @property(nonatomic, readwrite) BOOL hasWindowedCoordRange;
 
+/**
+ * Increases each time the screen changes. Pass it as since_generation to get only the lines
+ * that change after this response.
+ **/
+@property(nonatomic, readwrite) int64_t generation;
+
+@property(nonatomic, readwrite) BOOL hasGeneration;
+/**
+ * If true, `contents` holds only the lines that changed since the requested generation. Lines
+ * in windowed_coord_range that are not included are unchanged.
+ **/
+@property(nonatomic, readwrite) BOOL delta;
+
+@property(nonatomic, readwrite) BOOL hasDelta;
+/** When `delta` is true, the absolute line number (see Coord.y) of each entry in `contents`. */
+@property(nonatomic, readwrite, strong, null_resettable) GPBInt64Array *changedLinesArray;
+/** The number of items in @c changedLinesArray without causing the array to be created. */
+@property(nonatomic, readonly) NSUInteger changedLinesArray_Count;
+
 @end
 
 #pragma mark - ITMGetPromptRequest
@@ -3900,6 +3967,7 @@ typedef GPB_ENUM(ITMSetProfilePropertyRequest_FieldNumber) {
   ITMSetProfilePropertyRequest_FieldNumber_GuidList = 2,
   ITMSetProfilePropertyRequest_FieldNumber_Key = 3,
   ITMSetProfilePropertyRequest_FieldNumber_JsonValue = 4,
+  ITMSetProfilePropertyRequest_FieldNumber_AssignmentsArray = 5,
 };
 
 typedef GPB_ENUM(ITMSetProfilePropertyRequest_Target_OneOfCase) {
@@ -3944,6 +4012,15 @@ typedef GPB_ENUM(ITMSetProfilePropertyRequest_Target_OneOfCase) {
 /** Test to see if @c jsonValue has been set. */
 @property(nonatomic, readwrite) BOOL hasJsonValue;
 
+/**
+ * To set several properties in one request, leave `key` and `json_value` unset and give each
+ * key and value here instead. They are applied together: if any value is malformed or not
+ * allowed for its key, none are applied.
+ **/
+@property(nonatomic, readwrite, strong, null_resettable) NSMutableArray<ITMProfileProperty*> *assignmentsArray;
+/** The number of items in @c assignmentsArray without causing the array to be created. */
+@property(nonatomic, readonly) NSUInteger assignmentsArray_Count;
+
 @end
 
 /**
@@ -4121,6 +4198,7 @@ typedef GPB_ENUM(ITMLineContents_FieldNumber) {
   ITMLineContents_FieldNumber_Text = 1,
   ITMLineContents_FieldNumber_CodePointsPerCellArray = 2,
   ITMLineContents_FieldNumber_Continuation = 3,
+  ITMLineContents_FieldNumber_StyleRunsArray = 4,
 };
 
 /**
@@ -4189,6 +4267,15 @@ typedef GPB_ENUM(ITMLineContents_FieldNumber) {
 @property(nonatomic, readwrite) ITMLineContents_Continuation continuation;
 
 @property(nonatomic, readwrite) BOOL hasContinuation;
+/**
+ * Only present when GetBufferRequest.include_styles was set. Describes the same cells as
+ * `code_points_per_cell`, in order, run-length encoded: the sum of `repeats` equals the sum of
+ * `repeats` in `code_points_per_cell`.
+ **/
+@property(nonatomic, readwrite, strong, null_resettable) NSMutableArray<ITMCellStyleRun*> *styleRunsArray;
+/** The number of items in @c styleRunsArray without causing the array to be created. */
+@property(nonatomic, readonly) NSUInteger styleRunsArray_Count;
+
 @end
 
 #pragma mark - ITMCodePointsPerCell
@@ -4210,6 +4297,43 @@ typedef GPB_ENUM(ITMCodePointsPerCell_FieldNumber) {
 @property(nonatomic, readwrite) BOOL hasRepeats;
 @end
 
+#pragma mark - ITMCellStyleRun
+
+typedef GPB_ENUM(ITMCellStyleRun_FieldNumber) {
+  ITMCellStyleRun_FieldNumber_Foreground = 1,
+  ITMCellStyleRun_FieldNumber_Background = 2,
+  ITMCellStyleRun_FieldNumber_Flags = 3,
+  ITMCellStyleRun_FieldNumber_Repeats = 4,
+};
+
+/**
+ * The colors and attributes shared by a run of adjacent cells.
+ *
+ * A color is packed into 32 bits. The top byte is its mode:
+ *   0: An alternate color. The low byte is 0 for the default color, 1 for the selection color,
+ *      2 for the cursor color, 3 for the reversed default color, or 4 for the system message
+ *      color.
+ *   1: An entry in the 256-color palette, given by the low byte. Entries 0-15 are the ANSI colors.
+ *   2: A 24-bit color. Bits 16-23 are red, 8-15 are green, and 0-7 are blue.
+ **/
+@interface ITMCellStyleRun : GPBMessage
+
+@property(nonatomic, readwrite) uint32_t foreground;
+
+@property(nonatomic, readwrite) BOOL hasForeground;
+@property(nonatomic, readwrite) uint32_t background;
+
+@property(nonatomic, readwrite) BOOL hasBackground;
+/** A bitwise OR of values from `Flag`. */
+@property(nonatomic, readwrite) uint32_t flags;
+
+@property(nonatomic, readwrite) BOOL hasFlags;
+/** Number of adjacent cells with this style (always one or more). */
+@property(nonatomic, readwrite) int32_t repeats;
+
+@property(nonatomic, readwrite) BOOL hasRepeats;
+@end
+
 #pragma mark - ITMListSessionsRequest
 
 @interface ITMListSessionsRequest : GPBMessage
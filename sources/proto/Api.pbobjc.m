@@ -8004,10 +8004,12 @@ typedef struct ITMKeystrokeNotification__storage_ {
 @implementation ITMScreenUpdateNotification
 
 @dynamic hasSession, session;
+@dynamic hasGeneration, generation;
 
 typedef struct ITMScreenUpdateNotification__storage_ {
   uint32_t _has_storage_[1];
   NSString *session;
+  int64_t generation;
 } ITMScreenUpdateNotification__storage_;
 
 // This method is threadsafe because it is initially called
@@ -8025,6 +8027,15 @@ typedef struct ITMScreenUpdateNotification__storage_ {
         .flags = GPBFieldOptional,
         .dataType = GPBDataTypeString,
       },
+      {
+        .name = "generation",
+        .dataTypeSpecific.className = NULL,
+        .number = ITMScreenUpdateNotification_FieldNumber_Generation,
+        .hasIndex = 1,
+        .offset = (uint32_t)offsetof(ITMScreenUpdateNotification__storage_, generation),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
     };
     GPBDescriptor *localDescriptor =
         [GPBDescriptor allocDescriptorForClass:[ITMScreenUpdateNotification class]
@@ -8550,11 +8561,14 @@ typedef struct ITMLayoutChangedNotification__storage_ {
 
 @dynamic hasSession, session;
 @dynamic hasLineRange, lineRange;
+@dynamic hasSinceGeneration, sinceGeneration;
+@dynamic hasIncludeStyles, includeStyles;
 
 typedef struct ITMGetBufferRequest__storage_ {
   uint32_t _has_storage_[1];
   NSString *session;
   ITMLineRange *lineRange;
+  int64_t sinceGeneration;
 } ITMGetBufferRequest__storage_;
 
 // This method is threadsafe because it is initially called
@@ -8581,6 +8595,24 @@ typedef struct ITMGetBufferRequest__storage_ {
         .flags = GPBFieldOptional,
         .dataType = GPBDataTypeMessage,
       },
+      {
+        .name = "sinceGeneration",
+        .dataTypeSpecific.className = NULL,
+        .number = ITMGetBufferRequest_FieldNumber_SinceGeneration,
+        .hasIndex = 2,
+        .offset = (uint32_t)offsetof(ITMGetBufferRequest__storage_, sinceGeneration),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "includeStyles",
+        .dataTypeSpecific.className = NULL,
+        .number = ITMGetBufferRequest_FieldNumber_IncludeStyles,
+        .hasIndex = 3,
+        .offset = 4,  // Stored in _has_storage_ to save space.
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeBool,
+      },
     };
     GPBDescriptor *localDescriptor =
         [GPBDescriptor allocDescriptorForClass:[ITMGetBufferRequest class]
@@ -8608,6 +8640,9 @@ typedef struct ITMGetBufferRequest__storage_ {
 @dynamic hasCursor, cursor;
 @dynamic hasNumLinesAboveScreen, numLinesAboveScreen;
 @dynamic hasWindowedCoordRange, windowedCoordRange;
+@dynamic hasGeneration, generation;
+@dynamic hasDelta, delta;
+@dynamic changedLinesArray, changedLinesArray_Count;
 
 typedef struct ITMGetBufferResponse__storage_ {
   uint32_t _has_storage_[1];
@@ -8616,7 +8651,9 @@ typedef struct ITMGetBufferResponse__storage_ {
   NSMutableArray *contentsArray;
   ITMCoord *cursor;
   ITMWindowedCoordRange *windowedCoordRange;
+  GPBInt64Array *changedLinesArray;
   int64_t numLinesAboveScreen;
+  int64_t generation;
 } ITMGetBufferResponse__storage_;
 
 // This method is threadsafe because it is initially called
@@ -8679,6 +8716,33 @@ typedef struct ITMGetBufferResponse__storage_ {
         .flags = GPBFieldOptional,
         .dataType = GPBDataTypeMessage,
       },
+      {
+        .name = "generation",
+        .dataTypeSpecific.className = NULL,
+        .number = ITMGetBufferResponse_FieldNumber_Generation,
+        .hasIndex = 5,
+        .offset = (uint32_t)offsetof(ITMGetBufferResponse__storage_, generation),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt64,
+      },
+      {
+        .name = "delta",
+        .dataTypeSpecific.className = NULL,
+        .number = ITMGetBufferResponse_FieldNumber_Delta,
+        .hasIndex = 6,
+        .offset = 7,  // Stored in _has_storage_ to save space.
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeBool,
+      },
+      {
+        .name = "changedLinesArray",
+        .dataTypeSpecific.className = NULL,
+        .number = ITMGetBufferResponse_FieldNumber_ChangedLinesArray,
+        .hasIndex = GPBNoHasBit,
+        .offset = (uint32_t)offsetof(ITMGetBufferResponse__storage_, changedLinesArray),
+        .flags = GPBFieldRepeated,
+        .dataType = GPBDataTypeInt64,
+      },
     };
     GPBDescriptor *localDescriptor =
         [GPBDescriptor allocDescriptorForClass:[ITMGetBufferResponse class]
@@ -9125,6 +9189,7 @@ BOOL ITMGetProfilePropertyResponse_Status_IsValidValue(int32_t value__) {
 @dynamic guidList;
 @dynamic hasKey, key;
 @dynamic hasJsonValue, jsonValue;
+@dynamic assignmentsArray, assignmentsArray_Count;
 
 typedef struct ITMSetProfilePropertyRequest__storage_ {
   uint32_t _has_storage_[2];
@@ -9132,6 +9197,7 @@ typedef struct ITMSetProfilePropertyRequest__storage_ {
   ITMSetProfilePropertyRequest_GuidList *guidList;
   NSString *key;
   NSString *jsonValue;
+  NSMutableArray *assignmentsArray;
 } ITMSetProfilePropertyRequest__storage_;
 
 // This method is threadsafe because it is initially called
@@ -9176,6 +9242,15 @@ typedef struct ITMSetProfilePropertyRequest__storage_ {
         .flags = GPBFieldOptional,
         .dataType = GPBDataTypeString,
       },
+      {
+        .name = "assignmentsArray",
+        .dataTypeSpecific.className = GPBStringifySymbol(ITMProfileProperty),
+        .number = ITMSetProfilePropertyRequest_FieldNumber_AssignmentsArray,
+        .hasIndex = GPBNoHasBit,
+        .offset = (uint32_t)offsetof(ITMSetProfilePropertyRequest__storage_, assignmentsArray),
+        .flags = GPBFieldRepeated,
+        .dataType = GPBDataTypeMessage,
+      },
     };
     GPBDescriptor *localDescriptor =
         [GPBDescriptor allocDescriptorForClass:[ITMSetProfilePropertyRequest class]
@@ -9684,12 +9759,14 @@ typedef struct ITMCoord__storage_ {
 @dynamic hasText, text;
 @dynamic codePointsPerCellArray, codePointsPerCellArray_Count;
 @dynamic hasContinuation, continuation;
+@dynamic styleRunsArray, styleRunsArray_Count;
 
 typedef struct ITMLineContents__storage_ {
   uint32_t _has_storage_[1];
   ITMLineContents_Continuation continuation;
   NSString *text;
   NSMutableArray *codePointsPerCellArray;
+  NSMutableArray *styleRunsArray;
 } ITMLineContents__storage_;
 
 // This method is threadsafe because it is initially called
@@ -9728,6 +9805,16 @@ typedef struct ITMLineContents__storage_ {
         .core.flags = (GPBFieldFlags)(GPBFieldOptional | GPBFieldHasDefaultValue | GPBFieldHasEnumDescriptor),
         .core.dataType = GPBDataTypeEnum,
       },
+      {
+        .defaultValue.valueMessage = nil,
+        .core.name = "styleRunsArray",
+        .core.dataTypeSpecific.className = GPBStringifySymbol(ITMCellStyleRun),
+        .core.number = ITMLineContents_FieldNumber_StyleRunsArray,
+        .core.hasIndex = GPBNoHasBit,
+        .core.offset = (uint32_t)offsetof(ITMLineContents__storage_, styleRunsArray),
+        .core.flags = GPBFieldRepeated,
+        .core.dataType = GPBDataTypeMessage,
+      },
     };
     GPBDescriptor *localDescriptor =
         [GPBDescriptor allocDescriptorForClass:[ITMLineContents class]
@@ -9835,6 +9922,122 @@ typedef struct ITMCodePointsPerCell__storage_ {
 
 @end
 
+#pragma mark - ITMCellStyleRun
+
+@implementation ITMCellStyleRun
+
+@dynamic hasForeground, foreground;
+@dynamic hasBackground, background;
+@dynamic hasFlags, flags;
+@dynamic hasRepeats, repeats;
+
+typedef struct ITMCellStyleRun__storage_ {
+  uint32_t _has_storage_[1];
+  uint32_t foreground;
+  uint32_t background;
+  uint32_t flags;
+  int32_t repeats;
+} ITMCellStyleRun__storage_;
+
+// This method is threadsafe because it is initially called
+// in +initialize for each subclass.
++ (GPBDescriptor *)descriptor {
+  static GPBDescriptor *descriptor = nil;
+  if (!descriptor) {
+    static GPBMessageFieldDescription fields[] = {
+      {
+        .name = "foreground",
+        .dataTypeSpecific.className = NULL,
+        .number = ITMCellStyleRun_FieldNumber_Foreground,
+        .hasIndex = 0,
+        .offset = (uint32_t)offsetof(ITMCellStyleRun__storage_, foreground),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeUInt32,
+      },
+      {
+        .name = "background",
+        .dataTypeSpecific.className = NULL,
+        .number = ITMCellStyleRun_FieldNumber_Background,
+        .hasIndex = 1,
+        .offset = (uint32_t)offsetof(ITMCellStyleRun__storage_, background),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeUInt32,
+      },
+      {
+        .name = "flags",
+        .dataTypeSpecific.className = NULL,
+        .number = ITMCellStyleRun_FieldNumber_Flags,
+        .hasIndex = 2,
+        .offset = (uint32_t)offsetof(ITMCellStyleRun__storage_, flags),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeUInt32,
+      },
+      {
+        .name = "repeats",
+        .dataTypeSpecific.className = NULL,
+        .number = ITMCellStyleRun_FieldNumber_Repeats,
+        .hasIndex = 3,
+        .offset = (uint32_t)offsetof(ITMCellStyleRun__storage_, repeats),
+        .flags = GPBFieldOptional,
+        .dataType = GPBDataTypeInt32,
+      },
+    };
+    GPBDescriptor *localDescriptor =
+        [GPBDescriptor allocDescriptorForClass:[ITMCellStyleRun class]
+                                     rootClass:[ITMApiRoot class]
+                                          file:ITMApiRoot_FileDescriptor()
+                                        fields:fields
+                                    fieldCount:(uint32_t)(sizeof(fields) / sizeof(GPBMessageFieldDescription))
+                                   storageSize:sizeof(ITMCellStyleRun__storage_)
+                                         flags:GPBDescriptorInitializationFlag_None];
+    NSAssert(descriptor == nil, @"Startup recursed!");
+    descriptor = localDescriptor;
+  }
+  return descriptor;
+}
+
+@end
+
+#pragma mark - Enum ITMCellStyleRun_Flag
+
+GPBEnumDescriptor *ITMCellStyleRun_Flag_EnumDescriptor(void) {
+  static GPBEnumDescriptor *descriptor = NULL;
+  if (!descriptor) {
+    static const char *valueNames =
+        "Bold\000Faint\000Italic\000Blink\000Underline\000";
+    static const int32_t values[] = {
+        ITMCellStyleRun_Flag_Bold,
+        ITMCellStyleRun_Flag_Faint,
+        ITMCellStyleRun_Flag_Italic,
+        ITMCellStyleRun_Flag_Blink,
+        ITMCellStyleRun_Flag_Underline,
+    };
+    GPBEnumDescriptor *worker =
+        [GPBEnumDescriptor allocDescriptorForName:GPBNSStringifySymbol(ITMCellStyleRun_Flag)
+                                       valueNames:valueNames
+                                           values:values
+                                            count:(uint32_t)(sizeof(values) / sizeof(int32_t))
+                                     enumVerifier:ITMCellStyleRun_Flag_IsValidValue];
+    if (!OSAtomicCompareAndSwapPtrBarrier(nil, worker, (void * volatile *)&descriptor)) {
+      [worker release];
+    }
+  }
+  return descriptor;
+}
+
+BOOL ITMCellStyleRun_Flag_IsValidValue(int32_t value__) {
+  switch (value__) {
+    case ITMCellStyleRun_Flag_Bold:
+    case ITMCellStyleRun_Flag_Faint:
+    case ITMCellStyleRun_Flag_Italic:
+    case ITMCellStyleRun_Flag_Blink:
+    case ITMCellStyleRun_Flag_Underline:
+      return YES;
+    default:
+      return NO;
+  }
+}
+
 #pragma mark - ITMListSessionsRequest
 
 @implementation ITMListSessionsRequest
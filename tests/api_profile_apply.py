@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# Copies a full profile to sessions with iterm2.async_apply_profile.
+#
+# The stand-in server accepts a session profile change only if every key
+# passes the same check as +[iTermProfilePreferences valueIsLegal:forKey:],
+# read from the Objective-C source, and rejects the whole request otherwise,
+# as PTYSession does. Keys such as fonts, key mappings, and the command must
+# be skipped, not sent.
+#
+# usage: python3 api_profile_apply.py
+import asyncio
+import glob
+import json
+import os
+import re
+
+import api_standin
+import iterm2
+import iterm2.api_pb2
+import iterm2.profilediff
+
+SOURCES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "sources")
+
+def legal_keys():
+    """Returns {key: type name} from valueIsLegal:forKey:."""
+    names = {}
+    for header in glob.glob(os.path.join(SOURCES, "*.h")):
+        with open(header, errors="ignore") as f:
+            for macro, key in re.findall(r'#define\s+(KEY_\w+)\s+@"([^"]*)"', f.read()):
+                names.setdefault(macro, key)
+    with open(os.path.join(SOURCES, "iTermProfilePreferences.m")) as f:
+        source = f.read()
+    body = source[source.index("+ (BOOL)valueIsLegal:"):]
+    body = body[:body.index("containsObject:key")]
+    result = {}
+    for kind, macros in re.findall(r"NSArray \*(\w+) = @\[(.*?)\];", body, re.S):
+        for macro in re.findall(r"KEY_\w+", macros):
+            result[names[macro]] = kind
+    return result
+
+LEGAL = legal_keys()
+
+def is_legal(key, value):
+    kind = LEGAL.get(key)
+    if kind == "string":
+        return isinstance(value, str)
+    if kind == "color" or kind == "dict":
+        return isinstance(value, dict)
+    if kind == "number":
+        return isinstance(value, (int, float))
+    return False
+
+SOURCE_PROFILE = {
+    "Guid": "source-guid",
+    "Name": "Look",
+    "Background Color": iterm2.Color(0, 0, 40).get_dict(),
+    "Transparency": 0.25,
+    "Cursor Type": 2,
+    "Badge Text": "\\(session.name)",
+    "Normal Font": "Menlo-Regular 12",
+    "Keyboard Map": {"0xf700-0x260000": {"Action": 10, "Text": "[1;6A"}},
+    "Command": "/bin/zsh",
+    "Custom Command": "Yes",
+    "Tags": ["look"],
+    "Triggers": [],
+}
+
+sessions = {
+    "s{}".format(i): {"Transparency": 0.0, "Normal Font": "Monaco 10", "Command": ""}
+    for i in range(4)
+}
+rejected = []
+
+async def handler(request, response):
+    if request.HasField("get_profile_property_request"):
+        r = request.get_profile_property_request
+        for key in r.keys:
+            if key in sessions[r.session]:
+                response.get_profile_property_response.properties.add(
+                    key=key, json_value=json.dumps(sessions[r.session][key]))
+        return True
+    if request.HasField("set_profile_property_request"):
+        r = request.set_profile_property_request
+        values = {a.key: json.loads(a.json_value) for a in r.assignments}
+        if not values:
+            values = {r.key: json.loads(r.json_value)}
+        bad = [key for key, value in values.items() if not is_legal(key, value)]
+        if bad:
+            rejected.extend(bad)
+            response.set_profile_property_response.status = (
+                iterm2.api_pb2.SetProfilePropertyResponse.Status.Value("REQUEST_MALFORMED"))
+            return True
+        sessions[r.session].update(values)
+        return True
+    return False
+
+async def main():
+    assert iterm2.profilediff._SESSION_KEYS == frozenset(LEGAL), (
+        "profilediff._SESSION_KEYS differs from valueIsLegal:forKey: by {}".format(
+            sorted(iterm2.profilediff._SESSION_KEYS ^ frozenset(LEGAL))))
+
+    server = api_standin.StandInITerm2(handler)
+    await server.start()
+    connection = await iterm2.Connection.async_create()
+    source = iterm2.Profile(None, connection, [
+        iterm2.api_pb2.ProfileProperty(key=key, json_value=json.dumps(value))
+        for key, value in SOURCE_PROFILE.items()])
+    targets = [api_standin.session(connection, session_id) for session_id in sorted(sessions)]
+
+    results = await iterm2.async_apply_profile(connection, source, targets)
+    for result in results.values():
+        print(result, "skipped", result.skipped_keys)
+        assert result.succeeded, result
+        assert sorted(result.changed_keys) == ["Background Color", "Badge Text", "Cursor Type", "Transparency"]
+        assert result.skipped_keys == ["Command", "Custom Command", "Keyboard Map", "Normal Font", "Tags", "Triggers"]
+    assert not rejected, rejected
+    for values in sessions.values():
+        assert values["Transparency"] == 0.25
+        assert values["Normal Font"] == "Monaco 10"
+
+    # A key the caller sets explicitly is still sent, and the server's
+    # rejection is reported for that session.
+    font = iterm2.LocalWriteOnlyProfile()
+    font.set_transparency(0.5)
+    font._simple_set("Normal Font", "Menlo-Regular 14")
+    results = await iterm2.async_apply_profile(connection, font, targets[:1])
+    result = results[targets[0].session_id]
+    print(result)
+    assert not result.succeeded
+    assert sessions[targets[0].session_id]["Transparency"] == 0.25
+    print("OK")
+
+asyncio.get_event_loop().run_until_complete(main())
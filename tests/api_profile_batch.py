@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# Sets several profile properties at once with WriteOnlyProfile.batch.
+#
+# The stand-in server pretends to be an iTerm2 build from before batched
+# profile changes. It ignores the assignments field and rejects the empty
+# key as malformed, as apiServerSetProfileProperty: used to. The library
+# must then set the properties one at a time.
+#
+# usage: python3 api_profile_batch.py
+import asyncio
+import json
+
+import api_standin
+import iterm2
+import iterm2.api_pb2
+import iterm2.profile
+
+values = {}
+batches = []
+
+async def handler(request, response):
+    if request.HasField("set_profile_property_request"):
+        r = request.set_profile_property_request
+        if r.assignments:
+            batches.append(len(r.assignments))
+        if not r.key:
+            response.set_profile_property_response.status = (
+                iterm2.api_pb2.SetProfilePropertyResponse.Status.Value("REQUEST_MALFORMED"))
+            return True
+        values[r.key] = json.loads(r.json_value)
+        return True
+    return False
+
+async def main():
+    server = api_standin.StandInITerm2(handler)
+    await server.start()
+    connection = await iterm2.Connection.async_create()
+    profile = iterm2.profile.WriteOnlyProfile("s1", connection)
+
+    async with profile.batch() as changes:
+        changes.set_transparency(0.25)
+        changes.set_badge_text("night")
+        changes.set_background_color(iterm2.Color(0, 0, 40))
+    print(values)
+    assert batches == [3], batches
+    assert values["Transparency"] == 0.25
+    assert values["Badge Text"] == "night"
+    assert values["Background Color"] == iterm2.Color(0, 0, 40).get_dict()
+
+    # Unset values are sent as JSON null.
+    async with profile.batch() as changes:
+        changes.set_background_image_location(None)
+    assert values["Background Image Location"] is None
+
+    print("OK")
+
+asyncio.get_event_loop().run_until_complete(main())
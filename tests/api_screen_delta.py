@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# Streams a changing screen with ScreenStreamer, which asks for only the
+# lines that changed since its last fetch.
+#
+# The stand-in server keeps a screen that is written to, scrolls, and is
+# resized at random. Like iTerm2, it remembers the generation at which each
+# line last changed. A request with since_generation gets only the newer
+# lines, unless everything changed since then (as on resize), in which case
+# it gets the whole screen. Every screen the streamer returns must match the
+# stand-in's.
+#
+# usage: python3 api_screen_delta.py
+import asyncio
+import random
+
+import api_standin
+import iterm2
+import iterm2.api_pb2
+
+class Screen:
+    def __init__(self, height):
+        self.height = height
+        self.top = 0
+        self.lines = {y: "" for y in range(height)}
+        self.generation = 1
+        # Generation of the last change to every line, such as a resize.
+        self.all_changed = 1
+        # Absolute line number -> generation of its last change.
+        self.line_generations = {}
+        # When set, the next delta leaves out this line although it changed.
+        self.drop_from_next_delta = None
+
+    def changed(self, ys):
+        self.generation += 1
+        for y in ys:
+            self.line_generations[y] = self.generation
+
+    def write(self, y, text):
+        self.lines[self.top + y] = text
+        self.changed([self.top + y])
+
+    def scroll(self, text):
+        self.top += 1
+        self.lines[self.top + self.height - 1] = text
+        self.changed([self.top + self.height - 1])
+
+    def resize(self, height):
+        self.height = height
+        for y in range(self.top, self.top + height):
+            self.lines.setdefault(y, "")
+        self.changed([])
+        self.all_changed = self.generation
+        self.line_generations = {}
+
+    def visible(self):
+        return [self.lines[y] for y in range(self.top, self.top + self.height)]
+
+screen = Screen(5)
+# Lines sent, and lines that whole screens would have taken.
+stats = {"full": 0, "delta": 0, "lines": 0, "lines_if_full": 0}
+
+async def handler(request, response):
+    if not request.HasField("get_buffer_request"):
+        return False
+    since = request.get_buffer_request
+    r = response.get_buffer_response
+    coord_range = r.windowed_coord_range.coord_range
+    coord_range.start.y = screen.top
+    coord_range.end.y = screen.top + screen.height
+    if since.HasField("since_generation") and screen.all_changed <= since.since_generation:
+        r.delta = True
+        for y in range(screen.top, screen.top + screen.height):
+            if screen.line_generations.get(y, 0) > since.since_generation and y != screen.drop_from_next_delta:
+                r.contents.add().text = screen.lines[y]
+                r.changed_lines.append(y)
+        screen.drop_from_next_delta = None
+        stats["delta"] += 1
+        stats["lines"] += len(r.changed_lines)
+    else:
+        for text in screen.visible():
+            r.contents.add().text = text
+        stats["full"] += 1
+        stats["lines"] += screen.height
+    stats["lines_if_full"] += screen.height
+    r.generation = screen.generation
+    return True
+
+async def notify(server):
+    notification = iterm2.api_pb2.Notification()
+    notification.screen_update_notification.session = "s1"
+    notification.screen_update_notification.generation = screen.generation
+    await server.push(notification)
+
+async def async_next(server, streamer):
+    future = asyncio.ensure_future(streamer.async_get())
+    await asyncio.sleep(0)
+    await notify(server)
+    contents = await future
+    return [contents.line(i).string for i in range(contents.number_of_lines)]
+
+async def main():
+    server = api_standin.StandInITerm2(handler)
+    await server.start()
+    connection = await iterm2.Connection.async_create()
+    rnd = random.Random(1)
+    updates = 300
+    async with api_standin.session(connection, "s1").get_screen_streamer() as streamer:
+        for i in range(updates):
+            choice = rnd.random()
+            if choice < 0.6:
+                screen.write(rnd.randrange(screen.height), "write {}".format(i))
+            elif choice < 0.9:
+                screen.scroll("scroll {}".format(i))
+            else:
+                screen.resize(rnd.randrange(3, 8))
+            lines = await async_next(server, streamer)
+            assert lines == screen.visible(), (i, lines, screen.visible())
+
+        # A delta missing a line the streamer doesn't have makes it fetch the whole screen.
+        full = stats["full"]
+        screen.scroll("left out of the delta")
+        screen.drop_from_next_delta = screen.top + screen.height - 1
+        assert await async_next(server, streamer) == screen.visible()
+        assert stats["full"] == full + 1, stats
+
+        # A notification for contents already fetched doesn't wake the streamer.
+        future = asyncio.ensure_future(streamer.async_get())
+        await asyncio.sleep(0)
+        await notify(server)
+        await asyncio.sleep(0.1)
+        assert not future.done()
+        future.cancel()
+
+    print(stats)
+    assert stats["lines"] < stats["lines_if_full"] / 2, stats
+    print("OK")
+
+asyncio.get_event_loop().run_until_complete(main())
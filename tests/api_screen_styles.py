@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# Fetches screen contents with and without cell styles.
+#
+# The stand-in server holds a screen of random colors and attributes. When
+# a GetBuffer request sets include_styles, each line carries runs of cells
+# with the same style, as iTerm2 sends them. The per-cell styles the library
+# expands from the runs must match the screen, and lines must carry no
+# styles unless asked for.
+#
+# usage: python3 api_screen_styles.py
+import asyncio
+import random
+import time
+
+import api_standin
+import iterm2
+import iterm2.api_pb2
+
+WIDTH = 120
+HEIGHT = 50
+CS = iterm2.CellStyles
+
+def random_color(rnd):
+    return rnd.choice([
+        (CS.COLOR_MODE_PALETTE << 24) | rnd.randrange(256),
+        (CS.COLOR_MODE_24BIT << 24) | rnd.randrange(1 << 24),
+        (CS.COLOR_MODE_ALTERNATE << 24) | CS.ALTERNATE_DEFAULT])
+
+def random_grid(rnd):
+    grid = []
+    for _y in range(HEIGHT):
+        cells = []
+        foreground = (CS.COLOR_MODE_PALETTE << 24) | 7
+        background = CS.ALTERNATE_DEFAULT
+        flags = 0
+        for _x in range(WIDTH):
+            if rnd.random() < 0.05:
+                foreground = random_color(rnd)
+            if rnd.random() < 0.03:
+                background = random_color(rnd)
+            if rnd.random() < 0.04:
+                flags = rnd.randrange(32)
+            cells.append((foreground, background, flags))
+        grid.append(cells)
+    return grid
+
+grid = random_grid(random.Random(1))
+requests = []
+
+async def handler(request, response):
+    if not request.HasField("get_buffer_request"):
+        return False
+    get_buffer = request.get_buffer_request
+    requests.append(get_buffer)
+    windowed_range = get_buffer.line_range.windowed_coord_range
+    r = response.get_buffer_response
+    r.windowed_coord_range.CopyFrom(windowed_range)
+    for y in range(windowed_range.coord_range.start.y, windowed_range.coord_range.end.y):
+        line = r.contents.add()
+        line.text = "x" * WIDTH
+        line.code_points_per_cell.add(num_code_points=1, repeats=WIDTH)
+        if not get_buffer.include_styles:
+            continue
+        run = None
+        for style in grid[y]:
+            if run is not None and (run.foreground, run.background, run.flags) == style:
+                run.repeats += 1
+                continue
+            run = line.style_runs.add()
+            run.foreground, run.background, run.flags = style
+            run.repeats = 1
+    return True
+
+async def main():
+    server = api_standin.StandInITerm2(handler)
+    await server.start()
+    connection = await iterm2.Connection.async_create()
+    session = api_standin.session(connection, "s1")
+    screen = iterm2.WindowedCoordRange(iterm2.CoordRange(iterm2.Point(0, 0), iterm2.Point(0, HEIGHT)))
+
+    plain = await session.async_get_screen_contents(screen)
+    assert not requests[-1].include_styles
+    assert plain.line(0).styles is None
+
+    styled = await session.async_get_screen_contents(screen, include_styles=True)
+    assert requests[-1].include_styles
+    number_of_runs = 0
+    for y in range(HEIGHT):
+        styles = styled.line(y).styles
+        assert len(styles) == WIDTH
+        assert list(zip(styles.foreground, styles.background, styles.flags)) == grid[y], y
+        cell = 0
+        for first, count, foreground, background, flags in styles.runs:
+            assert first == cell
+            assert grid[y][first:first + count] == [(foreground, background, flags)] * count
+            cell += count
+        assert cell == WIDTH
+        number_of_runs += len(styles.runs)
+    print("{} runs for {} cells".format(number_of_runs, WIDTH * HEIGHT))
+
+    assert CS.color_mode((CS.COLOR_MODE_24BIT << 24) | 0x102030) == CS.COLOR_MODE_24BIT
+    assert CS.color_value((CS.COLOR_MODE_24BIT << 24) | 0x102030) == (0x10, 0x20, 0x30)
+    assert CS.color_value((CS.COLOR_MODE_PALETTE << 24) | 9) == 9
+    assert CS.color_mode(CS.ALTERNATE_DEFAULT) == CS.COLOR_MODE_ALTERNATE
+
+    # An empty line has empty styles, not None, when they were asked for.
+    empty = iterm2.api_pb2.GetBufferResponse()
+    empty.contents.add()
+    assert len(iterm2.ScreenContents(empty).line(0).styles) == 0
+
+    start = time.perf_counter()
+    for _ in range(20):
+        contents = iterm2.ScreenContents(styled._ScreenContents__proto)
+        for y in range(HEIGHT):
+            contents.line(y).styles
+    print("expanding styles: {:.3f} ms per screen".format((time.perf_counter() - start) / 20 * 1000))
+    print("OK")
+
+asyncio.get_event_loop().run_until_complete(main())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# Checks how iterm2.Selection merges overlapping subselections into ranges.
+#
+# Random selections are enumerated with Selection.async_enumerate_ranges and
+# compared with a reference that marks every selected cell in a set and
+# groups consecutive cells, as the library used to. The rows to fetch for
+# the ranges, from _row_spans, are checked against the same cells. Then a
+# large selection is timed both ways.
+#
+# usage: python3 api_selection_ranges.py
+import asyncio
+import itertools
+import random
+import time
+
+import api_standin  # Puts the library on sys.path.
+import iterm2
+import iterm2.selection
+from iterm2.util import CoordRange, Point, Range, WindowedCoordRange
+
+def reference_ranges(sub_selections, width):
+    """Returns [(start x, start y, end x, end y, eol)] by marking each cell."""
+    connectors = set()
+    cells = set()
+    for outer in sub_selections:
+        if outer.connected:
+            end = outer.windowedCoordRange.coordRange.end
+            connectors.add(end.x + end.y * width)
+
+        def handle_range(outer_range):
+            cell_range = Range(outer_range.start.x + outer_range.start.y * width, outer_range.length(width))
+            cells.update(cell_range.toSet)
+            if (outer.windowedCoordRange.hasWindow and
+                    outer_range.end == outer.windowedCoordRange.coordRange.end and
+                    cell_range.length > 0):
+                connectors.add(cell_range.max)
+
+        outer.enumerateRanges(handle_range)
+
+    runs = []
+    for _key, group in itertools.groupby(enumerate(sorted(cells)), lambda pair: pair[1] - pair[0]):
+        values = [cell for _i, cell in group]
+        runs.append((values[0], values[-1]))
+    return [(first % width, first // width, last % width, last // width,
+             last not in connectors and i + 1 < len(runs))
+            for i, (first, last) in enumerate(runs)]
+
+async def library_ranges(sub_selections, width):
+    result = []
+    async def collect(windowed_range, eol):
+        r = windowed_range.coordRange
+        result.append((r.start.x, r.start.y, r.end.x, r.end.y, eol))
+    await iterm2.Selection(sub_selections).async_enumerate_ranges(None, None, width, collect)
+    return result
+
+def sub_selection(start_x, start_y, end_x, end_y, connected):
+    coord_range = CoordRange(Point(start_x, start_y), Point(end_x, end_y))
+    return iterm2.SubSelection(WindowedCoordRange(coord_range), iterm2.SelectionMode.CHARACTER, connected)
+
+def random_sub_selection(rnd, width):
+    start = (rnd.randrange(width), rnd.randrange(8))
+    end = (rnd.randrange(width), rnd.randrange(8))
+    start, end = sorted([start, end], key=lambda p: (p[1], p[0]))
+    return sub_selection(start[0], start[1], end[0], end[1], rnd.random() < 0.4)
+
+def check_row_spans(ranges, chunk_lines):
+    spans = iterm2.selection._row_spans(
+        [(CoordRange(Point(sx, sy), Point(ex, ey)), eol) for sx, sy, ex, ey, eol in ranges],
+        chunk_lines)
+    rows = set()
+    for sx, sy, ex, ey, eol in ranges:
+        rows.update(range(sy, ey + 1))
+    fetched = []
+    for first, limit in spans:
+        assert first < limit <= first + chunk_lines, spans
+        fetched.extend(range(first, limit))
+    assert fetched == sorted(rows), (ranges, spans)
+
+async def main():
+    rnd = random.Random(3)
+    for _ in range(3000):
+        width = rnd.randint(1, 12)
+        sub_selections = [random_sub_selection(rnd, width) for _ in range(rnd.randint(1, 6))]
+        expected = reference_ranges(sub_selections, width)
+        actual = await library_ranges(sub_selections, width)
+        assert actual == expected, (width, expected, actual)
+        check_row_spans(actual, rnd.randint(1, 4))
+
+    assert iterm2.selection._merge_intervals([]) == []
+    assert iterm2.selection._merge_intervals([(5, 9), (0, 2), (2, 4), (6, 7)]) == [(0, 4), (5, 9)]
+
+    # Three overlapping selections over a million cells.
+    width = 200
+    sub_selections = [
+        sub_selection(0, 0, 0, 5000, False),
+        sub_selection(10, 100, 5, 4000, True),
+        sub_selection(0, 4500, 199, 4999, False)]
+    start = time.perf_counter()
+    expected = reference_ranges(sub_selections, width)
+    reference_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    actual = await library_ranges(sub_selections, width)
+    library_seconds = time.perf_counter() - start
+    assert actual == expected, (expected, actual)
+    print("per cell: {:.3f}s, intervals: {:.6f}s".format(reference_seconds, library_seconds))
+    assert library_seconds < reference_seconds
+    print("OK")
+
+asyncio.get_event_loop().run_until_complete(main())
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# A stand-in for iTerm2's websocket API server, used by the api_*.py scripts
+# in this folder to exercise the Python library without the app.
+#
+# It listens where iterm2.Connection.async_create connects. Each request is
+# passed to a handler, which fills in the response and returns True. Requests
+# the handler doesn't take get an error, so a script notices when the library
+# sends something unexpected.
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "api", "library", "python", "iterm2"))
+
+import websockets
+import iterm2.api_pb2
+
+class StandInITerm2:
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+        self.sockets = []
+        self.server = None
+
+    async def start(self):
+        self.server = await websockets.serve(self._serve, "localhost", 1912)
+
+    async def push(self, notification):
+        """Sends a notification to every connected client."""
+        message = iterm2.api_pb2.ServerOriginatedMessage()
+        message.notification.CopyFrom(notification)
+        for socket in self.sockets:
+            await socket.send(message.SerializeToString())
+
+    async def _serve(self, socket, path):
+        self.sockets.append(socket)
+        async for data in socket:
+            request = iterm2.api_pb2.ClientOriginatedMessage()
+            request.ParseFromString(data)
+            self.requests.append(request)
+            response = iterm2.api_pb2.ServerOriginatedMessage()
+            response.id = request.id
+            if not await self.handler(request, response):
+                if request.HasField("notification_request"):
+                    response.notification_response.status = iterm2.api_pb2.NotificationResponse.Status.Value("OK")
+                else:
+                    response.error = "Not handled by the stand-in"
+            await socket.send(response.SerializeToString())
+
+def session(connection, session_id):
+    """Makes an iterm2.Session for a session the stand-in pretends exists."""
+    return iterm2.Session(connection, None, iterm2.api_pb2.SessionSummary(unique_identifier=session_id))